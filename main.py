@@ -1,3 +1,5 @@
+import sys
+
 import dspy
 from dspy.utils.callback import BaseCallback
 from dspy_skills import SkillsReActAgent, SkillsConfig
@@ -50,9 +52,26 @@ while True:
                 print(f"Active skill: {agent.active_skill}")
             continue
 
-        result = agent(request=user_input)
-        print("=" * 60)
-        print(f"\n{result.response}")
+        # Stream the response as it is generated
+        streamed = False
+        result = None
+        for chunk in agent.stream(request=user_input):
+            if isinstance(chunk, dspy.Prediction):
+                result = chunk
+                continue
+            if not streamed:
+                print("=" * 60)
+                print()
+                streamed = True
+            sys.stdout.write(chunk)
+            sys.stdout.flush()
+
+        if not streamed:
+            # Cached or non-streaming LM responses arrive in one piece
+            print("=" * 60)
+            print(f"\n{result.response}")
+        else:
+            print()
         print("=" * 60)
         # print(result)
 
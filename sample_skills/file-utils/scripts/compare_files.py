@@ -4,16 +4,58 @@
 import argparse
 import difflib
 import hashlib
+import mmap
+import os
 import sys
 from pathlib import Path
 
+# Files at least this large are mapped into memory instead of read in chunks
+MMAP_THRESHOLD = 10 * 1024 * 1024
+MMAP_COMPARE_CHUNK = 1024 * 1024
+
+# Diff output is buffered up to this many characters per write
+OUTPUT_BATCH_SIZE = 64 * 1024
+
+
+def advise_sequential(f) -> None:
+    """Hint the kernel that a file will be read once, front to back."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+
+
+def advise_done(f) -> None:
+    """Let the kernel drop cached pages of a file that won't be read again."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+
 
 def files_identical(file1: Path, file2: Path) -> bool:
     """Check if two files are byte-for-byte identical."""
-    if file1.stat().st_size != file2.stat().st_size:
+    size = file1.stat().st_size
+    if size != file2.stat().st_size:
         return False
 
     with open(file1, "rb") as f1, open(file2, "rb") as f2:
+        advise_sequential(f1)
+        advise_sequential(f2)
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f1.fileno(), 0, access=mmap.ACCESS_READ) as mm1, \
+                    mmap.mmap(f2.fileno(), 0, access=mmap.ACCESS_READ) as mm2:
+                for offset in range(0, size, MMAP_COMPARE_CHUNK):
+                    end = offset + MMAP_COMPARE_CHUNK
+                    if mm1[offset:end] != mm2[offset:end]:
+                        return False
+                return True
+
         while True:
             chunk1 = f1.read(8192)
             chunk2 = f2.read(8192)
@@ -23,69 +65,344 @@ def files_identical(file1: Path, file2: Path) -> bool:
                 return True
 
 
-def compare_binary(file1: Path, file2: Path) -> dict:
-    """Compare two binary files."""
-    size1 = file1.stat().st_size
-    size2 = file2.stat().st_size
+def get_hash(path: Path, algorithm: str = "sha256") -> str:
+    """Calculate a file checksum."""
+    h = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        advise_sequential(f)
+        if path.stat().st_size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+            advise_done(f)
+            return h.hexdigest()
+        for chunk in iter(lambda: f.read(8192), b""):
+            h.update(chunk)
+    return h.hexdigest()
 
-    # Calculate checksums
-    def get_hash(path):
-        h = hashlib.md5()
-        with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                h.update(chunk)
-        return h.hexdigest()
 
-    hash1 = get_hash(file1)
-    hash2 = get_hash(file2)
+def compare_binary(
+    file1: Path,
+    file2: Path,
+    algorithm: str = "sha256",
+    show_hash: bool = False
+) -> dict:
+    """Compare two binary files.
 
-    identical = hash1 == hash2
+    Equality is decided by a direct byte comparison that stops at the first
+    mismatch; checksums are only calculated when show_hash is set.
+    """
+    size1 = file1.stat().st_size
+    size2 = file2.stat().st_size
 
-    return {
+    identical = size1 == size2 and files_identical(file1, file2)
+
+    result = {
         "identical": identical,
+        "algorithm": algorithm if show_hash else None,
         "file1": {
             "path": str(file1),
-            "size": size1,
-            "md5": hash1
+            "size": size1
         },
         "file2": {
             "path": str(file2),
-            "size": size2,
-            "md5": hash2
+            "size": size2
         },
         "size_diff": size2 - size1
     }
 
+    if show_hash:
+        result["file1"][algorithm] = get_hash(file1, algorithm)
+        result["file2"][algorithm] = get_hash(file2, algorithm)
+
+    return result
+
+
+def _middle_snake(a, a_lo, a_hi, b, b_lo, b_hi) -> tuple[int, int, int, int]:
+    """Find the middle snake of a shortest edit script between two ranges.
+
+    Returns:
+        Tuple of (x_start, y_start, x_end, y_end) relative to a_lo/b_lo
+    """
+    n = a_hi - a_lo
+    m = b_hi - b_lo
+    delta = n - m
+    odd = delta & 1
+    max_d = (n + m + 1) // 2
+    offset = max_d + 1
+    vf = [0] * (2 * max_d + 3)
+    vb = [0] * (2 * max_d + 3)
+
+    for d in range(max_d + 1):
+        # Forward search from the top-left corner
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and vf[offset + k - 1] < vf[offset + k + 1]):
+                x = vf[offset + k + 1]
+            else:
+                x = vf[offset + k - 1] + 1
+            y = x - k
+            x0, y0 = x, y
+            while x < n and y < m and a[a_lo + x] == b[b_lo + y]:
+                x += 1
+                y += 1
+            vf[offset + k] = x
+            kr = delta - k
+            if odd and -d < kr < d and x + vb[offset + kr] >= n:
+                return x0, y0, x, y
+
+        # Backward search from the bottom-right corner
+        for kr in range(-d, d + 1, 2):
+            if kr == -d or (kr != d and vb[offset + kr - 1] < vb[offset + kr + 1]):
+                x = vb[offset + kr + 1]
+            else:
+                x = vb[offset + kr - 1] + 1
+            y = x - kr
+            x0, y0 = x, y
+            while x < n and y < m and a[a_hi - 1 - x] == b[b_hi - 1 - y]:
+                x += 1
+                y += 1
+            vb[offset + kr] = x
+            k = delta - kr
+            if not odd and -d <= k <= d and x + vf[offset + k] >= n:
+                return n - x, m - y, n - x0, m - y0
+
+    return 0, 0, 0, 0
+
+
+def myers_matching_blocks(a: list, b: list) -> list[tuple[int, int, int]]:
+    """Find matching blocks between two sequences with Myers' O(ND) diff.
+
+    Uses the linear-space divide-and-conquer variant, so memory stays
+    proportional to the input size even for large edit distances.
+
+    Returns:
+        Sorted (i, j, size) blocks with a[i:i+size] == b[j:j+size]
+    """
+    blocks = []
+    stack = [(0, len(a), 0, len(b))]
+
+    while stack:
+        a_lo, a_hi, b_lo, b_hi = stack.pop()
+
+        # Common prefix and suffix need no search
+        start = a_lo
+        while a_lo < a_hi and b_lo < b_hi and a[a_lo] == b[b_lo]:
+            a_lo += 1
+            b_lo += 1
+        if a_lo > start:
+            blocks.append((start, b_lo - (a_lo - start), a_lo - start))
+
+        end = a_hi
+        while a_lo < a_hi and b_lo < b_hi and a[a_hi - 1] == b[b_hi - 1]:
+            a_hi -= 1
+            b_hi -= 1
+        if a_hi < end:
+            blocks.append((a_hi, b_hi, end - a_hi))
+
+        if a_lo == a_hi or b_lo == b_hi:
+            continue
+
+        x0, y0, x1, y1 = _middle_snake(a, a_lo, a_hi, b, b_lo, b_hi)
+        if x1 > x0:
+            blocks.append((a_lo + x0, b_lo + y0, x1 - x0))
+        stack.append((a_lo + x1, a_hi, b_lo + y1, b_hi))
+        stack.append((a_lo, a_lo + x0, b_lo, b_lo + y0))
+
+    # Merge adjacent blocks so equal runs become a single opcode
+    blocks.sort()
+    merged = []
+    for i, j, size in blocks:
+        if merged and merged[-1][0] + merged[-1][2] == i and merged[-1][1] + merged[-1][2] == j:
+            merged[-1] = (merged[-1][0], merged[-1][1], merged[-1][2] + size)
+        else:
+            merged.append((i, j, size))
+    return merged
+
+
+def get_opcodes(lines1: list[str], lines2: list[str]) -> list[tuple]:
+    """Describe how to turn lines1 into lines2, like SequenceMatcher.get_opcodes.
+
+    Lines are mapped to integer ids first so the diff compares ints rather
+    than strings.
+    """
+    ids = {}
+    a = [ids.setdefault(line, len(ids)) for line in lines1]
+    b = [ids.setdefault(line, len(ids)) for line in lines2]
+
+    opcodes = []
+    i = j = 0
+    for ai, bj, size in myers_matching_blocks(a, b) + [(len(a), len(b), 0)]:
+        if i < ai and j < bj:
+            opcodes.append(("replace", i, ai, j, bj))
+        elif i < ai:
+            opcodes.append(("delete", i, ai, j, bj))
+        elif j < bj:
+            opcodes.append(("insert", i, ai, j, bj))
+        i, j = ai + size, bj + size
+        if size:
+            opcodes.append(("equal", ai, i, bj, j))
+    return opcodes
+
+
+def group_opcodes(opcodes: list[tuple], n: int = 3):
+    """Split opcodes into hunks with up to n lines of context.
+
+    Mirrors SequenceMatcher.get_grouped_opcodes.
+    """
+    codes = list(opcodes) or [("equal", 0, 1, 0, 1)]
+    if codes[0][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+    if codes[-1][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+
+    group = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == "equal" and i2 - i1 > n + n:
+            group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        yield group
+
+
+def _unified_range(start: int, stop: int) -> str:
+    """Format a line range for a unified diff hunk header."""
+    length = stop - start
+    if length == 1:
+        return f"{start + 1}"
+    return f"{start + 1 if length else start},{length}"
+
+
+def _context_range(start: int, stop: int) -> str:
+    """Format a line range for a context diff hunk header."""
+    length = stop - start
+    beginning = start + 1 if length else start
+    if length <= 1:
+        return f"{beginning}"
+    return f"{beginning},{beginning + length - 1}"
+
+
+def _as_text(lines: list) -> list[str]:
+    """Return lines as str, decoding them if they are bytes."""
+    if lines and isinstance(lines[0], bytes):
+        return decode_lines(lines)
+    return lines
+
+
+def unified_diff(lines1, lines2, fromfile: str, tofile: str, n: int = 3):
+    """Generate a unified diff in difflib's format from a Myers diff.
+
+    Lines may be str or bytes; byte lines are decoded only when emitted.
+    """
+    started = False
+    for group in group_opcodes(get_opcodes(lines1, lines2), n):
+        if not started:
+            started = True
+            yield f"--- {fromfile}\n"
+            yield f"+++ {tofile}\n"
+
+        first, last = group[0], group[-1]
+        yield (
+            f"@@ -{_unified_range(first[1], last[2])} "
+            f"+{_unified_range(first[3], last[4])} @@\n"
+        )
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                for line in _as_text(lines1[i1:i2]):
+                    yield " " + line
+                continue
+            if tag in ("replace", "delete"):
+                for line in _as_text(lines1[i1:i2]):
+                    yield "-" + line
+            if tag in ("replace", "insert"):
+                for line in _as_text(lines2[j1:j2]):
+                    yield "+" + line
+
+
+def context_diff(lines1, lines2, fromfile: str, tofile: str, n: int = 3):
+    """Generate a context diff in difflib's format from a Myers diff.
+
+    Lines may be str or bytes; byte lines are decoded only when emitted.
+    """
+    prefix = {"insert": "+ ", "delete": "- ", "replace": "! ", "equal": "  "}
+    started = False
+    for group in group_opcodes(get_opcodes(lines1, lines2), n):
+        if not started:
+            started = True
+            yield f"*** {fromfile}\n"
+            yield f"--- {tofile}\n"
+
+        first, last = group[0], group[-1]
+        yield "***************\n"
+
+        yield f"*** {_context_range(first[1], last[2])} ****\n"
+        if any(tag in ("replace", "delete") for tag, _, _, _, _ in group):
+            for tag, i1, i2, _, _ in group:
+                if tag != "insert":
+                    for line in _as_text(lines1[i1:i2]):
+                        yield prefix[tag] + line
+
+        yield f"--- {_context_range(first[3], last[4])} ----\n"
+        if any(tag in ("replace", "insert") for tag, _, _, _, _ in group):
+            for tag, _, _, j1, j2 in group:
+                if tag != "delete":
+                    for line in _as_text(lines2[j1:j2]):
+                        yield prefix[tag] + line
+
+
+def read_lines(path: Path) -> list[bytes]:
+    """Read a file as a list of byte lines with universal newlines.
+
+    The file is read with a single call and split in C; lines are left
+    undecoded so that only the ones shown in a diff ever become str.
+    """
+    with open(path, "rb") as f:
+        advise_sequential(f)
+        data = f.read()
+    if b"\r" in data:
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return data.splitlines(keepends=True)
+
+
+def decode_lines(lines: list[bytes]) -> list[str]:
+    """Decode byte lines as UTF-8, replacing invalid sequences."""
+    return [line.decode("utf-8", errors="replace") for line in lines]
+
 
 def compare_text(
     file1: Path,
     file2: Path,
     context: int = 3,
-    unified: bool = False
+    unified: bool = False,
+    compat: bool = False
 ) -> dict:
-    """Compare two text files."""
+    """Compare two text files.
+
+    Diffs are computed with Myers' algorithm unless compat is set, in which
+    case difflib's Ratcliff-Obershelp matcher is used instead.
+    """
     try:
-        with open(file1, "r", encoding="utf-8", errors="replace") as f:
-            lines1 = f.readlines()
-        with open(file2, "r", encoding="utf-8", errors="replace") as f:
-            lines2 = f.readlines()
+        lines1 = read_lines(file1)
+        lines2 = read_lines(file2)
     except Exception as e:
         return {"success": False, "error": str(e)}
 
-    if unified:
-        diff = list(difflib.unified_diff(
-            lines1, lines2,
-            fromfile=str(file1),
-            tofile=str(file2),
-            n=context
-        ))
+    if compat:
+        diff_func = difflib.unified_diff if unified else difflib.context_diff
+        diff_lines1, diff_lines2 = decode_lines(lines1), decode_lines(lines2)
     else:
-        diff = list(difflib.context_diff(
-            lines1, lines2,
-            fromfile=str(file1),
-            tofile=str(file2),
-            n=context
-        ))
+        diff_func = unified_diff if unified else context_diff
+        diff_lines1, diff_lines2 = lines1, lines2
+
+    diff = list(diff_func(
+        diff_lines1, diff_lines2,
+        fromfile=str(file1),
+        tofile=str(file2),
+        n=context
+    ))
 
     # Count changes
     added = sum(1 for line in diff if line.startswith("+") and not line.startswith("+++"))
@@ -117,6 +434,7 @@ def main():
 Examples:
   %(prog)s old.txt new.txt
   %(prog)s file1.bin file2.bin --binary
+  %(prog)s file1.bin file2.bin --binary --show-hash
   %(prog)s config1.yaml config2.yaml --unified
   %(prog)s before.py after.py --context 5
         """
@@ -128,6 +446,17 @@ Examples:
         action="store_true",
         help="Compare as binary files"
     )
+    parser.add_argument(
+        "-a", "--algorithm",
+        choices=["sha256", "md5"],
+        default="sha256",
+        help="Checksum algorithm for --show-hash (default: sha256)"
+    )
+    parser.add_argument(
+        "--show-hash",
+        action="store_true",
+        help="Show checksums of both files in binary mode"
+    )
     parser.add_argument(
         "-u", "--unified",
         action="store_true",
@@ -139,6 +468,11 @@ Examples:
         default=3,
         help="Lines of context (default: 3)"
     )
+    parser.add_argument(
+        "--compat",
+        action="store_true",
+        help="Use difflib's matcher instead of the Myers diff"
+    )
     parser.add_argument(
         "-q", "--quiet",
         action="store_true",
@@ -172,29 +506,41 @@ Examples:
         RESET = "\033[0m"
 
     if args.binary:
-        result = compare_binary(file1, file2)
+        result = compare_binary(
+            file1, file2,
+            algorithm=args.algorithm,
+            show_hash=args.show_hash and not args.quiet
+        )
+        algo = result["algorithm"]
 
         if args.quiet:
             sys.exit(0 if result["identical"] else 1)
 
         if result["identical"]:
-            print(f"Files are identical (MD5: {result['file1']['md5']})")
+            if algo:
+                print(f"Files are identical ({algo.upper()}: {result['file1'][algo]})")
+            else:
+                print(f"Files are identical ({result['file1']['size']} bytes)")
             sys.exit(0)
         else:
             print(f"Files differ:")
-            print(f"  {result['file1']['path']}:")
-            print(f"    Size: {result['file1']['size']} bytes")
-            print(f"    MD5:  {result['file1']['md5']}")
-            print(f"  {result['file2']['path']}:")
-            print(f"    Size: {result['file2']['size']} bytes")
-            print(f"    MD5:  {result['file2']['md5']}")
+            for key in ("file1", "file2"):
+                print(f"  {result[key]['path']}:")
+                print(f"    Size: {result[key]['size']} bytes")
+                if algo:
+                    print(f"    {algo.upper() + ':':<7} {result[key][algo]}")
             if result["size_diff"] != 0:
                 sign = "+" if result["size_diff"] > 0 else ""
                 print(f"  Size difference: {sign}{result['size_diff']} bytes")
             sys.exit(1)
 
     else:
-        result = compare_text(file1, file2, context=args.context, unified=args.unified)
+        result = compare_text(
+            file1, file2,
+            context=args.context,
+            unified=args.unified,
+            compat=args.compat
+        )
 
         if not result["success"]:
             print(f"Error: {result['error']}", file=sys.stderr)
@@ -213,15 +559,19 @@ Examples:
         print(f"  Changes: +{result['added']} -{result['removed']}")
         print()
 
+        # Dispatch on the first character and write in large batches
+        colors = {"+": GREEN, "-": RED, "@": CYAN, "*": CYAN}
+        out = []
+        pending = 0
         for line in result["diff"]:
-            if line.startswith("+"):
-                print(f"{GREEN}{line}{RESET}", end="")
-            elif line.startswith("-"):
-                print(f"{RED}{line}{RESET}", end="")
-            elif line.startswith("@") or line.startswith("*"):
-                print(f"{CYAN}{line}{RESET}", end="")
-            else:
-                print(line, end="")
+            color = colors.get(line[:1])
+            out.append(f"{color}{line}{RESET}" if color else line)
+            pending += len(line)
+            if pending >= OUTPUT_BATCH_SIZE:
+                sys.stdout.write("".join(out))
+                out.clear()
+                pending = 0
+        sys.stdout.write("".join(out))
 
         sys.exit(1)
 
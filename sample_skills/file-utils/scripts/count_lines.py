@@ -2,11 +2,81 @@
 """Count lines in files."""
 
 import argparse
+import functools
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+# Below this many files, process pool startup costs more than it saves
+PARALLEL_MIN_FILES = 16
+
+
+def _normalize_newlines(data: bytes) -> bytes:
+    """Turn CRLF and lone CR line endings into LF, as universal newlines do.
+
+    Both counting paths split on LF afterwards, so they agree on where
+    lines end whatever the file's line endings.
+    """
+    if b"\r" in data:
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return data
+
+
+@functools.lru_cache(maxsize=None)
+def _line_scanner(comment_prefix: bytes = b"") -> re.Pattern:
+    """Compile the single-pass blank/comment line scanner for a prefix.
+
+    Each match is one blank line (empty group) or, when a prefix is given,
+    one comment line (group holds the prefix).
+    """
+    comment = re.escape(comment_prefix) if comment_prefix else b"(?!)"
+    return re.compile(rb"^[ \t\r\f\v]*(?:(" + comment + rb")|$)", re.MULTILINE)
+
+
+_MATCH_KERNEL_TEMPLATE = """
+def kernel(lines, search, comment_prefix):
+    blank = comments = counted = 0
+    for line in lines:
+        stripped = line.strip()
+
+        # Count blanks
+        if not stripped:
+            blank += 1
+{blank_skip}
+{comment_check}
+        # Pattern matching
+        if search(line.decode("utf-8", errors="replace")):
+            counted += 1
+    return blank, comments, counted
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _match_kernel(exclude_blank: bool, has_comments: bool):
+    """Build the per-line regex counting loop specialized for the options.
+
+    The blank-exclusion and comment checks are compiled in or out once per
+    option combination, so the loop does not re-test them on every line.
+
+    Returns:
+        Function (lines, search, comment_prefix) -> (blank, comments, counted)
+    """
+    source = _MATCH_KERNEL_TEMPLATE.format(
+        blank_skip="            continue" if exclude_blank else "",
+        comment_check=(
+            "        # Count comments\n"
+            "        if stripped.startswith(comment_prefix):\n"
+            "            comments += 1\n"
+            "            continue\n"
+        ) if has_comments else ""
+    )
+    namespace = {}
+    exec(compile(source, f"<count_lines kernel {exclude_blank}/{has_comments}>", "exec"),
+         namespace)
+    return namespace["kernel"]
+
 
 def count_lines(
     file_path: Path,
@@ -25,9 +95,19 @@ def count_lines(
     Returns:
         Dictionary with count results
     """
+    if not match_pattern:
+        return _count_lines_bulk(file_path, exclude_blank, exclude_comments)
+
+    # Literal patterns are located with bytes.find instead of a regex per line
+    if re.escape(match_pattern) == match_pattern:
+        return _count_lines_bulk(
+            file_path, exclude_blank, exclude_comments,
+            needle=match_pattern.encode("utf-8")
+        )
+
     try:
-        with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-            lines = f.readlines()
+        with open(file_path, "rb") as f:
+            data = f.read()
     except Exception as e:
         return {
             "success": False,
@@ -35,33 +115,82 @@ def count_lines(
             "error": str(e)
         }
 
+    # Lines stay as bytes; only those reaching the regex are decoded.
+    # CRLF and CR endings are normalized so anchored patterns like 'x$' match.
+    lines = _normalize_newlines(data).split(b"\n")
+    if lines[-1] == b"":
+        lines.pop()
+
     total = len(lines)
-    counted = 0
-    blank = 0
-    comments = 0
+    comment_prefix = (exclude_comments or "").encode("utf-8")
+    kernel = _match_kernel(exclude_blank, bool(comment_prefix))
+    blank, comments, counted = kernel(
+        lines, re.compile(match_pattern).search, comment_prefix
+    )
 
-    pattern = re.compile(match_pattern) if match_pattern else None
+    return {
+        "success": True,
+        "file": str(file_path),
+        "total": total,
+        "counted": counted,
+        "blank": blank,
+        "comments": comments,
+        "error": None
+    }
 
-    for line in lines:
-        stripped = line.strip()
 
-        # Count blanks
-        if not stripped:
-            blank += 1
-            if exclude_blank:
-                continue
+def _count_lines_bulk(
+    file_path: Path,
+    exclude_blank: bool = False,
+    exclude_comments: str = None,
+    needle: bytes = None
+) -> dict:
+    """Count lines using whole-buffer operations.
 
-        # Count comments
-        if exclude_comments and stripped.startswith(exclude_comments):
-            comments += 1
-            continue
+    Newlines are counted with bytes.count and blank and comment lines with
+    one cached regex scan over the raw bytes, instead of a Python loop per
+    line. When a literal needle is given, only lines containing it are
+    visited, by jumping between bytes.find hits.
+    """
+    try:
+        with open(file_path, "rb") as f:
+            data = f.read()
+    except Exception as e:
+        return {
+            "success": False,
+            "file": str(file_path),
+            "error": str(e)
+        }
 
-        # Pattern matching
-        if pattern:
-            if pattern.search(line):
+    data = _normalize_newlines(data)
+
+    # A trailing newline does not start another line
+    ends_with_newline = not data or data.endswith(b"\n")
+
+    scanner = _line_scanner((exclude_comments or "").encode("utf-8"))
+    matches = scanner.findall(data)
+
+    total = data.count(b"\n") + (0 if ends_with_newline else 1)
+    blank = matches.count(b"") - (1 if ends_with_newline else 0)
+    comments = len(matches) - matches.count(b"")
+
+    if needle is None:
+        counted = total - comments - (blank if exclude_blank else 0)
+    else:
+        counted = 0
+        comment_prefix = (exclude_comments or "").encode("utf-8")
+        pos = data.find(needle)
+        while pos != -1:
+            start = data.rfind(b"\n", 0, pos) + 1
+            end = data.find(b"\n", pos)
+            if end == -1:
+                end = len(data)
+            stripped = data[start:end].strip(b" \t\r\f\v")
+            if not (exclude_blank and not stripped) and not (
+                comment_prefix and stripped.startswith(comment_prefix)
+            ):
                 counted += 1
-        else:
-            counted += 1
+            pos = data.find(needle, end + 1)
 
     return {
         "success": True,
@@ -74,6 +203,48 @@ def count_lines(
     }
 
 
+def available_cpus() -> int:
+    """Return the number of CPUs this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def count_lines_many(
+    files: list[Path],
+    match_pattern: str = None,
+    exclude_blank: bool = False,
+    exclude_comments: str = None,
+    max_workers: int = None
+) -> list[dict]:
+    """Count lines in many files, spreading them across worker processes.
+
+    Args:
+        files: Paths to the files
+        match_pattern: Only count lines matching this regex
+        exclude_blank: Exclude blank lines
+        exclude_comments: Comment prefix to exclude (e.g., '#', '//')
+        max_workers: Number of worker processes (default: available CPUs)
+
+    Returns:
+        List of count result dictionaries, in input order
+    """
+    counter = functools.partial(
+        count_lines,
+        match_pattern=match_pattern,
+        exclude_blank=exclude_blank,
+        exclude_comments=exclude_comments
+    )
+
+    workers = min(max_workers or available_cpus(), len(files))
+    if workers <= 1 or len(files) < PARALLEL_MIN_FILES:
+        return [counter(file_path) for file_path in files]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(counter, files, chunksize=16))
+
+
 def find_files_by_pattern(root: Path, pattern: str) -> list[Path]:
     """Find files matching glob pattern."""
     return list(root.rglob(pattern))
@@ -154,14 +325,14 @@ Examples:
     grand_blank = 0
     grand_comments = 0
 
-    for file_path in files:
-        result = count_lines(
-            file_path,
-            match_pattern=args.match,
-            exclude_blank=args.no_blank,
-            exclude_comments=args.comments
-        )
+    counts = count_lines_many(
+        files,
+        match_pattern=args.match,
+        exclude_blank=args.no_blank,
+        exclude_comments=args.comments
+    )
 
+    for result in counts:
         if result["success"]:
             results.append(result)
             grand_total += result["counted"]
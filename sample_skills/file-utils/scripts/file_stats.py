@@ -4,68 +4,154 @@
 import argparse
 import hashlib
 import mimetypes
+import mmap
 import os
 import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+# Files at least this large have their cached pages dropped after hashing
+MMAP_THRESHOLD = 10 * 1024 * 1024
 
-def detect_encoding(file_path: Path, sample_size: int = 8192) -> str:
-    """Attempt to detect file encoding."""
+
+def advise_sequential(f) -> None:
+    """Hint the kernel that a file will be read once, front to back."""
+    if not hasattr(os, "posix_fadvise"):
+        return
     try:
-        with open(file_path, "rb") as f:
-            sample = f.read(sample_size)
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+
+
+def advise_done(f) -> None:
+    """Let the kernel drop cached pages of a file that won't be read again."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+
+
+def encoding_from_sample(sample: bytes) -> str:
+    """Guess the encoding of a leading sample of file content."""
+    # Check for BOM
+    if sample.startswith(b"\xef\xbb\xbf"):
+        return "utf-8-sig"
+    if sample.startswith(b"\xff\xfe"):
+        return "utf-16-le"
+    if sample.startswith(b"\xfe\xff"):
+        return "utf-16-be"
+
+    # Pure ASCII is valid UTF-8; isascii() avoids a full decode
+    if sample.isascii():
+        return "utf-8"
+
+    # Try UTF-8
+    try:
+        sample.decode("utf-8")
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
 
-        # Check for BOM
-        if sample.startswith(b"\xef\xbb\xbf"):
-            return "utf-8-sig"
-        if sample.startswith(b"\xff\xfe"):
-            return "utf-16-le"
-        if sample.startswith(b"\xfe\xff"):
-            return "utf-16-be"
+    # Try Latin-1 (always succeeds, but may not be correct)
+    return "latin-1"
 
-        # Try UTF-8
-        try:
-            sample.decode("utf-8")
-            return "utf-8"
-        except UnicodeDecodeError:
-            pass
 
-        # Try Latin-1 (always succeeds, but may not be correct)
-        return "latin-1"
+def count_newlines(content, chunk_size: int = 1024 * 1024) -> int:
+    """Count newline bytes in a bytes-like object, one slice at a time."""
+    return sum(
+        content[offset:offset + chunk_size].count(b"\n")
+        for offset in range(0, len(content), chunk_size)
+    )
 
-    except Exception:
-        return "unknown"
 
+def map_contents(f, size: int):
+    """Map an open file into memory, or return None if it can't be mapped.
 
-def is_binary(file_path: Path, sample_size: int = 8192) -> bool:
-    """Check if file appears to be binary."""
+    Files reporting a size of 0 (empty files, but also /proc entries) and
+    files the kernel refuses to map (sysfs, pipes) are read normally instead.
+    """
+    if size == 0:
+        return None
     try:
-        with open(file_path, "rb") as f:
-            sample = f.read(sample_size)
-        # Check for null bytes
-        return b"\x00" in sample
-    except Exception:
-        return False
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
 
 
-def calculate_checksum(file_path: Path, algorithm: str = "md5") -> str:
-    """Calculate file checksum."""
-    hash_func = getattr(hashlib, algorithm)()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            hash_func.update(chunk)
-    return hash_func.hexdigest()
+def scan_contents(
+    file_path: Path,
+    algorithm: str = None,
+    sample_size: int = 8192
+) -> dict:
+    """Inspect file contents in a single pass over one buffer.
+
+    Binary detection, encoding detection, line counting and the optional
+    checksum all read from the same memory mapping (or plain read, for
+    files that can't be mapped) instead of reopening the file. If the
+    file can't be read, the content fields are left out or marked
+    unknown so the caller can still report the stat metadata, unless a
+    checksum was requested, in which case the error is raised.
+
+    Args:
+        file_path: Path to the file
+        algorithm: Checksum algorithm, or None to skip hashing
+        sample_size: Bytes inspected for binary/encoding detection
+
+    Returns:
+        Dictionary with is_binary, encoding, lines and checksum fields
+    """
+    result = {}
+    hash_func = hashlib.new(algorithm) if algorithm else None
+
+    try:
+        with open(file_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            advise_sequential(f)
+            mm = map_contents(f, size)
+            try:
+                content = mm if mm is not None else f.read()
+
+                sample = content[:sample_size]
+                result["is_binary"] = b"\x00" in sample
+
+                if not result["is_binary"]:
+                    result["encoding"] = encoding_from_sample(sample)
+                    # A final line without a trailing newline still counts
+                    trailing = 1 if content and content[-1:] != b"\n" else 0
+                    result["lines"] = count_newlines(content) + trailing
+
+                if hash_func:
+                    hash_func.update(content)
+                    result["algorithm"] = algorithm
+                    result[algorithm] = hash_func.hexdigest()
+                    if size >= MMAP_THRESHOLD:
+                        advise_done(f)
+            finally:
+                if mm is not None:
+                    mm.close()
+    except OSError:
+        # A requested checksum can't be skipped silently
+        if hash_func:
+            raise
+        return {"is_binary": False, "encoding": "unknown"}
+
+    return result
+
+
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
 
 
 def format_size(size: int) -> str:
     """Format size in human-readable format."""
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size < 1024:
-            return f"{size:.1f} {unit}"
-        size /= 1024
-    return f"{size:.1f} PB"
+    # Each unit step is 10 bits, so the bit length picks the unit directly
+    shift = min(max(0, (size.bit_length() - 1) // 10), len(SIZE_UNITS) - 1)
+    return f"{size / (1 << (shift * 10)):.1f} {SIZE_UNITS[shift]}"
 
 
 def format_permissions(mode: int) -> str:
@@ -78,12 +164,17 @@ def format_permissions(mode: int) -> str:
     return perms
 
 
-def get_file_stats(file_path: Path, calculate_hash: bool = False) -> dict:
+def get_file_stats(
+    file_path: Path,
+    calculate_hash: bool = False,
+    algorithm: str = "sha256"
+) -> dict:
     """Get detailed file statistics.
 
     Args:
         file_path: Path to the file
-        calculate_hash: Whether to calculate checksums
+        calculate_hash: Whether to calculate a checksum
+        algorithm: Checksum algorithm to use (sha256 or md5)
 
     Returns:
         Dictionary with file statistics
@@ -116,21 +207,10 @@ def get_file_stats(file_path: Path, calculate_hash: bool = False) -> dict:
         if is_file:
             mime_type, _ = mimetypes.guess_type(str(file_path))
             result["mime_type"] = mime_type or "application/octet-stream"
-            result["is_binary"] = is_binary(file_path)
-
-            if not result["is_binary"]:
-                result["encoding"] = detect_encoding(file_path)
-
-                # Count lines for text files
-                try:
-                    with open(file_path, "r", encoding=result["encoding"], errors="replace") as f:
-                        result["lines"] = sum(1 for _ in f)
-                except Exception:
-                    pass
-
-            if calculate_hash:
-                result["md5"] = calculate_checksum(file_path, "md5")
-                result["sha256"] = calculate_checksum(file_path, "sha256")
+            result.update(scan_contents(
+                file_path,
+                algorithm=algorithm if calculate_hash else None
+            ))
 
         if is_link:
             result["link_target"] = str(file_path.resolve())
@@ -143,6 +223,64 @@ def get_file_stats(file_path: Path, calculate_hash: bool = False) -> dict:
         return {"success": False, "error": str(e)}
 
 
+def get_file_stats_many(
+    file_paths: list[Path],
+    calculate_hash: bool = False,
+    algorithm: str = "sha256",
+    max_workers: int = None
+) -> list[dict]:
+    """Get statistics for many files concurrently.
+
+    hashlib releases the GIL while digesting large buffers, so checksums
+    for independent files are computed in parallel across worker threads.
+
+    Args:
+        file_paths: Paths to the files
+        calculate_hash: Whether to calculate a checksum
+        algorithm: Checksum algorithm to use (sha256 or md5)
+        max_workers: Thread pool size (default: CPU count)
+
+    Returns:
+        List of statistics dictionaries, in input order
+    """
+    if len(file_paths) == 1:
+        return [get_file_stats(file_paths[0], calculate_hash, algorithm)]
+
+    workers = max_workers or min(32, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(
+            lambda path: get_file_stats(path, calculate_hash, algorithm),
+            file_paths
+        ))
+
+
+def print_stats(result: dict) -> None:
+    """Print file statistics in human-readable form."""
+    print(f"File: {result['name']}")
+    print(f"Path: {result['path']}")
+    print(f"Type: {result['type']}")
+    print(f"Size: {result['size_human']} ({result['size']} bytes)")
+    print(f"Permissions: {result['permissions']} ({result['permissions_octal']})")
+    print(f"Modified: {result['modified']}")
+    print(f"Created: {result['created']}")
+
+    if result["type"] == "file":
+        print(f"MIME type: {result.get('mime_type', 'unknown')}")
+        print(f"Binary: {'Yes' if result.get('is_binary') else 'No'}")
+
+        if not result.get("is_binary"):
+            print(f"Encoding: {result.get('encoding', 'unknown')}")
+            if "lines" in result:
+                print(f"Lines: {result['lines']}")
+
+        if "algorithm" in result:
+            algo = result["algorithm"]
+            print(f"{algo.upper()}: {result[algo]}")
+
+    if result["type"] == "symlink":
+        print(f"Target: {result.get('link_target', 'unknown')}")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Get detailed file information.",
@@ -153,16 +291,24 @@ Examples:
   %(prog)s image.png --checksum
   %(prog)s /var/log/syslog
   %(prog)s mydir/
+  %(prog)s *.iso --checksum
         """
     )
     parser.add_argument(
         "file",
-        help="File or directory to analyze"
+        nargs="+",
+        help="File(s) or directory to analyze"
     )
     parser.add_argument(
         "-c", "--checksum",
         action="store_true",
-        help="Calculate MD5 and SHA256 checksums"
+        help="Calculate file checksum"
+    )
+    parser.add_argument(
+        "-a", "--algorithm",
+        choices=["sha256", "md5"],
+        default="sha256",
+        help="Checksum algorithm (default: sha256)"
     )
     parser.add_argument(
         "-j", "--json",
@@ -172,45 +318,44 @@ Examples:
 
     args = parser.parse_args()
 
-    file_path = Path(args.file)
+    file_paths = [Path(f) for f in args.file]
 
-    if not file_path.exists():
-        print(f"Error: File not found: {args.file}", file=sys.stderr)
-        sys.exit(1)
+    for file_path in file_paths:
+        if not file_path.exists():
+            print(f"Error: File not found: {file_path}", file=sys.stderr)
+            sys.exit(1)
 
-    result = get_file_stats(file_path, calculate_hash=args.checksum)
+    results = get_file_stats_many(
+        file_paths,
+        calculate_hash=args.checksum,
+        algorithm=args.algorithm
+    )
 
-    if not result["success"]:
-        print(f"Error: {result['error']}", file=sys.stderr)
-        sys.exit(1)
+    failed = False
+    succeeded = []
+    for file_path, result in zip(file_paths, results):
+        if result["success"]:
+            succeeded.append(result)
+        else:
+            failed = True
+            prefix = f"{file_path}: " if len(file_paths) > 1 else ""
+            print(f"Error: {prefix}{result['error']}", file=sys.stderr)
 
     if args.json:
         import json
-        print(json.dumps(result, indent=2))
+        if len(file_paths) == 1:
+            if succeeded:
+                print(json.dumps(succeeded[0], indent=2))
+        else:
+            print(json.dumps(succeeded, indent=2))
     else:
-        print(f"File: {result['name']}")
-        print(f"Path: {result['path']}")
-        print(f"Type: {result['type']}")
-        print(f"Size: {result['size_human']} ({result['size']} bytes)")
-        print(f"Permissions: {result['permissions']} ({result['permissions_octal']})")
-        print(f"Modified: {result['modified']}")
-        print(f"Created: {result['created']}")
-
-        if result["type"] == "file":
-            print(f"MIME type: {result.get('mime_type', 'unknown')}")
-            print(f"Binary: {'Yes' if result.get('is_binary') else 'No'}")
-
-            if not result.get("is_binary"):
-                print(f"Encoding: {result.get('encoding', 'unknown')}")
-                if "lines" in result:
-                    print(f"Lines: {result['lines']}")
-
-            if "md5" in result:
-                print(f"MD5: {result['md5']}")
-                print(f"SHA256: {result['sha256']}")
-
-        if result["type"] == "symlink":
-            print(f"Target: {result.get('link_target', 'unknown')}")
+        for i, result in enumerate(succeeded):
+            if i:
+                print()
+            print_stats(result)
+
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
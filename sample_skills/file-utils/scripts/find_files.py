@@ -5,10 +5,19 @@ import argparse
 import fnmatch
 import os
 import re
+import stat
 import sys
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
+# Directories with at least this many candidates are stat'ed concurrently
+STAT_BATCH_MIN = 64
+STAT_WORKERS = 16
+
+# Output is buffered up to this many bytes per write
+OUTPUT_BATCH_SIZE = 64 * 1024
+
 
 def parse_size(size_str: str) -> tuple[str, int]:
     """Parse size string like '+1M' or '-100K'.
@@ -47,32 +56,111 @@ def parse_time(time_str: str) -> timedelta:
     return timedelta(**{units[unit]: number})
 
 
-def matches_size(file_path: Path, size_op: str, size_bytes: int) -> bool:
+def matches_size(file_stat: os.stat_result, size_op: str, size_bytes: int) -> bool:
     """Check if file matches size criteria."""
-    try:
-        file_size = file_path.stat().st_size
-        if size_op == "+":
-            return file_size > size_bytes
-        elif size_op == "-":
-            return file_size < size_bytes
-        else:
-            return file_size == size_bytes
-    except OSError:
-        return False
+    file_size = file_stat.st_size
+    if size_op == "+":
+        return file_size > size_bytes
+    elif size_op == "-":
+        return file_size < size_bytes
+    else:
+        return file_size == size_bytes
 
 
-def matches_time(file_path: Path, time_delta: timedelta, modified: bool = True) -> bool:
-    """Check if file was modified/created within time delta."""
-    try:
-        stat = file_path.stat()
-        if modified:
-            file_time = datetime.fromtimestamp(stat.st_mtime)
+def matches_time(
+    file_stat: os.stat_result,
+    cutoff_ts: float,
+    modified: bool = True
+) -> bool:
+    """Check if file was modified/created at or after a cutoff timestamp."""
+    if modified:
+        return file_stat.st_mtime >= cutoff_ts
+    return file_stat.st_ctime >= cutoff_ts
+
+
+def scan_tree(
+    root: Path,
+    pattern: str = "*",
+    recursive: bool = True,
+    follow_symlinks: bool = True
+):
+    """Walk a directory tree with os.scandir.
+
+    Entries are yielded in the same order as Path.rglob/Path.glob, but each
+    entry is stat'ed exactly once and no Path objects are created. Large
+    directories are stat'ed in batches on a thread pool so that storage
+    latency overlaps instead of adding up one call at a time.
+
+    Yields:
+        Tuples of (path, name, stat_result) for entries matching pattern
+    """
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    matches = re.compile(fnmatch.translate(pattern), flags).match
+    top = str(root)
+
+    def stat_entry(entry: os.DirEntry):
+        try:
+            return entry.stat()
+        except OSError:
+            return None
+
+    def walk(directory: str, prefix: str, executor: ThreadPoolExecutor):
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            return
+
+        subdirs = []
+        candidates = []
+        for entry in entries:
+            try:
+                is_link = entry.is_symlink()
+                if recursive and entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry)
+            except OSError:
+                continue
+            if not follow_symlinks and is_link:
+                continue
+            if matches(entry.name):
+                candidates.append(entry)
+
+        if len(candidates) >= STAT_BATCH_MIN:
+            stats = executor.map(stat_entry, candidates)
         else:
-            file_time = datetime.fromtimestamp(stat.st_ctime)
-        cutoff = datetime.now() - time_delta
-        return file_time >= cutoff
-    except OSError:
-        return False
+            stats = map(stat_entry, candidates)
+
+        for entry, file_stat in zip(candidates, stats):
+            if file_stat is not None:
+                yield prefix + entry.name, entry.name, file_stat
+
+        for entry in subdirs:
+            yield from walk(entry.path, prefix + entry.name + os.sep, executor)
+
+    with ThreadPoolExecutor(max_workers=STAT_WORKERS) as executor:
+        # Path(".").rglob() yields bare relative names, so mirror that here
+        yield from walk(top, "" if top == "." else os.path.join(top, ""), executor)
+
+
+def glob_tree(
+    root: Path,
+    pattern: str = "*",
+    recursive: bool = True,
+    follow_symlinks: bool = True
+):
+    """Walk a directory tree with pathlib glob matching.
+
+    Yields:
+        Tuples of (path, name, stat_result) for entries matching pattern
+    """
+    walker = root.rglob(pattern) if recursive else root.glob(pattern)
+    for path in walker:
+        try:
+            if not follow_symlinks and path.is_symlink():
+                continue
+            yield str(path), path.name, path.stat()
+        except OSError:
+            continue
 
 
 def find_files(
@@ -105,61 +193,76 @@ def find_files(
     if size:
         size_filter = parse_size(size)
 
-    time_filter = None
+    cutoff_ts = None
     if modified_within:
-        time_filter = parse_time(modified_within)
+        cutoff_ts = (datetime.now() - parse_time(modified_within)).timestamp()
 
-    # Walk directory
-    if recursive:
-        walker = root.rglob(pattern)
+    # Patterns spanning directories still need pathlib's glob matching
+    if "/" in pattern or os.sep in pattern:
+        walker = glob_tree(root, pattern, recursive, follow_symlinks)
     else:
-        walker = root.glob(pattern)
+        walker = scan_tree(root, pattern, recursive, follow_symlinks)
 
-    for path in walker:
-        try:
-            if not follow_symlinks and path.is_symlink():
-                continue
+    for path, name, file_stat in walker:
+        is_file = stat.S_ISREG(file_stat.st_mode)
+        is_dir = stat.S_ISDIR(file_stat.st_mode)
 
-            # Type filter
-            if file_type == "f" and not path.is_file():
+        # Type filter
+        if file_type == "f" and not is_file:
+            continue
+        if file_type == "d" and not is_dir:
+            continue
+
+        # Size filter
+        if size_filter and is_file:
+            if not matches_size(file_stat, *size_filter):
                 continue
-            if file_type == "d" and not path.is_dir():
+
+        # Time filter
+        if cutoff_ts is not None:
+            if not matches_time(file_stat, cutoff_ts):
                 continue
 
-            # Size filter
-            if size_filter and path.is_file():
-                if not matches_size(path, *size_filter):
-                    continue
-
-            # Time filter
-            if time_filter:
-                if not matches_time(path, time_filter):
-                    continue
-
-            stat = path.stat()
-            results.append({
-                "path": str(path),
-                "name": path.name,
-                "size": stat.st_size if path.is_file() else None,
-                "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                "is_file": path.is_file(),
-                "is_dir": path.is_dir()
-            })
-        except (OSError, PermissionError):
-            continue
+        results.append({
+            "path": path,
+            "name": name,
+            "size": file_stat.st_size if is_file else None,
+            "mtime": file_stat.st_mtime,
+            "is_file": is_file,
+            "is_dir": is_dir
+        })
 
     return results
 
 
+SIZE_UNITS = ("B", "K", "M", "G", "T")
+
+
 def format_size(size: int) -> str:
     """Format size in human-readable format."""
     if size is None:
         return "-"
-    for unit in ["B", "K", "M", "G"]:
-        if size < 1024:
-            return f"{size:>7.1f}{unit}"
-        size /= 1024
-    return f"{size:>7.1f}T"
+    # Each unit step is 10 bits, so the bit length picks the unit directly
+    shift = min(max(0, (size.bit_length() - 1) // 10), len(SIZE_UNITS) - 1)
+    return f"{size / (1 << (shift * 10)):>7.1f}{SIZE_UNITS[shift]}"
+
+
+def write_lines(lines, sep: bytes = b"\n") -> None:
+    """Write lines to stdout in large batches rather than one write per line.
+
+    Lines are encoded like file names so that undecodable paths round-trip.
+    """
+    out = sys.stdout.buffer
+    sys.stdout.flush()
+    buf = bytearray()
+    for line in lines:
+        buf += os.fsencode(line)
+        buf += sep
+        if len(buf) >= OUTPUT_BATCH_SIZE:
+            out.write(buf)
+            buf.clear()
+    out.write(buf)
+    out.flush()
 
 
 def main():
@@ -255,18 +358,16 @@ Examples:
         print("No files found matching criteria.", file=sys.stderr)
         sys.exit(0)
 
-    if args.null:
-        for r in results:
-            print(r["path"], end="\0")
-    elif args.long:
-        for r in results:
-            size_str = format_size(r["size"])
-            mod_date = r["modified"][:10]
-            ftype = "d" if r["is_dir"] else "-"
-            print(f"{ftype} {size_str} {mod_date} {r['path']}")
+    if args.long and not args.null:
+        lines = (
+            f"{'d' if r['is_dir'] else '-'} {format_size(r['size'])} "
+            f"{date.fromtimestamp(r['mtime']).isoformat()} {r['path']}"
+            for r in results
+        )
     else:
-        for r in results:
-            print(r["path"])
+        lines = (r["path"] for r in results)
+
+    write_lines(lines, b"\0" if args.null else b"\n")
 
     print(f"\nFound {len(results)} item(s)", file=sys.stderr)
 
@@ -2,105 +2,361 @@
 """Compare two JSON files and show differences."""
 
 import argparse
+import hashlib
 import json
+import marshal
+import os
+import re
+import stat
 import sys
+import tempfile
+import time
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Content orjson would not round-trip like the stdlib: integers wider than
+# 64 bits (read as floats), out-of-range exponents, NaN/Infinity (rejected
+# on parse, written as null on output) and floats below 1e-4 (written as
+# 0.00001 where json.dumps writes 1e-05)
+ORJSON_UNSAFE = re.compile(rb"\d{19}|[eE][-+]?\d{3}|NaN|Infinity|[eE]-|\.0000")
+ORJSON_UNSAFE_TEXT = re.compile(ORJSON_UNSAFE.pattern.decode())
+
+# Characters json.dumps escapes by default but orjson writes as-is: anything
+# outside printable ASCII (DEL and non-ASCII), other than indent newlines
+NEEDS_ESCAPE = re.compile(rb"[^\n\x20-\x7e]")
+
+# Parses of files at least this large are cached between runs
+CACHE_MIN_SIZE = 1024 * 1024
+# Bounds on the cache: entry count, total bytes and age in seconds
+CACHE_MAX_ENTRIES = 32
+CACHE_MAX_BYTES = 1024 * 1024 * 1024
+CACHE_MAX_AGE = 7 * 24 * 3600
+
+
+def orjson_round_trips(content: str | bytes) -> bool:
+    """Check whether orjson would read and write content like the stdlib."""
+    pattern = ORJSON_UNSAFE_TEXT if isinstance(content, str) else ORJSON_UNSAFE
+    return not pattern.search(content)
+
+
+def parse_json(content: str | bytes) -> any:
+    """Parse JSON text or raw bytes, using orjson when it is installed.
+
+    Bytes are decoded by the parser itself (orjson expects UTF-8; the
+    stdlib also detects BOMs and UTF-16/32), saving a separate decode pass.
+
+    Content orjson would read differently goes to the stdlib parser, as
+    does input orjson rejects, so errors keep the stdlib message and
+    position.
+
+    Repeated object keys already share one str per document (the stdlib
+    scanner memoizes keys and orjson caches them), so no interning hook is
+    added; an object_pairs_hook would also push the stdlib parse into
+    Python code.
+    """
+    if HAS_ORJSON and orjson_round_trips(content):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+def cache_dir() -> str:
+    """Directory holding cached parses of large JSON files."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "json-tools")
+
+
+def cache_dir_private(directory: str) -> bool:
+    """Check that the cache directory is a real directory only we can access.
+
+    Cached parses hold the full contents of the source files, so a cache
+    directory that others can read or write is neither used nor trusted.
+    """
+    try:
+        st = os.lstat(directory)
+    except OSError:
+        return False
+    if not stat.S_ISDIR(st.st_mode) or st.st_mode & 0o077:
+        return False
+    return not hasattr(os, "getuid") or st.st_uid == os.getuid()
+
+
+def prune_cache(directory: str) -> None:
+    """Drop stale cache entries and keep the rest within the cache bounds.
+
+    Entries (and leftover temp files) older than CACHE_MAX_AGE are removed,
+    then the oldest entries beyond CACHE_MAX_ENTRIES or CACHE_MAX_BYTES.
+    """
+    cutoff = time.time() - CACHE_MAX_AGE
+    entries = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            if not entry.name.endswith((".marshal", ".tmp")):
+                continue
+            st = entry.stat()
+            if st.st_mtime < cutoff:
+                os.unlink(entry.path)
+            elif entry.name.endswith(".marshal"):
+                entries.append((st.st_mtime_ns, st.st_size, entry.path))
+    entries.sort(reverse=True)
+    total = 0
+    for count, (_, size, path) in enumerate(entries):
+        total += size
+        if count >= CACHE_MAX_ENTRIES or total > CACHE_MAX_BYTES:
+            os.unlink(path)
+
+
+def load_json_file(path: str, use_cache: bool = True) -> tuple[any, bool]:
+    """Parse a JSON file, reusing a cached parse while the file is unchanged.
+
+    Files of at least CACHE_MIN_SIZE bytes are cached as marshal data, keyed
+    by real path, mtime, size and ORJSON_UNSAFE. marshal only rebuilds plain
+    data, which keeps loading fast and never runs code from the cache
+    directory. The directory is created private (0700) and entries are
+    written 0600; a directory with other owners or wider permissions is
+    ignored. Cache I/O failures fall back to parsing.
+
+    Returns:
+        Tuple of (data, round_trips), where round_trips is false when the
+        file holds content orjson would not reproduce
+    """
+    st = os.stat(path)
+    if not use_cache or st.st_size < CACHE_MIN_SIZE:
+        with open(path, "rb") as f:
+            content = f.read()
+        return parse_json(content), orjson_round_trips(content)
+
+    key = hashlib.blake2b(
+        f"{os.path.realpath(path)}|{st.st_mtime_ns}|{st.st_size}|{marshal.version}|"
+        f"{ORJSON_UNSAFE.pattern}".encode(),
+        digest_size=16
+    ).hexdigest()
+    directory = cache_dir()
+    cache_file = os.path.join(directory, f"{key}.marshal")
+
+    if cache_dir_private(directory):
+        try:
+            with open(cache_file, "rb") as f:
+                data, round_trips = marshal.loads(f.read())
+            return data, round_trips
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+
+    with open(path, "rb") as f:
+        content = f.read()
+    data = parse_json(content)
+    round_trips = orjson_round_trips(content)
+    del content
 
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if cache_dir_private(directory):
+            # mkstemp creates the file 0600 whatever the umask
+            fd, tmp_file = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    marshal.dump((data, round_trips), f)
+                os.replace(tmp_file, cache_file)
+            except BaseException:
+                os.unlink(tmp_file)
+                raise
+            prune_cache(directory)
+    except (OSError, ValueError):
+        pass
+
+    return data, round_trips
+
+
+# Marks a key or index present on only one side of a comparison
+_MISSING = object()
+
+
+def format_path(path: tuple) -> str:
+    """Join path segments into dot notation."""
+    return ".".join(map(str, path)) if path else "(root)"
+
+
+def subtrees_equal(d1: any, d2: any) -> bool:
+    """Check two containers for type-strict equality without walking them in Python.
 
-def diff_json(data1: any, data2: any, path: str = "") -> list:
+    Plain == treats 1, 1.0 and True as equal, so a match is confirmed by
+    comparing canonical encodings, which keep those apart.
+    """
+    try:
+        return d1 == d2 and json.dumps(d1, sort_keys=True) == json.dumps(d2, sort_keys=True)
+    except RecursionError:
+        return False
+
+
+def diff_json(data1: any, data2: any) -> list:
     """Compare two JSON structures and return differences.
 
+    The structures are walked with an explicit stack rather than recursion,
+    so deeply nested documents cannot hit the recursion limit. Paths are
+    kept as tuples of segments and only joined when a difference is found.
+    Every difference is appended to one list built in place.
+
     Args:
         data1: First JSON data
         data2: Second JSON data
-        path: Current path (for nested comparisons)
 
     Returns:
-        List of difference dictionaries
+        List of difference dictionaries, in document order
     """
     differences = []
+    append = differences.append
+    stack = [(data1, data2, ())]
 
-    if type(data1) != type(data2):
-        differences.append({
-            "path": path or "(root)",
-            "type": "type_change",
-            "old": {"type": type(data1).__name__, "value": data1},
-            "new": {"type": type(data2).__name__, "value": data2}
-        })
-        return differences
-
-    if isinstance(data1, dict):
-        all_keys = set(data1.keys()) | set(data2.keys())
-
-        for key in sorted(all_keys):
-            key_path = f"{path}.{key}" if path else key
-
-            if key not in data1:
-                differences.append({
-                    "path": key_path,
-                    "type": "added",
-                    "value": data2[key]
-                })
-            elif key not in data2:
-                differences.append({
-                    "path": key_path,
-                    "type": "removed",
-                    "value": data1[key]
-                })
-            else:
-                differences.extend(diff_json(data1[key], data2[key], key_path))
-
-    elif isinstance(data1, list):
-        max_len = max(len(data1), len(data2))
-
-        for i in range(max_len):
-            item_path = f"{path}.{i}" if path else str(i)
-
-            if i >= len(data1):
-                differences.append({
-                    "path": item_path,
-                    "type": "added",
-                    "value": data2[i]
-                })
-            elif i >= len(data2):
-                differences.append({
-                    "path": item_path,
-                    "type": "removed",
-                    "value": data1[i]
-                })
-            else:
-                differences.extend(diff_json(data1[i], data2[i], item_path))
+    while stack:
+        d1, d2, path = stack.pop()
 
-    else:
-        if data1 != data2:
-            differences.append({
-                "path": path or "(root)",
+        if d1 is d2:
+            continue
+
+        if d1 is _MISSING:
+            append({
+                "path": format_path(path),
+                "type": "added",
+                "value": d2
+            })
+            continue
+
+        if d2 is _MISSING:
+            append({
+                "path": format_path(path),
+                "type": "removed",
+                "value": d1
+            })
+            continue
+
+        # Exact type identity doubles as the dispatch tag: parsed JSON
+        # only holds dict, list, str, int, float, bool and None
+        kind = type(d1)
+        if kind is not type(d2):
+            append({
+                "path": format_path(path),
+                "type": "type_change",
+                "old": {"type": kind.__name__, "value": d1},
+                "new": {"type": type(d2).__name__, "value": d2}
+            })
+
+        elif kind is dict:
+            if subtrees_equal(d1, d2):
+                continue
+            # Push children in reverse so they pop in sorted key order
+            for key in sorted(d1.keys() | d2.keys(), reverse=True):
+                stack.append((d1.get(key, _MISSING), d2.get(key, _MISSING), path + (key,)))
+
+        elif kind is list:
+            if subtrees_equal(d1, d2):
+                continue
+            for i in range(max(len(d1), len(d2)) - 1, -1, -1):
+                stack.append((
+                    d1[i] if i < len(d1) else _MISSING,
+                    d2[i] if i < len(d2) else _MISSING,
+                    path + (i,)
+                ))
+
+        elif d1 != d2:
+            append({
+                "path": format_path(path),
                 "type": "changed",
-                "old": data1,
-                "new": data2
+                "old": d1,
+                "new": d2
             })
 
     return differences
 
 
+def any_diff(data1: any, data2: any) -> bool:
+    """Check whether diff_json would report any difference.
+
+    Returns at the first difference without building paths, result dicts
+    or sorted key lists. Equal documents are recognized by one
+    subtrees_equal check at the root.
+    """
+    if data1 is data2 or (isinstance(data1, (dict, list)) and subtrees_equal(data1, data2)):
+        return False
+
+    stack = [(data1, data2)]
+    while stack:
+        d1, d2 = stack.pop()
+        if d1 is d2:
+            continue
+
+        kind = type(d1)
+        if kind is not type(d2):
+            return True
+        elif kind is dict:
+            if d1.keys() != d2.keys():
+                return True
+            stack.extend((value, d2[key]) for key, value in d1.items())
+        elif kind is list:
+            if len(d1) != len(d2):
+                return True
+            stack.extend(zip(d1, d2))
+        elif d1 != d2:
+            return True
+
+    return False
+
+
+# Shared encoder for format_value; iterencode yields output incrementally
+_ENCODER = json.JSONEncoder()
+
+
 def format_value(value: any, max_length: int = 50) -> str:
     """Format a value for display."""
-    if value is None:
-        return "null"
-    elif isinstance(value, bool):
-        return "true" if value else "false"
-    elif isinstance(value, str):
+    kind = type(value)
+    if kind is str:
         if len(value) > max_length:
             return f'"{value[:max_length]}..."'
         return f'"{value}"'
-    elif isinstance(value, (dict, list)):
-        s = json.dumps(value)
-        if len(s) > max_length:
-            return f"{s[:max_length]}..."
-        return s
+    elif kind is int or kind is float:
+        return str(value)
+    elif value is None:
+        return "null"
+    elif kind is bool:
+        return "true" if value else "false"
+    elif kind is dict or kind is list:
+        # Encode lazily and stop once the display window is full, so large
+        # subtrees are not serialized just to be truncated
+        chunks = []
+        size = 0
+        for chunk in _ENCODER.iterencode(value):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > max_length:
+                return f"{''.join(chunks)[:max_length]}..."
+        return "".join(chunks)
     else:
         return str(value)
 
 
+def ignore_matcher(patterns: list):
+    """Build a search function matching a path against any ignore pattern.
+
+    The patterns are joined into one alternation so each path is scanned
+    once. Patterns that cannot be combined, such as ones with inline flags
+    or backreferences, are searched one by one instead.
+    """
+    compiled = [re.compile(p) for p in patterns]
+    if len(compiled) > 1 and not any(p.flags & ~re.UNICODE or p.groups for p in compiled):
+        try:
+            return re.compile("|".join(f"(?:{p})" for p in patterns)).search
+        except re.error:
+            pass
+    if len(compiled) == 1:
+        return compiled[0].search
+    return lambda path: any(p.search(path) for p in compiled)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Compare two JSON files and show differences.",
@@ -136,13 +392,17 @@ Examples:
         default=[],
         help="Ignore paths matching pattern (can be repeated)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the parse cache for large files"
+    )
 
     args = parser.parse_args()
 
     # Load files
     try:
-        with open(args.file1, "r", encoding="utf-8") as f:
-            data1 = json.load(f)
+        data1, round_trips1 = load_json_file(args.file1, use_cache=not args.no_cache)
     except FileNotFoundError:
         print(f"Error: File not found: {args.file1}", file=sys.stderr)
         sys.exit(1)
@@ -151,8 +411,7 @@ Examples:
         sys.exit(1)
 
     try:
-        with open(args.file2, "r", encoding="utf-8") as f:
-            data2 = json.load(f)
+        data2, round_trips2 = load_json_file(args.file2, use_cache=not args.no_cache)
     except FileNotFoundError:
         print(f"Error: File not found: {args.file2}", file=sys.stderr)
         sys.exit(1)
@@ -161,16 +420,17 @@ Examples:
         sys.exit(1)
 
     # Compare
+    # With --quiet only the existence of a difference matters, unless
+    # --ignore may discard the ones found
+    if args.quiet and not args.ignore:
+        sys.exit(2 if any_diff(data1, data2) else 0)
+
     differences = diff_json(data1, data2)
 
     # Filter ignored paths
     if args.ignore:
-        import re
-        patterns = [re.compile(p) for p in args.ignore]
-        differences = [
-            d for d in differences
-            if not any(p.search(d["path"]) for p in patterns)
-        ]
+        search = ignore_matcher(args.ignore)
+        differences = [d for d in differences if not search(d["path"])]
 
     # Output
     if args.quiet:
@@ -181,13 +441,26 @@ Examples:
         sys.exit(0)
 
     if args.json:
+        if HAS_ORJSON and round_trips1 and round_trips2:
+            try:
+                output = orjson.dumps(differences, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+            except orjson.JSONEncodeError:
+                output = None
+            # orjson output matches json.dumps only when there is nothing to escape
+            if output is not None and not NEEDS_ESCAPE.search(output):
+                sys.stdout.flush()
+                sys.stdout.buffer.write(output)
+                sys.exit(2)
         print(json.dumps(differences, indent=2))
         sys.exit(2)
 
-    print(f"Found {len(differences)} difference(s):")
-    print(f"  {args.file1} (old)")
-    print(f"  {args.file2} (new)")
-    print("-" * 60)
+    out = [
+        f"Found {len(differences)} difference(s):\n",
+        f"  {args.file1} (old)\n",
+        f"  {args.file2} (new)\n",
+        "-" * 60 + "\n"
+    ]
+    append = out.append
 
     for diff in differences:
         path = diff["path"]
@@ -196,35 +469,37 @@ Examples:
         if diff_type == "added":
             symbol = "+"
             if args.keys_only:
-                print(f"{symbol} {path}")
+                append(f"{symbol} {path}\n")
             else:
-                print(f"{symbol} {path}: {format_value(diff['value'])}")
+                append(f"{symbol} {path}: {format_value(diff['value'])}\n")
 
         elif diff_type == "removed":
             symbol = "-"
             if args.keys_only:
-                print(f"{symbol} {path}")
+                append(f"{symbol} {path}\n")
             else:
-                print(f"{symbol} {path}: {format_value(diff['value'])}")
+                append(f"{symbol} {path}: {format_value(diff['value'])}\n")
 
         elif diff_type == "changed":
             symbol = "~"
             if args.keys_only:
-                print(f"{symbol} {path}")
+                append(f"{symbol} {path}\n")
             else:
-                print(f"{symbol} {path}:")
-                print(f"    old: {format_value(diff['old'])}")
-                print(f"    new: {format_value(diff['new'])}")
+                append(f"{symbol} {path}:\n"
+                       f"    old: {format_value(diff['old'])}\n"
+                       f"    new: {format_value(diff['new'])}\n")
 
         elif diff_type == "type_change":
             symbol = "!"
             if args.keys_only:
-                print(f"{symbol} {path}")
+                append(f"{symbol} {path}\n")
             else:
-                print(f"{symbol} {path}: type changed")
-                print(f"    old ({diff['old']['type']}): {format_value(diff['old']['value'])}")
-                print(f"    new ({diff['new']['type']}): {format_value(diff['new']['value'])}")
+                append(f"{symbol} {path}: type changed\n"
+                       f"    old ({diff['old']['type']}): {format_value(diff['old']['value'])}\n"
+                       f"    new ({diff['new']['type']}): {format_value(diff['new']['value'])}\n")
 
+    # One write for the whole report instead of a print per line
+    sys.stdout.write("".join(out))
     sys.exit(2)
 
 
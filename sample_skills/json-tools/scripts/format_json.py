@@ -2,12 +2,100 @@
 """Format (pretty-print or minify) JSON."""
 
 import argparse
+import contextlib
 import json
+import mmap
+import os
+import re
 import sys
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Content orjson would not round-trip like the stdlib: integers wider than
+# 64 bits (read as floats), out-of-range exponents, NaN/Infinity (rejected
+# on parse, written as null on output) and floats below 1e-4 (written as
+# 0.00001 where json.dumps writes 1e-05)
+ORJSON_UNSAFE = re.compile(rb"\d{19}|[eE][-+]?\d{3}|NaN|Infinity|[eE]-|\.0000")
+ORJSON_UNSAFE_TEXT = re.compile(ORJSON_UNSAFE.pattern.decode())
+NON_ASCII = re.compile(rb"[\x80-\xff]")
+
+# Characters json.dumps escapes by default but orjson writes as-is: anything
+# outside printable ASCII (DEL and non-ASCII), other than indent newlines
+NEEDS_ESCAPE = re.compile(r"[^\n\x20-\x7e]")
+
+# With orjson available, files at least this large are memory-mapped and
+# parsed in place instead of being copied into a bytes object
+MMAP_THRESHOLD = 16 * 1024 * 1024
+
+
+def orjson_round_trips(content: str | bytes | memoryview) -> bool:
+    """Check whether orjson would read and write content like the stdlib."""
+    pattern = ORJSON_UNSAFE_TEXT if isinstance(content, str) else ORJSON_UNSAFE
+    return not pattern.search(content)
+
+
+def parse_json(content: str | bytes | memoryview) -> any:
+    """Parse JSON text or raw bytes, using orjson when it is installed.
+
+    Bytes are decoded by the parser itself (orjson expects UTF-8; the
+    stdlib also detects BOMs and UTF-16/32), saving a separate decode pass.
+
+    Content orjson would read differently goes to the stdlib parser, as
+    does input orjson rejects, so errors keep the stdlib message and
+    position.
+    """
+    if HAS_ORJSON and orjson_round_trips(content):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    if isinstance(content, memoryview):
+        content = bytes(content)
+    return json.loads(content)
+
+
+def char_count(content: str | bytes | memoryview) -> int:
+    """Length of content in characters, decoding bytes only when needed."""
+    if isinstance(content, str):
+        return len(content)
+    if isinstance(content, bytes) and content.isascii():
+        return len(content)
+    if isinstance(content, memoryview) and not NON_ASCII.search(content):
+        return len(content)
+    content = bytes(content)
+    return len(content.decode(json.detect_encoding(content), "replace"))
+
+
+def dump_json(data: any, round_trips: bool, indent: int | None = None, sort_keys: bool = False) -> str:
+    """Serialize parsed data, using orjson where its output matches json.dumps.
+
+    With indent=None the output is compact and ASCII-only; otherwise
+    non-ASCII text is written as-is. The stdlib is used for other indents,
+    when round_trips is false (the source held content orjson would not
+    reproduce, see ORJSON_UNSAFE) and for compact output that needs escapes.
+    """
+    if HAS_ORJSON and round_trips and indent in (None, 2):
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            formatted = orjson.dumps(data, option=option).decode()
+        except orjson.JSONEncodeError:
+            formatted = None
+        if formatted is not None and (indent or not NEEDS_ESCAPE.search(formatted)):
+            return formatted
+
+    if indent is None:
+        return json.dumps(data, separators=(",", ":"), sort_keys=sort_keys)
+    return json.dumps(data, indent=indent, sort_keys=sort_keys, ensure_ascii=False)
+
 
 def format_json(
-    content: str,
+    content: str | bytes | memoryview,
     indent: int = 2,
     minify: bool = False,
     sort_keys: bool = False
@@ -15,7 +103,7 @@ def format_json(
     """Format JSON content.
 
     Args:
-        content: JSON string to format
+        content: JSON text, or raw bytes in a JSON encoding, to format
         indent: Indentation level (ignored if minify=True)
         minify: If True, output compact JSON
         sort_keys: If True, sort object keys alphabetically
@@ -24,26 +112,23 @@ def format_json(
         Dictionary with formatting results
     """
     try:
-        data = json.loads(content)
-
-        if minify:
-            formatted = json.dumps(data, separators=(",", ":"), sort_keys=sort_keys)
-        else:
-            formatted = json.dumps(
-                data,
-                indent=indent,
-                sort_keys=sort_keys,
-                ensure_ascii=False
-            )
+        data = parse_json(content)
+
+        formatted = dump_json(
+            data,
+            orjson_round_trips(content),
+            indent=None if minify else indent,
+            sort_keys=sort_keys
+        )
 
         return {
             "success": True,
             "formatted": formatted,
-            "original_size": len(content),
+            "original_size": char_count(content),
             "formatted_size": len(formatted),
             "error": None
         }
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         return {
             "success": False,
             "formatted": None,
@@ -51,15 +136,32 @@ def format_json(
         }
 
 
-def get_input(args) -> tuple[str, str]:
-    """Get input content and source name."""
+@contextlib.contextmanager
+def open_input(args):
+    """Open the input, yielding its content and source name.
+
+    Files and stdin are yielded as raw bytes for the parser to decode.
+    Large files are yielded as a view of a read-only memory map when
+    orjson can parse them in place; the view is released and the map
+    closed when the context exits.
+    """
     if args.string:
-        return args.string, "<string>"
-    elif args.file == "-":
-        return sys.stdin.read(), "<stdin>"
-    else:
-        with open(args.file, "r", encoding="utf-8") as f:
-            return f.read(), args.file
+        yield args.string, "<string>"
+        return
+    if args.file == "-":
+        yield sys.stdin.buffer.read(), "<stdin>"
+        return
+
+    with open(args.file, "rb") as f:
+        if HAS_ORJSON and os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                with memoryview(mapped) as view:
+                    yield view, args.file
+            return
+        content = f.read()
+    yield content, args.file
 
 
 def main():
@@ -114,8 +216,9 @@ Examples:
 
     args = parser.parse_args()
 
+    inputs = contextlib.ExitStack()
     try:
-        content, source = get_input(args)
+        content, source = inputs.enter_context(open_input(args))
     except FileNotFoundError:
         print(f"Error: File not found: {args.file}", file=sys.stderr)
         sys.exit(1)
@@ -123,12 +226,13 @@ Examples:
         print(f"Error reading input: {e}", file=sys.stderr)
         sys.exit(1)
 
-    result = format_json(
-        content,
-        indent=args.indent,
-        minify=args.minify,
-        sort_keys=args.sort_keys
-    )
+    with inputs:
+        result = format_json(
+            content,
+            indent=args.indent,
+            minify=args.minify,
+            sort_keys=args.sort_keys
+        )
 
     if not result["success"]:
         print(f"Error: Invalid JSON - {result['error']}", file=sys.stderr)
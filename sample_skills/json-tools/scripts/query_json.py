@@ -2,8 +2,250 @@
 """Query JSON data using path expressions."""
 
 import argparse
+import functools
+import hashlib
 import json
+import marshal
+import os
+import re
+import stat
 import sys
+import tempfile
+import time
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Content orjson would not round-trip like the stdlib: integers wider than
+# 64 bits (read as floats), out-of-range exponents, NaN/Infinity (rejected
+# on parse, written as null on output) and floats below 1e-4 (written as
+# 0.00001 where json.dumps writes 1e-05)
+ORJSON_UNSAFE = re.compile(rb"\d{19}|[eE][-+]?\d{3}|NaN|Infinity|[eE]-|\.0000")
+ORJSON_UNSAFE_TEXT = re.compile(ORJSON_UNSAFE.pattern.decode())
+
+# Characters json.dumps escapes by default but orjson writes as-is: anything
+# outside printable ASCII (DEL and non-ASCII), other than indent newlines
+NEEDS_ESCAPE = re.compile(r"[^\n\x20-\x7e]")
+
+# Parses of files at least this large are cached between runs
+CACHE_MIN_SIZE = 1024 * 1024
+# Bounds on the cache: entry count, total bytes and age in seconds
+CACHE_MAX_ENTRIES = 32
+CACHE_MAX_BYTES = 1024 * 1024 * 1024
+CACHE_MAX_AGE = 7 * 24 * 3600
+
+
+def orjson_round_trips(content: str | bytes) -> bool:
+    """Check whether orjson would read and write content like the stdlib."""
+    pattern = ORJSON_UNSAFE_TEXT if isinstance(content, str) else ORJSON_UNSAFE
+    return not pattern.search(content)
+
+
+def parse_json(content: str | bytes) -> any:
+    """Parse JSON text or raw bytes, using orjson when it is installed.
+
+    Bytes are decoded by the parser itself (orjson expects UTF-8; the
+    stdlib also detects BOMs and UTF-16/32), saving a separate decode pass.
+
+    Content orjson would read differently goes to the stdlib parser, as
+    does input orjson rejects, so errors keep the stdlib message and
+    position.
+    """
+    if HAS_ORJSON and orjson_round_trips(content):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+def cache_dir() -> str:
+    """Directory holding cached parses of large JSON files."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "json-tools")
+
+
+def cache_dir_private(directory: str) -> bool:
+    """Check that the cache directory is a real directory only we can access.
+
+    Cached parses hold the full contents of the source files, so a cache
+    directory that others can read or write is neither used nor trusted.
+    """
+    try:
+        st = os.lstat(directory)
+    except OSError:
+        return False
+    if not stat.S_ISDIR(st.st_mode) or st.st_mode & 0o077:
+        return False
+    return not hasattr(os, "getuid") or st.st_uid == os.getuid()
+
+
+def prune_cache(directory: str) -> None:
+    """Drop stale cache entries and keep the rest within the cache bounds.
+
+    Entries (and leftover temp files) older than CACHE_MAX_AGE are removed,
+    then the oldest entries beyond CACHE_MAX_ENTRIES or CACHE_MAX_BYTES.
+    """
+    cutoff = time.time() - CACHE_MAX_AGE
+    entries = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            if not entry.name.endswith((".marshal", ".tmp")):
+                continue
+            st = entry.stat()
+            if st.st_mtime < cutoff:
+                os.unlink(entry.path)
+            elif entry.name.endswith(".marshal"):
+                entries.append((st.st_mtime_ns, st.st_size, entry.path))
+    entries.sort(reverse=True)
+    total = 0
+    for count, (_, size, path) in enumerate(entries):
+        total += size
+        if count >= CACHE_MAX_ENTRIES or total > CACHE_MAX_BYTES:
+            os.unlink(path)
+
+
+def load_json_file(path: str, use_cache: bool = True) -> tuple[any, bool]:
+    """Parse a JSON file, reusing a cached parse while the file is unchanged.
+
+    Files of at least CACHE_MIN_SIZE bytes are cached as marshal data, keyed
+    by real path, mtime, size and ORJSON_UNSAFE. marshal only rebuilds plain
+    data, which keeps loading fast and never runs code from the cache
+    directory. The directory is created private (0700) and entries are
+    written 0600; a directory with other owners or wider permissions is
+    ignored. Cache I/O failures fall back to parsing.
+
+    Returns:
+        Tuple of (data, round_trips), where round_trips is false when the
+        file holds content orjson would not reproduce
+    """
+    st = os.stat(path)
+    if not use_cache or st.st_size < CACHE_MIN_SIZE:
+        with open(path, "rb") as f:
+            content = f.read()
+        return parse_json(content), orjson_round_trips(content)
+
+    key = hashlib.blake2b(
+        f"{os.path.realpath(path)}|{st.st_mtime_ns}|{st.st_size}|{marshal.version}|"
+        f"{ORJSON_UNSAFE.pattern}".encode(),
+        digest_size=16
+    ).hexdigest()
+    directory = cache_dir()
+    cache_file = os.path.join(directory, f"{key}.marshal")
+
+    if cache_dir_private(directory):
+        try:
+            with open(cache_file, "rb") as f:
+                data, round_trips = marshal.loads(f.read())
+            return data, round_trips
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+
+    with open(path, "rb") as f:
+        content = f.read()
+    data = parse_json(content)
+    round_trips = orjson_round_trips(content)
+    del content
+
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if cache_dir_private(directory):
+            # mkstemp creates the file 0600 whatever the umask
+            fd, tmp_file = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    marshal.dump((data, round_trips), f)
+                os.replace(tmp_file, cache_file)
+            except BaseException:
+                os.unlink(tmp_file)
+                raise
+            prune_cache(directory)
+    except (OSError, ValueError):
+        pass
+
+    return data, round_trips
+
+
+def dump_json(data: any, round_trips: bool, indent: int | None = None, sort_keys: bool = False) -> str:
+    """Serialize parsed data, using orjson where its output matches json.dumps.
+
+    With indent=None the output is compact and ASCII-only; otherwise
+    non-ASCII text is written as-is. The stdlib is used for other indents,
+    when round_trips is false (the source held content orjson would not
+    reproduce, see ORJSON_UNSAFE) and for compact output that needs escapes.
+    """
+    if HAS_ORJSON and round_trips and indent in (None, 2):
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            formatted = orjson.dumps(data, option=option).decode()
+        except orjson.JSONEncodeError:
+            formatted = None
+        if formatted is not None and (indent or not NEEDS_ESCAPE.search(formatted)):
+            return formatted
+
+    if indent is None:
+        return json.dumps(data, separators=(",", ":"), sort_keys=sort_keys)
+    return json.dumps(data, indent=indent, sort_keys=sort_keys, ensure_ascii=False)
+
+
+def _not_container(value):
+    raise TypeError(f"cannot index {type(value).__name__}")
+
+
+def as_index(part: str) -> int | None:
+    """Return the list index a path segment names, or None if it is not one."""
+    try:
+        return int(part)
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def parse_path(path: str) -> tuple:
+    """Split a dot-notation path into (key, index) steps, parsed once per path.
+
+    Returns:
+        Tuple of (segment, int index or None) pairs
+    """
+    return tuple((part, as_index(part)) for part in path.split("."))
+
+
+@functools.lru_cache(maxsize=256)
+def compile_path(path: str):
+    """Build a straight-line accessor for a dot-notation path.
+
+    Each segment becomes one subscript in generated code, so a lookup does
+    no splitting or int() parsing. Segments of ASCII digits index lists as
+    well as dicts; any other segment indexes dicts only. A failed lookup
+    raises KeyError, IndexError or TypeError.
+
+    Returns:
+        Function (data) -> value at path
+    """
+    lines = ["def get(d):"]
+    for part, index in parse_path(path):
+        if part.isascii() and part.isdigit():
+            lines.append(
+                f"    d = d[{part!r}] if type(d) is dict else "
+                f"d[{index}] if type(d) is list else not_container(d)"
+            )
+        else:
+            lines.append(f"    d = d[{part!r}]")
+    lines.append("    return d")
+
+    namespace = {"not_container": _not_container}
+    exec(compile("\n".join(lines), f"<query_json path {path!r}>", "exec"), namespace)
+    return namespace["get"]
+
+
+def join_steps(steps: tuple, count: int) -> str:
+    """Rebuild the dot-notation path of the first count steps."""
+    return ".".join(part for part, _ in steps[:count])
 
 
 def query_json(data: any, path: str) -> dict:
@@ -25,12 +267,23 @@ def query_json(data: any, path: str) -> dict:
             "error": None
         }
 
-    parts = path.split(".")
-    current = data
+    try:
+        value = compile_path(path)(data)
+        return {
+            "success": True,
+            "path": path,
+            "value": value,
+            "type": type(value).__name__,
+            "error": None
+        }
+    except (KeyError, IndexError, TypeError):
+        pass
 
-    for i, part in enumerate(parts):
-        current_path = ".".join(parts[:i + 1])
+    # Walk the path again step by step to report where the lookup failed
+    steps = parse_path(path)
+    current = data
 
+    for i, (part, index) in enumerate(steps):
         if isinstance(current, dict):
             if part in current:
                 current = current[part]
@@ -40,29 +293,27 @@ def query_json(data: any, path: str) -> dict:
                     "path": path,
                     "value": None,
                     "type": None,
-                    "error": f"Key '{part}' not found at '{current_path}'"
+                    "error": f"Key '{part}' not found at '{join_steps(steps, i + 1)}'"
                 }
 
         elif isinstance(current, list):
-            try:
-                index = int(part)
-                if 0 <= index < len(current):
-                    current = current[index]
-                else:
-                    return {
-                        "success": False,
-                        "path": path,
-                        "value": None,
-                        "type": None,
-                        "error": f"Index {index} out of range at '{current_path}' (list has {len(current)} items)"
-                    }
-            except ValueError:
+            if index is None:
                 return {
                     "success": False,
                     "path": path,
                     "value": None,
                     "type": None,
-                    "error": f"Expected integer index but got '{part}' at '{current_path}'"
+                    "error": f"Expected integer index but got '{part}' at '{join_steps(steps, i + 1)}'"
+                }
+            elif 0 <= index < len(current):
+                current = current[index]
+            else:
+                return {
+                    "success": False,
+                    "path": path,
+                    "value": None,
+                    "type": None,
+                    "error": f"Index {index} out of range at '{join_steps(steps, i + 1)}' (list has {len(current)} items)"
                 }
         else:
             return {
@@ -70,7 +321,7 @@ def query_json(data: any, path: str) -> dict:
                 "path": path,
                 "value": None,
                 "type": None,
-                "error": f"Cannot access '{part}' on {type(current).__name__} at '{'.'.join(parts[:i])}'"
+                "error": f"Cannot access '{part}' on {type(current).__name__} at '{join_steps(steps, i)}'"
             }
 
     return {
@@ -98,14 +349,17 @@ def list_keys(data: any, path: str = "") -> list:
         return []
 
 
-def get_input(args) -> tuple[str, str]:
-    """Get input content and source name."""
+def get_input(args) -> tuple[str | bytes, str]:
+    """Get input content and source name.
+
+    Files and stdin are returned as raw bytes for the parser to decode.
+    """
     if args.string:
         return args.string, "<string>"
     elif args.file == "-":
-        return sys.stdin.read(), "<stdin>"
+        return sys.stdin.buffer.read(), "<stdin>"
     else:
-        with open(args.file, "r", encoding="utf-8") as f:
+        with open(args.file, "rb") as f:
             return f.read(), args.file
 
 
@@ -161,24 +415,31 @@ Examples:
         action="store_true",
         help="Output compact JSON"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the parse cache for large files"
+    )
 
     args = parser.parse_args()
 
     try:
-        content, source = get_input(args)
+        if args.string or args.file == "-":
+            content, source = get_input(args)
+            data = parse_json(content)
+            round_trips = orjson_round_trips(content)
+        else:
+            data, round_trips = load_json_file(args.file, use_cache=not args.no_cache)
     except FileNotFoundError:
         print(f"Error: File not found: {args.file}", file=sys.stderr)
         sys.exit(1)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        print(f"Error: Invalid JSON - {e}", file=sys.stderr)
+        sys.exit(1)
     except Exception as e:
         print(f"Error reading input: {e}", file=sys.stderr)
         sys.exit(1)
 
-    try:
-        data = json.loads(content)
-    except json.JSONDecodeError as e:
-        print(f"Error: Invalid JSON - {e}", file=sys.stderr)
-        sys.exit(1)
-
     if args.keys:
         keys = list_keys(data, args.path)
         if keys:
@@ -199,10 +460,10 @@ Examples:
     if args.raw and isinstance(value, str):
         print(value)
     elif args.compact:
-        print(json.dumps(value, separators=(",", ":")))
+        print(dump_json(value, round_trips))
     else:
         if isinstance(value, (dict, list)):
-            print(json.dumps(value, indent=2, ensure_ascii=False))
+            print(dump_json(value, round_trips, indent=2))
         else:
             print(json.dumps(value))
 
@@ -2,21 +2,86 @@
 """Validate JSON syntax."""
 
 import argparse
+import contextlib
 import json
+import mmap
+import os
+import re
 import sys
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-def validate_json(content: str) -> dict:
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# Content orjson would not round-trip like the stdlib: integers wider than
+# 64 bits (read as floats), out-of-range exponents and NaN/Infinity
+# (rejected on parse, written as null on output)
+ORJSON_UNSAFE = re.compile(rb"\d{19}|[eE][-+]?\d{3}|NaN|Infinity")
+ORJSON_UNSAFE_TEXT = re.compile(ORJSON_UNSAFE.pattern.decode())
+NON_ASCII = re.compile(rb"[\x80-\xff]")
+
+# With orjson available, files at least this large are memory-mapped and
+# parsed in place instead of being copied into a bytes object
+MMAP_THRESHOLD = 16 * 1024 * 1024
+
+
+def orjson_round_trips(content: str | bytes | memoryview) -> bool:
+    """Check whether orjson would read and write content like the stdlib."""
+    pattern = ORJSON_UNSAFE_TEXT if isinstance(content, str) else ORJSON_UNSAFE
+    return not pattern.search(content)
+
+
+def parse_json(content: str | bytes | memoryview) -> any:
+    """Parse JSON text or raw bytes, using orjson when it is installed.
+
+    Bytes are decoded by the parser itself (orjson expects UTF-8; the
+    stdlib also detects BOMs and UTF-16/32), saving a separate decode pass.
+
+    Content orjson would read differently goes to the stdlib parser, as
+    does input orjson rejects, so errors keep the stdlib message and
+    position.
+    """
+    if HAS_ORJSON and orjson_round_trips(content):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    if isinstance(content, memoryview):
+        content = bytes(content)
+    return json.loads(content)
+
+
+def char_count(content: str | bytes | memoryview) -> int:
+    """Length of content in characters, decoding bytes only when needed."""
+    if isinstance(content, str):
+        return len(content)
+    if isinstance(content, bytes) and content.isascii():
+        return len(content)
+    if isinstance(content, memoryview) and not NON_ASCII.search(content):
+        return len(content)
+    content = bytes(content)
+    return len(content.decode(json.detect_encoding(content), "replace"))
+
+
+def validate_json(content: str | bytes | memoryview) -> dict:
     """Validate JSON content.
 
     Args:
-        content: JSON string to validate
+        content: JSON text, or raw bytes in a JSON encoding, to validate
 
     Returns:
         Dictionary with validation results
     """
     try:
-        data = json.loads(content)
+        data = parse_json(content)
 
         # Gather statistics
         stats = analyze_json(data)
@@ -40,48 +105,153 @@ def validate_json(content: str) -> dict:
                 "char": e.pos
             }
         }
+    except UnicodeDecodeError as e:
+        return {
+            "valid": False,
+            "data": None,
+            "stats": None,
+            "error": str(e),
+            "error_position": None
+        }
+
+
+def validate_json_stream(f) -> dict:
+    """Validate JSON from a binary file object without building the document.
+
+    ijson parse events are consumed one at a time, keeping only the current
+    nesting depth and root counters, so memory use stays flat regardless of
+    file size. Error positions are not available in this mode, and ijson
+    follows strict JSON: NaN, Infinity and floats out of range (1e400),
+    which the in-memory check accepts like json.loads, are rejected. For
+    that reason streaming is only used when asked for with --stream.
+
+    Args:
+        f: Binary file object to read from
+
+    Returns:
+        Dictionary with validation results, shaped like validate_json()
+    """
+    stats = None
+    depth = 0
+    max_depth = 0
+    root_len = 0
+
+    try:
+        for _, event, value in ijson.parse(f, use_float=True):
+            if event == "start_map" or event == "start_array":
+                if stats is None:
+                    stats = {"type": "dict" if event == "start_map" else "list", "depth": 0}
+                elif depth == 1 and stats["type"] == "list":
+                    root_len += 1
+                depth += 1
+                if depth > max_depth:
+                    max_depth = depth
+            elif event == "end_map" or event == "end_array":
+                depth -= 1
+            elif event == "map_key":
+                if depth == 1:
+                    root_len += 1
+            elif stats is None:
+                stats = {"type": type(value).__name__, "depth": 0}
+                stats["length" if isinstance(value, str) else "value"] = (
+                    len(value) if isinstance(value, str) else value
+                )
+            elif depth == 1 and stats["type"] == "list":
+                root_len += 1
+    except ijson.JSONError as e:
+        return {
+            "valid": False,
+            "data": None,
+            "stats": None,
+            "error": str(e),
+            "error_position": None
+        }
+
+    if stats is None:
+        return {
+            "valid": False,
+            "data": None,
+            "stats": None,
+            "error": "Expecting value: empty input",
+            "error_position": None
+        }
+
+    if stats["type"] in ("dict", "list"):
+        stats["keys" if stats["type"] == "dict" else "items"] = root_len
+        stats["max_depth"] = max_depth - 1
+
+    return {
+        "valid": True,
+        "data": None,
+        "stats": stats,
+        "error": None,
+        "error_position": None
+    }
+
 
+def analyze_json(data) -> dict:
+    """Analyze JSON structure and return statistics.
 
-def analyze_json(data, depth=0) -> dict:
-    """Analyze JSON structure and return statistics."""
+    Nesting depth is measured level by level: each pass collects the
+    containers one level down, so the depth is just the number of passes
+    and no per-node stats or (node, depth) pairs are built. Deep documents
+    cannot hit the recursion limit. Depth counts nested containers only.
+    """
     stats = {
         "type": type(data).__name__,
-        "depth": depth
+        "depth": 0
     }
 
-    if isinstance(data, dict):
-        stats["keys"] = len(data)
-        stats["max_depth"] = depth
-        for value in data.values():
-            child_stats = analyze_json(value, depth + 1)
-            stats["max_depth"] = max(stats["max_depth"], child_stats.get("max_depth", depth))
-    elif isinstance(data, list):
-        stats["items"] = len(data)
-        stats["max_depth"] = depth
-        for item in data:
-            child_stats = analyze_json(item, depth + 1)
-            stats["max_depth"] = max(stats["max_depth"], child_stats.get("max_depth", depth))
+    if isinstance(data, (dict, list)):
+        stats["keys" if isinstance(data, dict) else "items"] = len(data)
+
+        max_depth = 0
+        level = [data]
+        while True:
+            level = [
+                child
+                for node in level
+                for child in (node.values() if isinstance(node, dict) else node)
+                if isinstance(child, (dict, list))
+            ]
+            if not level:
+                break
+            max_depth += 1
+        stats["max_depth"] = max_depth
     elif isinstance(data, str):
         stats["length"] = len(data)
-    elif isinstance(data, (int, float)):
-        stats["value"] = data
-    elif data is None:
-        stats["value"] = None
-    elif isinstance(data, bool):
+    else:
         stats["value"] = data
 
     return stats
 
 
-def get_input(args) -> tuple[str, str]:
-    """Get input content and source name."""
+@contextlib.contextmanager
+def open_input(args):
+    """Open the input, yielding its content and source name.
+
+    Files and stdin are yielded as raw bytes for the parser to decode.
+    Large files are yielded as a view of a read-only memory map when
+    orjson can parse them in place; the view is released and the map
+    closed when the context exits.
+    """
     if args.string:
-        return args.string, "<string>"
-    elif args.file == "-":
-        return sys.stdin.read(), "<stdin>"
-    else:
-        with open(args.file, "r", encoding="utf-8") as f:
-            return f.read(), args.file
+        yield args.string, "<string>"
+        return
+    if args.file == "-":
+        yield sys.stdin.buffer.read(), "<stdin>"
+        return
+
+    with open(args.file, "rb") as f:
+        if HAS_ORJSON and os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                with memoryview(mapped) as view:
+                    yield view, args.file
+            return
+        content = f.read()
+    yield content, args.file
 
 
 def main():
@@ -94,6 +264,7 @@ Examples:
   %(prog)s data.json --stats
   echo '{"key": "value"}' | %(prog)s -
   %(prog)s --string '{"valid": true}'
+  %(prog)s huge.json --stream
         """
     )
     parser.add_argument(
@@ -111,6 +282,12 @@ Examples:
         action="store_true",
         help="Show statistics about the JSON structure"
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Validate incrementally without loading the whole file (requires ijson; "
+             "strict JSON, so NaN and Infinity are rejected)"
+    )
     parser.add_argument(
         "-q", "--quiet",
         action="store_true",
@@ -119,8 +296,24 @@ Examples:
 
     args = parser.parse_args()
 
+    if args.stream and not HAS_IJSON:
+        print("Note: Install ijson for --stream; validating in memory", file=sys.stderr)
+
+    content = None
+    inputs = contextlib.ExitStack()
     try:
-        content, source = get_input(args)
+        stream = HAS_IJSON and args.stream and not args.string
+        if stream and args.file == "-":
+            source = "<stdin>"
+            size = None
+            result = validate_json_stream(sys.stdin.buffer)
+        elif stream:
+            source = args.file
+            with open(args.file, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                result = validate_json_stream(f)
+        else:
+            content, source = inputs.enter_context(open_input(args))
     except FileNotFoundError:
         print(f"Error: File not found: {args.file}", file=sys.stderr)
         sys.exit(1)
@@ -128,47 +321,56 @@ Examples:
         print(f"Error reading input: {e}", file=sys.stderr)
         sys.exit(1)
 
-    result = validate_json(content)
+    # The input stays open (a large file stays mapped) for the report below
+    with inputs:
+        if content is not None:
+            result = validate_json(content)
 
-    if args.quiet:
-        sys.exit(0 if result["valid"] else 1)
+        if args.quiet:
+            sys.exit(0 if result["valid"] else 1)
 
-    if result["valid"]:
-        print(f"✓ Valid JSON ({source})")
+        if result["valid"]:
+            print(f"✓ Valid JSON ({source})")
 
-        if args.stats and result["stats"]:
-            stats = result["stats"]
-            print(f"\nStructure:")
-            print(f"  Root type: {stats['type']}")
-            if stats["type"] == "dict":
-                print(f"  Keys: {stats.get('keys', 0)}")
-            elif stats["type"] == "list":
-                print(f"  Items: {stats.get('items', 0)}")
-            print(f"  Max depth: {stats.get('max_depth', 0)}")
-            print(f"  Size: {len(content)} chars")
+            if args.stats and result["stats"]:
+                stats = result["stats"]
+                print(f"\nStructure:")
+                print(f"  Root type: {stats['type']}")
+                if stats["type"] == "dict":
+                    print(f"  Keys: {stats.get('keys', 0)}")
+                elif stats["type"] == "list":
+                    print(f"  Items: {stats.get('items', 0)}")
+                print(f"  Max depth: {stats.get('max_depth', 0)}")
+                if content is not None:
+                    print(f"  Size: {char_count(content)} chars")
+                elif size is not None:
+                    print(f"  Size: {size} bytes")
 
-        sys.exit(0)
-    else:
-        print(f"✗ Invalid JSON ({source})")
-        print(f"\nError: {result['error']}")
-
-        if result["error_position"]:
-            pos = result["error_position"]
-            print(f"Location: line {pos['line']}, column {pos['column']}")
-
-            # Show context around error
-            lines = content.split("\n")
-            if 0 < pos["line"] <= len(lines):
-                print(f"\nContext:")
-                line_num = pos["line"]
-                if line_num > 1:
-                    print(f"  {line_num - 1}: {lines[line_num - 2]}")
-                print(f"→ {line_num}: {lines[line_num - 1]}")
-                print(f"  {' ' * (pos['column'] + 2)}^")
-                if line_num < len(lines):
-                    print(f"  {line_num + 1}: {lines[line_num]}")
+            sys.exit(0)
+        else:
+            print(f"✗ Invalid JSON ({source})")
+            print(f"\nError: {result['error']}")
 
-        sys.exit(1)
+            if result["error_position"]:
+                pos = result["error_position"]
+                print(f"Location: line {pos['line']}, column {pos['column']}")
+
+                # Show context around error
+                if not isinstance(content, str):
+                    content = bytes(content)
+                    content = content.decode(json.detect_encoding(content), "replace")
+                lines = content.split("\n")
+                if 0 < pos["line"] <= len(lines):
+                    print(f"\nContext:")
+                    line_num = pos["line"]
+                    if line_num > 1:
+                        print(f"  {line_num - 1}: {lines[line_num - 2]}")
+                    print(f"→ {line_num}: {lines[line_num - 1]}")
+                    print(f"  {' ' * (pos['column'] + 2)}^")
+                    if line_num < len(lines):
+                        print(f"  {line_num + 1}: {lines[line_num]}")
+
+            sys.exit(1)
 
 
 if __name__ == "__main__":
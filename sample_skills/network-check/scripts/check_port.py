@@ -2,8 +2,72 @@
 """Check if a TCP port is open on a host."""
 
 import argparse
+import asyncio
 import socket
 import sys
+import time
+
+# Seconds a resolved address list is reused for further checks of a host
+RESOLVE_TTL = 30.0
+
+# Connection attempts kept in flight by check_ports
+MAX_IN_FLIGHT = 512
+
+_resolve_cache = {}
+
+
+def resolve(host: str) -> list:
+    """Resolve a host to TCP socket addresses, caching for RESOLVE_TTL.
+
+    Covers every address family getaddrinfo returns, so IPv6-only hosts
+    work too. Batch checks of many ports on one host resolve it once.
+
+    Returns:
+        List of (family, type, proto, sockaddr) tuples
+    """
+    now = time.monotonic()
+    cached = _resolve_cache.get(host)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    addresses = [
+        (family, type_, proto, sockaddr)
+        for family, type_, proto, _, sockaddr in socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+    ]
+    _resolve_cache[host] = (now + RESOLVE_TTL, addresses)
+    return addresses
+
+
+def port_result(host: str, port: int, error: Exception | None, timeout: float) -> dict:
+    """Build the result dictionary for a port check.
+
+    Args:
+        host: Hostname or IP address
+        port: Port number checked
+        error: Exception the connection attempt raised, or None if it connected
+        timeout: Connection timeout in seconds
+
+    Returns:
+        Dictionary with check results
+    """
+    if error is None:
+        status, message = "open", None
+    elif isinstance(error, socket.gaierror):
+        status, message = "error", f"Could not resolve hostname: {error}"
+    elif isinstance(error, (socket.timeout, asyncio.TimeoutError)):
+        status, message = "timeout", f"Connection timed out after {timeout} seconds"
+    elif isinstance(error, OSError):
+        status, message = "closed", f"Connection refused or port closed (error code: {error.errno})"
+    else:
+        status, message = "error", str(error)
+
+    return {
+        "success": error is None,
+        "host": host,
+        "port": port,
+        "status": status,
+        "error": message
+    }
 
 
 def check_port(host: str, port: int, timeout: float = 5.0) -> dict:
@@ -18,55 +82,94 @@ def check_port(host: str, port: int, timeout: float = 5.0) -> dict:
         Dictionary with check results
     """
     try:
-        # Create socket
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
-
-        # Attempt connection
-        result = sock.connect_ex((host, port))
-        sock.close()
-
-        if result == 0:
-            return {
-                "success": True,
-                "host": host,
-                "port": port,
-                "status": "open",
-                "error": None
-            }
-        else:
-            return {
-                "success": False,
-                "host": host,
-                "port": port,
-                "status": "closed",
-                "error": f"Connection refused or port closed (error code: {result})"
-            }
+        addresses = resolve(host)
+
+        # Try each resolved address until one accepts, like create_connection
+        error = None
+        for family, type_, proto, sockaddr in addresses:
+            try:
+                with socket.socket(family, type_, proto) as sock:
+                    sock.settimeout(timeout)
+                    sock.connect((sockaddr[0], port) + sockaddr[2:])
+                return port_result(host, port, None, timeout)
+            except OSError as e:
+                error = e
+
+        raise error
 
-    except socket.gaierror as e:
-        return {
-            "success": False,
-            "host": host,
-            "port": port,
-            "status": "error",
-            "error": f"Could not resolve hostname: {e}"
-        }
-    except socket.timeout:
-        return {
-            "success": False,
-            "host": host,
-            "port": port,
-            "status": "timeout",
-            "error": f"Connection timed out after {timeout} seconds"
-        }
     except Exception as e:
-        return {
-            "success": False,
-            "host": host,
-            "port": port,
-            "status": "error",
-            "error": str(e)
-        }
+        return port_result(host, port, e, timeout)
+
+
+async def probe_port(
+    host: str,
+    addresses: list,
+    port: int,
+    timeout: float,
+    limit: asyncio.Semaphore
+) -> dict:
+    """Asynchronously check one port against already resolved addresses."""
+    async with limit:
+        error = None
+        for _, _, _, sockaddr in addresses:
+            try:
+                _, writer = await asyncio.wait_for(
+                    asyncio.open_connection(sockaddr[0], port), timeout
+                )
+                writer.close()
+                await writer.wait_closed()
+                return port_result(host, port, None, timeout)
+            except (OSError, asyncio.TimeoutError) as e:
+                error = e
+        return port_result(host, port, error, timeout)
+
+
+async def _check_ports(host: str, ports: list, timeout: float, concurrency: int) -> list:
+    """Resolve the host once, then probe all ports under a shared semaphore."""
+    addresses = resolve(host)
+    limit = asyncio.Semaphore(concurrency)
+    return await asyncio.gather(
+        *(probe_port(host, addresses, port, timeout, limit) for port in ports)
+    )
+
+
+def check_ports(host: str, ports: list, timeout: float = 5.0, concurrency: int = MAX_IN_FLIGHT) -> list:
+    """Check many TCP ports on a host concurrently.
+
+    The host is resolved once and up to `concurrency` connections are in
+    flight at a time, so a sweep takes roughly `timeout` seconds per batch
+    rather than per port.
+
+    Args:
+        host: Hostname or IP address
+        ports: Port numbers to check
+        timeout: Connection timeout in seconds
+        concurrency: Maximum simultaneous connection attempts
+
+    Returns:
+        List of check result dictionaries, in port order
+    """
+    try:
+        return asyncio.run(_check_ports(host, ports, timeout, concurrency))
+    except socket.gaierror as e:
+        return [port_result(host, port, e, timeout) for port in ports]
+
+
+def parse_ports(spec: str) -> list:
+    """Parse a port list such as "22,80,443" or "1-1024".
+
+    Raises:
+        ValueError: If an entry is malformed or out of range
+    """
+    ports = []
+    for part in spec.split(","):
+        start, sep, end = part.strip().partition("-")
+        first = int(start)
+        last = int(end) if sep else first
+        if not 1 <= first <= last <= 65535:
+            raise ValueError(f"invalid port range '{part.strip()}'")
+        ports.extend(range(first, last + 1))
+    return sorted(set(ports))
 
 
 def get_common_service(port: int) -> str:
@@ -98,6 +201,34 @@ def get_common_service(port: int) -> str:
     return common_ports.get(port, "Unknown")
 
 
+def scan_ports(args) -> None:
+    """Run a multi-port scan for the CLI and exit with its status."""
+    try:
+        ports = parse_ports(args.ports)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(2)
+
+    results = check_ports(args.host, ports, args.timeout)
+
+    print(f"Scanning {args.host} ({len(ports)} port(s))...")
+    print("-" * 40)
+
+    counts = {}
+    for result in results:
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+        if result["success"]:
+            print(f"{result['port']:>5}/tcp  open  {get_common_service(result['port'])}")
+
+    # Resolution failures hit every port alike, so report the cause once
+    if results and counts.get("error") == len(results):
+        print(f"Details: {results[0]['error']}")
+
+    print("-" * 40)
+    print(", ".join(f"{count} {status}" for status, count in sorted(counts.items())))
+    sys.exit(0 if counts.get("open") else 1)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Check if a TCP port is open on a host.",
@@ -107,6 +238,8 @@ Examples:
   %(prog)s google.com 443
   %(prog)s localhost 8080 --timeout 2
   %(prog)s 192.168.1.1 22
+  %(prog)s 192.168.1.1 --ports 1-1024 --timeout 1
+  %(prog)s example.com --ports 22,80,443
 
 Common ports:
   22 - SSH         80 - HTTP       443 - HTTPS
@@ -115,7 +248,11 @@ Common ports:
         """
     )
     parser.add_argument("host", help="Hostname or IP address")
-    parser.add_argument("port", type=int, help="Port number to check (1-65535)")
+    parser.add_argument("port", type=int, nargs="?", help="Port number to check (1-65535)")
+    parser.add_argument(
+        "-p", "--ports",
+        help="Ports to scan concurrently, e.g. 22,80,443 or 1-1024"
+    )
     parser.add_argument(
         "-t", "--timeout",
         type=float,
@@ -125,6 +262,13 @@ Common ports:
 
     args = parser.parse_args()
 
+    if args.ports:
+        scan_ports(args)
+        return
+
+    if args.port is None:
+        parser.error("a port or --ports is required")
+
     # Validate port
     if not 1 <= args.port <= 65535:
         print(f"Error: Port must be between 1 and 65535, got {args.port}")
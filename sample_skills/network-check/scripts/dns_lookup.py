@@ -2,35 +2,71 @@
 """Perform DNS lookups for domain names."""
 
 import argparse
+import asyncio
+import os
+import re
 import socket
 import sys
+import threading
+import time
 
+try:
+    import dns.exception
+    import dns.resolver
+    HAS_DNSPYTHON = True
+except ImportError:
+    HAS_DNSPYTHON = False
 
-def dns_lookup(domain: str, record_type: str = "A") -> dict:
-    """Perform a DNS lookup for a domain.
 
-    Args:
-        domain: Domain name to look up
-        record_type: Type of DNS record (A, AAAA, etc.)
+def env_seconds(name: str, default: float) -> float:
+    """Read a non-negative number of seconds from the environment, or default."""
+    try:
+        value = float(os.environ.get(name, default))
+    except ValueError:
+        return default
+    return value if 0 <= value < float("inf") else default
+
+
+# Seconds to cache answers whose TTL is unknown (DNS_CACHE_TTL overrides)
+DEFAULT_TTL = env_seconds("DNS_CACHE_TTL", 300.0)
+# Seconds to cache "no such name" answers
+NEGATIVE_TTL = 60.0
+CACHE_MAX_ENTRIES = 1024
+
+# getaddrinfo errors meaning the name or record definitely does not exist
+NEGATIVE_ERRNOS = {socket.EAI_NONAME}
+if hasattr(socket, "EAI_NODATA"):
+    NEGATIVE_ERRNOS.add(socket.EAI_NODATA)
+# gethostbyaddr h_errno values for HOST_NOT_FOUND and NO_DATA
+NEGATIVE_HERRNOS = {1, 4}
+TTL_PATTERN = re.compile(r"\bttl\s*=\s*(\d+)")
+# Seconds allowed for an MX/TXT/NS/CNAME/SOA query
+QUERY_TIMEOUT = 10
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def query_records(domain: str, record_type: str) -> tuple[dict, float | None]:
+    """Resolve one record type for a domain without consulting the cache.
 
     Returns:
-        Dictionary with lookup results
+        Tuple of (lookup result, seconds the result may be cached or None
+        if it must not be cached)
     """
-    record_type = record_type.upper()
-
     try:
         if record_type == "A":
             # IPv4 address lookup
             try:
                 results = socket.getaddrinfo(domain, None, socket.AF_INET)
-                addresses = list(set(r[4][0] for r in results))
+                addresses = list(dict.fromkeys(r[4][0] for r in results))
                 return {
                     "success": True,
                     "domain": domain,
                     "type": "A",
                     "records": addresses,
                     "error": None
-                }
+                }, DEFAULT_TTL
             except socket.gaierror as e:
                 return {
                     "success": False,
@@ -38,20 +74,20 @@ def dns_lookup(domain: str, record_type: str = "A") -> dict:
                     "type": "A",
                     "records": [],
                     "error": f"No A records found: {e}"
-                }
+                }, negative_ttl(e)
 
         elif record_type == "AAAA":
             # IPv6 address lookup
             try:
                 results = socket.getaddrinfo(domain, None, socket.AF_INET6)
-                addresses = list(set(r[4][0] for r in results))
+                addresses = list(dict.fromkeys(r[4][0] for r in results))
                 return {
                     "success": True,
                     "domain": domain,
                     "type": "AAAA",
                     "records": addresses,
                     "error": None
-                }
+                }, DEFAULT_TTL
             except socket.gaierror as e:
                 return {
                     "success": False,
@@ -59,10 +95,13 @@ def dns_lookup(domain: str, record_type: str = "A") -> dict:
                     "type": "AAAA",
                     "records": [],
                     "error": f"No AAAA records found: {e}"
-                }
+                }, negative_ttl(e)
+
+        elif record_type in ("MX", "TXT", "NS", "CNAME", "SOA") and HAS_DNSPYTHON:
+            return resolve_records(domain, record_type)
 
         elif record_type in ("MX", "TXT", "NS", "CNAME", "SOA"):
-            # For these record types, we need to use nslookup or dig
+            # Without dnspython, these record types need nslookup or dig
             import subprocess
 
             try:
@@ -71,7 +110,7 @@ def dns_lookup(domain: str, record_type: str = "A") -> dict:
                     ["nslookup", f"-type={record_type}", domain],
                     capture_output=True,
                     text=True,
-                    timeout=10
+                    timeout=QUERY_TIMEOUT
                 )
 
                 if result.returncode == 0:
@@ -81,7 +120,7 @@ def dns_lookup(domain: str, record_type: str = "A") -> dict:
                         "type": record_type,
                         "records": [result.stdout],
                         "error": None
-                    }
+                    }, record_ttl(result.stdout)
                 else:
                     return {
                         "success": False,
@@ -89,15 +128,15 @@ def dns_lookup(domain: str, record_type: str = "A") -> dict:
                         "type": record_type,
                         "records": [],
                         "error": result.stderr or "Lookup failed"
-                    }
+                    }, NEGATIVE_TTL if "NXDOMAIN" in result.stdout else None
             except FileNotFoundError:
                 return {
                     "success": False,
                     "domain": domain,
                     "type": record_type,
                     "records": [],
-                    "error": f"nslookup not found. {record_type} lookups require nslookup or dig command."
-                }
+                    "error": f"nslookup not found. {record_type} lookups require dnspython or the nslookup command."
+                }, None
             except subprocess.TimeoutExpired:
                 return {
                     "success": False,
@@ -105,7 +144,7 @@ def dns_lookup(domain: str, record_type: str = "A") -> dict:
                     "type": record_type,
                     "records": [],
                     "error": "DNS lookup timed out"
-                }
+                }, None
         else:
             return {
                 "success": False,
@@ -113,7 +152,7 @@ def dns_lookup(domain: str, record_type: str = "A") -> dict:
                 "type": record_type,
                 "records": [],
                 "error": f"Unsupported record type: {record_type}. Use A, AAAA, MX, TXT, NS, CNAME, or SOA."
-            }
+            }, None
 
     except Exception as e:
         return {
@@ -122,18 +161,155 @@ def dns_lookup(domain: str, record_type: str = "A") -> dict:
             "type": record_type,
             "records": [],
             "error": str(e)
-        }
+        }, None
 
 
-def reverse_lookup(ip: str) -> dict:
-    """Perform a reverse DNS lookup for an IP address.
+_resolver = None
+_resolver_lock = threading.Lock()
+
+
+def get_resolver():
+    """Return the process-wide dnspython resolver, creating it on first use.
+
+    One resolver is shared by every lookup, including concurrent ones from
+    dns_lookup_many, so resolver configuration is read once per process.
+    """
+    global _resolver
+    if _resolver is None:
+        with _resolver_lock:
+            if _resolver is None:
+                _resolver = dns.resolver.Resolver()
+    return _resolver
+
+
+def resolve_records(domain: str, record_type: str) -> tuple[dict, float | None]:
+    """Resolve a record type in-process with dnspython.
+
+    Returns:
+        Tuple of (lookup result, cache lifetime), as for query_records();
+        the lifetime is the answer's TTL
+    """
+    try:
+        answer = get_resolver().resolve(domain, record_type, lifetime=QUERY_TIMEOUT)
+        return {
+            "success": True,
+            "domain": domain,
+            "type": record_type,
+            "records": [rdata.to_text() for rdata in answer],
+            "error": None
+        }, answer.rrset.ttl
+    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
+        return {
+            "success": False,
+            "domain": domain,
+            "type": record_type,
+            "records": [],
+            "error": f"No {record_type} records found: {e}"
+        }, NEGATIVE_TTL
+    except dns.exception.Timeout:
+        return {
+            "success": False,
+            "domain": domain,
+            "type": record_type,
+            "records": [],
+            "error": "DNS lookup timed out"
+        }, None
+    except dns.exception.DNSException as e:
+        return {
+            "success": False,
+            "domain": domain,
+            "type": record_type,
+            "records": [],
+            "error": str(e) or "Lookup failed"
+        }, None
+
+
+def negative_ttl(error: socket.gaierror) -> float | None:
+    """Cache lifetime for a failed getaddrinfo: only definite "no such name" answers."""
+    if error.errno in NEGATIVE_ERRNOS:
+        return NEGATIVE_TTL
+    return None
+
+
+def record_ttl(output: str) -> float:
+    """Smallest TTL reported in nslookup output, or DEFAULT_TTL if none is shown."""
+    ttls = [int(ttl) for ttl in TTL_PATTERN.findall(output)]
+    return min(ttls) if ttls else DEFAULT_TTL
+
+
+def cached_query(key: tuple, query, *args) -> dict:
+    """Return the cached result for key, or run query(*args) and cache it.
+
+    query returns (result, ttl); results with a ttl of None are not cached.
+    """
+    now = time.monotonic()
+
+    with _cache_lock:
+        entry = _cache.get(key)
+    if entry and entry[0] > now:
+        return entry[1]
+
+    result, ttl = query(*args)
+    if ttl is not None:
+        with _cache_lock:
+            _cache[key] = (now + ttl, result)
+            if len(_cache) > CACHE_MAX_ENTRIES:
+                del _cache[min(_cache, key=lambda k: _cache[k][0])]
+    return result
+
+
+def dns_lookup(domain: str, record_type: str = "A") -> dict:
+    """Perform a DNS lookup for a domain.
+
+    Answers are cached in-process per (domain, record type): positive ones
+    for their TTL (DEFAULT_TTL when none is known), "no such name" answers
+    for NEGATIVE_TTL. Timeouts and other errors are never cached.
 
     Args:
-        ip: IP address to look up
+        domain: Domain name to look up
+        record_type: Type of DNS record (A, AAAA, etc.)
 
     Returns:
         Dictionary with lookup results
     """
+    record_type = record_type.upper()
+    key = (domain.lower().rstrip("."), record_type)
+    result = cached_query(key, query_records, domain, record_type)
+
+    # Callers get their own records list so the cached entry stays intact
+    return {**result, "domain": domain, "records": list(result["records"])}
+
+
+async def _lookup_all(queries: list) -> list:
+    """Run blocking dns_lookup calls for (domain, type) pairs on worker threads."""
+    return await asyncio.gather(
+        *(asyncio.to_thread(dns_lookup, domain, record_type) for domain, record_type in queries)
+    )
+
+
+def dns_lookup_many(domains: list, record_types: list) -> list:
+    """Look up several domains and record types concurrently.
+
+    Each query runs dns_lookup on a worker thread, so the round trips
+    overlap instead of adding up, and the shared answer cache still applies.
+
+    Args:
+        domains: Domain names to look up
+        record_types: Record types to query for every domain
+
+    Returns:
+        List of lookup result dictionaries, ordered by domain then type
+    """
+    queries = [(domain, record_type) for domain in domains for record_type in record_types]
+    return asyncio.run(_lookup_all(queries))
+
+
+def query_ptr(ip: str) -> tuple[dict, float | None]:
+    """Reverse-resolve an IP address without consulting the cache.
+
+    Returns:
+        Tuple of (lookup result, cache lifetime), as for query_records()
+    """
     try:
         hostname, _, _ = socket.gethostbyaddr(ip)
         return {
@@ -141,21 +317,38 @@ def reverse_lookup(ip: str) -> dict:
             "ip": ip,
             "hostname": hostname,
             "error": None
-        }
+        }, DEFAULT_TTL
     except socket.herror as e:
         return {
             "success": False,
             "ip": ip,
             "hostname": None,
             "error": f"Reverse lookup failed: {e}"
-        }
+        }, NEGATIVE_TTL if e.errno in NEGATIVE_HERRNOS else None
     except Exception as e:
         return {
             "success": False,
             "ip": ip,
             "hostname": None,
             "error": str(e)
-        }
+        }, None
+
+
+def reverse_lookup(ip: str) -> dict:
+    """Perform a reverse DNS lookup for an IP address.
+
+    Results share the dns_lookup cache: hostnames are kept for DEFAULT_TTL
+    and addresses without a PTR record for NEGATIVE_TTL, so repeat lookups
+    do not wait out the resolver timeout again.
+
+    Args:
+        ip: IP address to look up
+
+    Returns:
+        Dictionary with lookup results
+    """
+    result = cached_query((ip.lower(), "PTR"), query_ptr, ip)
+    return {**result, "ip": ip}
 
 
 def main():
@@ -211,8 +404,7 @@ Record types:
 
     if args.all:
         # Show both A and AAAA records
-        for rtype in ["A", "AAAA"]:
-            result = dns_lookup(args.domain, rtype)
+        for rtype, result in zip(["A", "AAAA"], dns_lookup_many([args.domain], ["A", "AAAA"])):
             print(f"\n{rtype} Records:")
             if result["success"] and result["records"]:
                 for record in result["records"]:
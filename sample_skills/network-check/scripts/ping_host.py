@@ -2,9 +2,196 @@
 """Ping a host to check network reachability."""
 
 import argparse
+import array
+import asyncio
+import itertools
+import os
 import platform
+import socket
+import struct
 import subprocess
 import sys
+import time
+
+# Upper bound on packets per ping so a single call cannot block for long
+MAX_COUNT = 100
+# Grace period on top of timeout * count before the ping process is killed
+DEADLINE_SLACK = 3
+
+
+# Resolved once: platform.system() can shell out to uname on some systems
+IS_WINDOWS = platform.system().lower() == "windows"
+
+ICMP_ECHO_REPLY = 0
+ICMP_ECHO_REQUEST = 8
+# Payload size and spacing between echo requests, as the ping binary uses
+ICMP_PAYLOAD = bytes(range(56))
+PING_INTERVAL = 1.0
+
+# Identifiers for raw-socket echo requests; datagram sockets get theirs from the kernel
+_identifiers = itertools.count(os.getpid())
+
+
+def icmp_checksum(data: bytes) -> int:
+    """Compute the RFC 1071 internet checksum in native byte order."""
+    if len(data) % 2:
+        data += b"\0"
+    total = sum(array.array("H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def icmp_echo_packet(identifier: int, sequence: int) -> bytes:
+    """Build an ICMP echo request packet."""
+    header = struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, 0, identifier, sequence)
+    checksum = icmp_checksum(header + ICMP_PAYLOAD)
+    return header[:2] + struct.pack("=H", checksum) + header[4:] + ICMP_PAYLOAD
+
+
+def open_icmp_socket() -> tuple:
+    """Open a socket for sending ICMP echo requests.
+
+    Prefers the unprivileged datagram socket (Linux, with the caller's group
+    in net.ipv4.ping_group_range) and falls back to a raw socket, which needs
+    root or CAP_NET_RAW.
+
+    Returns:
+        Tuple of (socket, is_raw)
+
+    Raises:
+        OSError: If neither kind of socket is permitted
+    """
+    try:
+        return socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP), False
+    except OSError:
+        return socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP), True
+
+
+def icmp_ping(sock: socket.socket, is_raw: bool, host: str, address: str,
+              count: int, timeout: int) -> dict:
+    """Send ICMP echo requests over an open socket and collect the replies."""
+    identifier = next(_identifiers) & 0xFFFF
+    lines = [f"PING {host} ({address}): {len(ICMP_PAYLOAD)} data bytes"]
+    rtts = []
+
+    for sequence in range(1, count + 1):
+        if sequence > 1:
+            time.sleep(PING_INTERVAL)
+
+        sent = time.perf_counter()
+        sock.sendto(icmp_echo_packet(identifier, sequence), (address, 0))
+        deadline = sent + timeout
+        rtt = None
+
+        while rtt is None:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            sock.settimeout(remaining)
+            try:
+                packet, _ = sock.recvfrom(1024)
+            except socket.timeout:
+                break
+            received = time.perf_counter()
+
+            if packet and packet[0] >> 4 == 4:
+                # Raw sockets, and datagram sockets on macOS/BSD, include the
+                # IPv4 header; an ICMP type byte never has 4 in its high nibble
+                packet = packet[(packet[0] & 0x0F) * 4:]
+            if len(packet) < 8:
+                continue
+            kind, _, _, reply_id, reply_seq = struct.unpack("!BBHHH", packet[:8])
+            if kind != ICMP_ECHO_REPLY or reply_seq != sequence:
+                continue
+            # Raw sockets see every ICMP packet on the host
+            if is_raw and reply_id != identifier:
+                continue
+            rtt = (received - sent) * 1000
+
+        if rtt is None:
+            lines.append(f"Request timeout for icmp_seq {sequence}")
+        else:
+            rtts.append(rtt)
+            lines.append(
+                f"{len(packet)} bytes from {address}: icmp_seq={sequence} time={rtt:.3f} ms"
+            )
+
+    loss = 100 * (count - len(rtts)) / count
+    lines.append("")
+    lines.append(f"--- {host} ping statistics ---")
+    lines.append(
+        f"{count} packets transmitted, {len(rtts)} packets received, {loss:.1f}% packet loss"
+    )
+    if rtts:
+        lines.append(
+            f"round-trip min/avg/max = "
+            f"{min(rtts):.3f}/{sum(rtts) / len(rtts):.3f}/{max(rtts):.3f} ms"
+        )
+
+    return {
+        "success": bool(rtts),
+        "host": host,
+        "output": "\n".join(lines) + "\n",
+        "error": None if rtts else f"No echo reply from {host}",
+        "return_code": 0 if rtts else 1,
+        "rtt_ms": rtts,
+        "packets_sent": count,
+        "packets_received": len(rtts)
+    }
+
+
+def ping_icmp(host: str, count: int, timeout: int):
+    """Ping a host over an ICMP socket.
+
+    Returns:
+        Dictionary with ping results, or None when ICMP sockets are not
+        permitted or the host has no IPv4 address, so the caller can fall
+        back to the ping binary
+    """
+    if IS_WINDOWS:
+        return None
+    try:
+        address = socket.getaddrinfo(host, None, socket.AF_INET)[0][4][0]
+        sock, is_raw = open_icmp_socket()
+    except OSError:
+        return None
+
+    with sock:
+        try:
+            return icmp_ping(sock, is_raw, host, address, count, timeout)
+        except OSError as e:
+            return ping_error(host, str(e))
+
+
+def ping_command(host: str, count: int, timeout: int) -> list:
+    """Build the platform's ping command line."""
+    if IS_WINDOWS:
+        return ["ping", "-n", str(count), "-w", str(timeout * 1000), host]
+    else:  # Linux, macOS
+        return ["ping", "-c", str(count), "-W", str(timeout), host]
+
+
+def ping_result(host: str, returncode: int, stdout: str, stderr: str) -> dict:
+    """Build the result dictionary for a finished ping command."""
+    return {
+        "success": returncode == 0,
+        "host": host,
+        "output": stdout,
+        "error": stderr if returncode != 0 else None,
+        "return_code": returncode
+    }
+
+
+def ping_error(host: str, error: str) -> dict:
+    """Build the result dictionary for a ping that could not complete."""
+    return {
+        "success": False,
+        "host": host,
+        "output": None,
+        "error": error,
+        "return_code": -1
+    }
 
 
 def ping_host(host: str, count: int = 4, timeout: int = 5) -> dict:
@@ -12,59 +199,131 @@ def ping_host(host: str, count: int = 4, timeout: int = 5) -> dict:
 
     Args:
         host: Hostname or IP address to ping
-        count: Number of ping packets to send
+        count: Number of ping packets to send, at least 1 (capped at MAX_COUNT)
         timeout: Timeout in seconds for each ping
 
     Returns:
-        Dictionary with ping results
+        Dictionary with ping results. ICMP socket pings also report
+        rtt_ms, packets_sent and packets_received.
     """
-    # Determine ping command based on OS
-    system = platform.system().lower()
+    if count < 1:
+        return ping_error(host, "Packet count must be at least 1")
+    count = min(count, MAX_COUNT)
+    result = ping_icmp(host, count, timeout)
+    if result is not None:
+        return result
 
-    if system == "windows":
-        cmd = ["ping", "-n", str(count), "-w", str(timeout * 1000), host]
-    else:  # Linux, macOS
-        cmd = ["ping", "-c", str(count), "-W", str(timeout), host]
+    cmd = ping_command(host, count, timeout)
 
     try:
-        result = subprocess.run(
+        with subprocess.Popen(
             cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout * count + 10
-        )
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
+        ) as proc:
+            try:
+                stdout, stderr = proc.communicate(timeout=timeout * count + DEADLINE_SLACK)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                try:
+                    # Drain the pipes, but never wait on a stuck reader
+                    proc.communicate(timeout=1)
+                except subprocess.TimeoutExpired:
+                    pass
+                return ping_error(host, "Ping command timed out")
+        return ping_result(host, proc.returncode, stdout, stderr)
+    except FileNotFoundError:
+        return ping_error(host, "Ping command not found on this system")
+    except Exception as e:
+        return ping_error(host, str(e))
+
+
+async def ping_host_async(host: str, count: int = 4, timeout: int = 5) -> dict:
+    """Ping a host without blocking the event loop.
+
+    Same arguments and result as ping_host(); a ping still running after
+    the overall deadline is killed.
+    """
+    if count < 1:
+        return ping_error(host, "Packet count must be at least 1")
+    count = min(count, MAX_COUNT)
+    result = await asyncio.to_thread(ping_icmp, host, count, timeout)
+    if result is not None:
+        return result
+
+    cmd = ping_command(host, count, timeout)
 
-        return {
-            "success": result.returncode == 0,
-            "host": host,
-            "output": result.stdout,
-            "error": result.stderr if result.returncode != 0 else None,
-            "return_code": result.returncode
-        }
-    except subprocess.TimeoutExpired:
-        return {
-            "success": False,
-            "host": host,
-            "output": None,
-            "error": "Ping command timed out",
-            "return_code": -1
-        }
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
     except FileNotFoundError:
-        return {
-            "success": False,
-            "host": host,
-            "output": None,
-            "error": "Ping command not found on this system",
-            "return_code": -1
-        }
+        return ping_error(host, "Ping command not found on this system")
     except Exception as e:
-        return {
-            "success": False,
-            "host": host,
-            "output": None,
-            "error": str(e),
-            "return_code": -1
-        }
+        return ping_error(host, str(e))
+
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout * count + DEADLINE_SLACK)
+    except asyncio.TimeoutError:
+        proc.kill()
+        try:
+            await asyncio.wait_for(proc.wait(), 1)
+        except asyncio.TimeoutError:
+            pass
+        return ping_error(host, "Ping command timed out")
+
+    return ping_result(
+        host,
+        proc.returncode,
+        stdout.decode(errors="replace"),
+        stderr.decode(errors="replace")
+    )
+
+
+async def _ping_all(hosts: list, count: int, timeout: int) -> list:
+    return await asyncio.gather(*(ping_host_async(host, count, timeout) for host in hosts))
+
+
+def ping_hosts(hosts: list, count: int = 4, timeout: int = 5) -> list:
+    """Ping several hosts concurrently.
+
+    Wall time is that of the slowest host rather than the sum of all.
+
+    Returns:
+        List of ping result dictionaries, in the order of hosts
+    """
+    return asyncio.run(_ping_all(hosts, count, timeout))
+
+
+def print_result(result: dict, quiet: bool) -> None:
+    """Print one ping result in the CLI format."""
+    host = result["host"]
+    if quiet:
+        if result["success"]:
+            print(f"SUCCESS: {host} is reachable")
+        else:
+            print(f"FAILURE: {host} is not reachable")
+            if result["error"]:
+                print(f"Error: {result['error']}")
+        return
+
+    print(f"Pinging {host}...")
+    print("-" * 40)
+
+    if result["success"]:
+        print(result["output"])
+        print("-" * 40)
+        print(f"Result: {host} is REACHABLE")
+    else:
+        if result["output"]:
+            print(result["output"])
+        if result["error"]:
+            print(f"Error: {result['error']}")
+        print("-" * 40)
+        print(f"Result: {host} is NOT REACHABLE")
 
 
 def main():
@@ -76,14 +335,19 @@ Examples:
   %(prog)s google.com
   %(prog)s 8.8.8.8 --count 10
   %(prog)s example.com --timeout 2
+  %(prog)s --hosts 8.8.8.8,1.1.1.1,example.com
         """
     )
-    parser.add_argument("host", help="Hostname or IP address to ping")
+    parser.add_argument("host", nargs="?", help="Hostname or IP address to ping")
+    parser.add_argument(
+        "-H", "--hosts",
+        help="Comma-separated hosts to ping concurrently"
+    )
     parser.add_argument(
         "-c", "--count",
         type=int,
         default=4,
-        help="Number of ping packets to send (default: 4)"
+        help=f"Number of ping packets to send (default: 4, max: {MAX_COUNT})"
     )
     parser.add_argument(
         "-t", "--timeout",
@@ -99,34 +363,25 @@ Examples:
 
     args = parser.parse_args()
 
-    result = ping_host(args.host, args.count, args.timeout)
+    if args.count < 1:
+        parser.error("--count must be at least 1")
 
-    if args.quiet:
-        if result["success"]:
-            print(f"SUCCESS: {args.host} is reachable")
-            sys.exit(0)
-        else:
-            print(f"FAILURE: {args.host} is not reachable")
-            if result["error"]:
-                print(f"Error: {result['error']}")
-            sys.exit(1)
+    if args.hosts:
+        hosts = [host for host in args.hosts.split(",") if host]
+        if args.host:
+            hosts.insert(0, args.host)
+        results = ping_hosts(hosts, args.count, args.timeout)
+    elif args.host:
+        results = [ping_host(args.host, args.count, args.timeout)]
     else:
-        print(f"Pinging {args.host}...")
-        print("-" * 40)
+        parser.error("a host or --hosts is required")
 
-        if result["success"]:
-            print(result["output"])
-            print("-" * 40)
-            print(f"Result: {args.host} is REACHABLE")
-            sys.exit(0)
-        else:
-            if result["output"]:
-                print(result["output"])
-            if result["error"]:
-                print(f"Error: {result['error']}")
-            print("-" * 40)
-            print(f"Result: {args.host} is NOT REACHABLE")
-            sys.exit(1)
+    for i, result in enumerate(results):
+        if i and not args.quiet:
+            print()
+        print_result(result, args.quiet)
+
+    sys.exit(0 if all(result["success"] for result in results) else 1)
 
 
 if __name__ == "__main__":
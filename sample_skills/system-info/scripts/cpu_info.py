@@ -2,9 +2,11 @@
 """Get CPU usage and information."""
 
 import argparse
+import functools
 import json
 import os
 import platform
+import re
 import sys
 import time
 
@@ -15,9 +17,20 @@ try:
 except ImportError:
     HAS_PSUTIL = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Characters json.dumps escapes but orjson writes as-is: anything outside
+# printable ASCII (DEL and non-ASCII), other than indent newlines
+NEEDS_ESCAPE = re.compile(rb"[^\n\x20-\x7e]")
 
+
+@functools.lru_cache(maxsize=1)
 def get_cpu_count() -> dict:
-    """Get CPU count information."""
+    """Get CPU count information (fixed for the process lifetime, so cached)."""
     logical = os.cpu_count() or 1
 
     if HAS_PSUTIL:
@@ -31,45 +44,72 @@ def get_cpu_count() -> dict:
     }
 
 
+# Static fields of the first processor entry in /proc/cpuinfo
+MODEL_PATTERN = re.compile(rb"^model name\s*:\s*(.*?)\s*$", re.MULTILINE)
+CACHE_PATTERN = re.compile(rb"^cache size\s*:\s*(.*?)\s*$", re.MULTILINE)
+
+# Sampling window for CPU usage measurements
+USAGE_INTERVAL = 0.1
+
+
+def read_proc(path: str) -> bytes:
+    """Read a /proc file with raw reads, bypassing the buffered text layer."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+
+def read_cpu_times() -> list:
+    """Read (total, idle) jiffies for the aggregate "cpu" line and each cpuN line of /proc/stat."""
+    times = []
+    # The cpu lines come first
+    for line in read_proc("/proc/stat").split(b"\n"):
+        if not line.startswith(b"cpu"):
+            break
+        values = list(map(int, line.split()[1:]))
+        times.append((sum(values), values[3]))
+    return times
+
+
+def usage_percent(before: tuple, after: tuple) -> float:
+    """Compute busy percentage between two (total, idle) readings."""
+    total_diff = after[0] - before[0]
+    idle_diff = after[1] - before[1]
+    usage = ((total_diff - idle_diff) / total_diff) * 100 if total_diff > 0 else 0
+    return round(usage, 1)
+
+
 def get_cpu_usage() -> dict:
     """Get current CPU usage."""
     if HAS_PSUTIL:
-        # Get overall CPU usage
-        overall = psutil.cpu_percent(interval=0.1)
-
-        # Get per-CPU usage
-        per_cpu = psutil.cpu_percent(interval=0.1, percpu=True)
+        # Overall and per-CPU figures keep separate baselines in psutil, so
+        # reset both, then read both after a single shared sampling window
+        psutil.cpu_percent(interval=None)
+        psutil.cpu_percent(interval=None, percpu=True)
+        time.sleep(USAGE_INTERVAL)
 
         return {
-            "overall": overall,
-            "per_cpu": per_cpu
+            "overall": psutil.cpu_percent(interval=None),
+            "per_cpu": psutil.cpu_percent(interval=None, percpu=True)
         }
     else:
         # Fallback: read from /proc/stat on Linux
         try:
-            with open("/proc/stat", "r") as f:
-                line = f.readline()
-            parts = line.split()
-            total = sum(int(p) for p in parts[1:])
-            idle = int(parts[4])
-
             # Need two readings to calculate usage
-            time.sleep(0.1)
-
-            with open("/proc/stat", "r") as f:
-                line = f.readline()
-            parts = line.split()
-            total2 = sum(int(p) for p in parts[1:])
-            idle2 = int(parts[4])
-
-            total_diff = total2 - total
-            idle_diff = idle2 - idle
+            first = read_cpu_times()
+            time.sleep(USAGE_INTERVAL)
+            second = read_cpu_times()
 
-            usage = ((total_diff - idle_diff) / total_diff) * 100 if total_diff > 0 else 0
+            usage = [usage_percent(a, b) for a, b in zip(first, second)]
 
             return {
-                "overall": round(usage, 1),
-                "per_cpu": None
+                "overall": usage[0],
+                "per_cpu": usage[1:] or None
             }
         except Exception:
             return {
@@ -78,14 +118,38 @@ def get_cpu_usage() -> dict:
             }
 
 
-def get_cpu_info() -> dict:
-    """Get CPU information."""
+@functools.lru_cache(maxsize=1)
+def get_static_cpu_info() -> dict:
+    """Get CPU details that cannot change while the process runs.
+
+    platform.processor() may spawn uname and the model and cache size come
+    from one read of /proc/cpuinfo, so they are looked up once.
+    """
     info = {
         "processor": platform.processor() or "Unknown",
         "architecture": platform.machine(),
         "platform": platform.system()
     }
 
+    # Try to get more info from /proc/cpuinfo on Linux
+    try:
+        cpuinfo = read_proc("/proc/cpuinfo")
+        model = MODEL_PATTERN.search(cpuinfo)
+        if model:
+            info["model"] = model.group(1).decode()
+        cache = CACHE_PATTERN.search(cpuinfo)
+        if cache:
+            info["cache_size"] = cache.group(1).decode()
+    except Exception:
+        pass
+
+    return info
+
+
+def get_cpu_info() -> dict:
+    """Get CPU information."""
+    info = dict(get_static_cpu_info())
+
     if HAS_PSUTIL:
         try:
             freq = psutil.cpu_freq()
@@ -98,15 +162,10 @@ def get_cpu_info() -> dict:
         except Exception:
             pass
 
-    # Try to get more info from /proc/cpuinfo on Linux
-    try:
-        with open("/proc/cpuinfo", "r") as f:
-            for line in f:
-                if line.startswith("model name"):
-                    info["model"] = line.split(":")[1].strip()
-                    break
-    except Exception:
-        pass
+    # Keep the /proc/cpuinfo fields after frequency, matching the uncached key order
+    for key in ("model", "cache_size"):
+        if key in info:
+            info[key] = info.pop(key)
 
     return info
 
@@ -124,6 +183,19 @@ def get_load_average() -> dict:
         return None
 
 
+def dump_json(data) -> str:
+    """Serialize data as indented JSON, with orjson when installed.
+
+    orjson writes DEL and non-ASCII text unescaped, so the stdlib is used
+    whenever that would differ from json.dumps.
+    """
+    if HAS_ORJSON:
+        formatted = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        if not NEEDS_ESCAPE.search(formatted):
+            return formatted.decode()
+    return json.dumps(data, indent=2)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Get CPU usage and information.",
@@ -195,7 +267,7 @@ Examples:
         data = get_all_info()
 
         if args.json:
-            print(json.dumps(data, indent=2))
+            print(dump_json(data))
         else:
             print("CPU Information")
             print("=" * 40)
@@ -203,6 +275,8 @@ Examples:
             info = data["info"]
             print(f"Processor: {info.get('model', info['processor'])}")
             print(f"Architecture: {info['architecture']}")
+            if "cache_size" in info:
+                print(f"Cache: {info['cache_size']}")
 
             if "frequency" in info and info["frequency"]["current"]:
                 freq = info["frequency"]
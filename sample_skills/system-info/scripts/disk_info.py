@@ -4,7 +4,11 @@
 import argparse
 import json
 import os
+import queue
+import re
 import sys
+import threading
+import time
 
 # Try to import psutil for better information
 try:
@@ -13,17 +17,106 @@ try:
 except ImportError:
     HAS_PSUTIL = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Characters json.dumps escapes but orjson writes as-is: anything outside
+# printable ASCII (DEL and non-ASCII), other than indent newlines
+NEEDS_ESCAPE = re.compile(rb"[^\n\x20-\x7e]")
+
+UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+UNIT_SIZES = tuple(1 << (10 * i) for i in range(len(UNITS)))
+
+# Row layouts for the partition table and usage bars
+HUMAN_ROW = "{:<20} {:>10} {:>10} {:>10} {:>6} {}"
+BYTES_ROW = "{:<20} {:<10} {:>15} {:>15} {}"
+BAR_ROW = "{:<15} [{}] {:>5.1f}% of {}"
+
+# Filesystems hidden from the partition list unless --all is given
+VIRTUAL_FSTYPES = frozenset({
+    "proc", "sysfs", "devtmpfs", "devpts", "tmpfs",
+    "securityfs", "cgroup", "cgroup2", "pstore",
+    "debugfs", "tracefs", "hugetlbfs", "mqueue",
+    "fusectl", "configfs", "fuse.gvfsd-fuse"
+})
+SKIP_DEVICE_PREFIXES = ("/dev/loop",)
+
+# Overall deadline and parallelism for querying mounted filesystems
+STAT_TIMEOUT = 2.0
+STAT_WORKERS = 32
+STAT_TIMEOUT_ERROR = "Timed out querying filesystem usage"
+
 
 def format_bytes(bytes_val: int, human: bool = True) -> str:
     """Format bytes in human-readable format."""
     if not human:
         return str(bytes_val)
 
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if bytes_val < 1024:
-            return f"{bytes_val:.1f} {unit}"
-        bytes_val /= 1024
-    return f"{bytes_val:.1f} PB"
+    if bytes_val < 1024:
+        return f"{bytes_val:.1f} B"
+
+    # Each unit spans 10 bits, so the bit length picks it without a loop
+    index = (int(bytes_val).bit_length() - 1) // 10
+    if index >= len(UNITS):
+        index = len(UNITS) - 1
+    return f"{bytes_val / UNIT_SIZES[index]:.1f} {UNITS[index]}"
+
+
+def read_proc(path: str) -> bytes:
+    """Read a /proc file with raw reads, bypassing the buffered text layer."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+
+def stat_mounts(stat, mountpoints: list, timeout: float = STAT_TIMEOUT) -> list:
+    """Call stat(mountpoint) for every mount concurrently.
+
+    A hung mount (e.g. unreachable NFS) only costs its own slot: results
+    still missing at the deadline are reported as None. Daemon threads are
+    used so a stuck call cannot hold up interpreter exit either.
+
+    Returns:
+        List parallel to mountpoints holding the stat result, the raised
+        exception, or None on timeout
+    """
+    count = len(mountpoints)
+    results = [None] * count
+    pending = queue.SimpleQueue()
+    for i in range(count):
+        pending.put(i)
+    finished = threading.Semaphore(0)
+
+    def worker():
+        while True:
+            try:
+                i = pending.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                results[i] = stat(mountpoints[i])
+            except Exception as e:
+                results[i] = e
+            finished.release()
+
+    for _ in range(min(STAT_WORKERS, count)):
+        threading.Thread(target=worker, daemon=True).start()
+
+    deadline = time.monotonic() + timeout
+    for _ in range(count):
+        if not finished.acquire(timeout=max(0, deadline - time.monotonic())):
+            break
+
+    # Copy so late finishers cannot change what the caller sees
+    return list(results)
 
 
 def get_disk_usage(path: str = "/") -> dict:
@@ -54,66 +147,102 @@ def get_partitions_psutil(include_all: bool = False) -> list:
     """Get partition information using psutil."""
     partitions = []
 
-    for part in psutil.disk_partitions(all=include_all):
-        try:
-            usage = psutil.disk_usage(part.mountpoint)
-            partitions.append({
-                "device": part.device,
-                "mountpoint": part.mountpoint,
-                "fstype": part.fstype,
-                "opts": part.opts,
-                "total": usage.total,
-                "used": usage.used,
-                "free": usage.free,
-                "percent": usage.percent
-            })
-        except (PermissionError, OSError):
+    parts = psutil.disk_partitions(all=include_all)
+    usages = stat_mounts(psutil.disk_usage, [part.mountpoint for part in parts])
+
+    for part, usage in zip(parts, usages):
+        if usage is None or isinstance(usage, Exception):
             partitions.append({
                 "device": part.device,
                 "mountpoint": part.mountpoint,
                 "fstype": part.fstype,
                 "opts": part.opts,
-                "error": "Permission denied or inaccessible"
+                "error": STAT_TIMEOUT_ERROR if usage is None else "Permission denied or inaccessible"
             })
+            continue
+        partitions.append({
+            "device": part.device,
+            "mountpoint": part.mountpoint,
+            "fstype": part.fstype,
+            "opts": part.opts,
+            "total": usage.total,
+            "used": usage.used,
+            "free": usage.free,
+            "percent": usage.percent
+        })
 
     return partitions
 
 
 def get_partitions_proc(include_all: bool = False) -> list:
     """Get partition information from /proc/mounts (Linux fallback)."""
-    partitions = []
+    # Mount table columns, filled by parsing before any filesystem is queried
+    devices, mountpoints, fstypes, options = [], [], [], []
 
     try:
-        with open("/proc/mounts", "r") as f:
-            for line in f:
-                parts = line.split()
-                device = parts[0]
-                mountpoint = parts[1]
-                fstype = parts[2]
-                opts = parts[3]
-
-                # Skip virtual filesystems unless include_all
-                if not include_all:
-                    if fstype in ["proc", "sysfs", "devtmpfs", "devpts", "tmpfs",
-                                   "securityfs", "cgroup", "cgroup2", "pstore",
-                                   "debugfs", "tracefs", "hugetlbfs", "mqueue",
-                                   "fusectl", "configfs", "fuse.gvfsd-fuse"]:
-                        continue
-                    if device.startswith("/dev/loop"):
-                        continue
-
-                usage = get_disk_usage(mountpoint)
-                partitions.append({
-                    "device": device,
-                    "mountpoint": mountpoint,
-                    "fstype": fstype,
-                    "opts": opts,
-                    **{k: v for k, v in usage.items() if k != "path"}
-                })
+        for line in os.fsdecode(read_proc("/proc/mounts")).splitlines():
+            parts = line.split()
+            device = parts[0]
+            fstype = parts[2]
+
+            # Skip virtual filesystems unless include_all
+            if not include_all:
+                if fstype in VIRTUAL_FSTYPES or device.startswith(SKIP_DEVICE_PREFIXES):
+                    continue
+
+            devices.append(device)
+            mountpoints.append(parts[1])
+            fstypes.append(fstype)
+            options.append(parts[3])
 
     except Exception as e:
         return [{"error": str(e)}]
 
+    # Usage columns, one statvfs per kept mount
+    count = len(mountpoints)
+    totals = [0] * count
+    useds = [0] * count
+    frees = [0] * count
+    availables = [0] * count
+    errors = [None] * count
+
+    for i, stat in enumerate(stat_mounts(os.statvfs, mountpoints)):
+        if stat is None:
+            errors[i] = STAT_TIMEOUT_ERROR
+            continue
+        if isinstance(stat, Exception):
+            errors[i] = str(stat)
+            continue
+        totals[i] = stat.f_blocks * stat.f_frsize
+        frees[i] = stat.f_bfree * stat.f_frsize
+        availables[i] = stat.f_bavail * stat.f_frsize
+        useds[i] = totals[i] - frees[i]
+
+    partitions = []
+    for device, mountpoint, fstype, opts, total, used, free, available, error in zip(
+        devices, mountpoints, fstypes, options, totals, useds, frees, availables, errors
+    ):
+        if error is not None:
+            partitions.append({
+                "device": device,
+                "mountpoint": mountpoint,
+                "fstype": fstype,
+                "opts": opts,
+                "error": error
+            })
+            continue
+        partitions.append({
+            "device": device,
+            "mountpoint": mountpoint,
+            "fstype": fstype,
+            "opts": opts,
+            "total": total,
+            "used": used,
+            "free": free,
+            "available": available,
+            "percent": round((used / total) * 100, 1) if total > 0 else 0
+        })
+
     return partitions
 
 
@@ -125,6 +254,19 @@ def get_partitions(include_all: bool = False) -> list:
         return get_partitions_proc(include_all)
 
 
+def dump_json(data) -> str:
+    """Serialize data as indented JSON, with orjson when installed.
+
+    orjson writes DEL and non-ASCII text unescaped, so the stdlib is used
+    whenever that would differ from json.dumps.
+    """
+    if HAS_ORJSON:
+        formatted = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        if not NEEDS_ESCAPE.search(formatted):
+            return formatted.decode()
+    return json.dumps(data, indent=2)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Get disk usage and partition information.",
@@ -175,7 +317,7 @@ Examples:
             sys.exit(1)
 
         if args.json:
-            print(json.dumps(data, indent=2))
+            print(dump_json(data))
         else:
             print(f"Disk Usage for {data['path']}")
             print("=" * 40)
@@ -187,29 +329,28 @@ Examples:
         partitions = get_partitions(include_all=args.all)
 
         if args.json:
-            print(json.dumps(partitions, indent=2))
+            print(dump_json(partitions))
             sys.exit(0)
 
-        print("Disk Partitions")
-        print("=" * 80)
+        out = ["Disk Partitions", "=" * 80]
 
         # Header
         if human:
-            print(f"{'Filesystem':<20} {'Size':>10} {'Used':>10} {'Avail':>10} {'Use%':>6} {'Mounted on'}")
+            out.append(HUMAN_ROW.format("Filesystem", "Size", "Used", "Avail", "Use%", "Mounted on"))
         else:
-            print(f"{'Filesystem':<20} {'Type':<10} {'Total':>15} {'Used':>15} {'Mounted on'}")
+            out.append(BYTES_ROW.format("Filesystem", "Type", "Total", "Used", "Mounted on"))
 
-        print("-" * 80)
+        out.append("-" * 80)
 
         for part in partitions:
             if "error" in part and "device" not in part:
-                print(f"Error: {part['error']}")
+                out.append(f"Error: {part['error']}")
                 continue
 
-            device = part["device"][:19] if len(part["device"]) > 19 else part["device"]
+            device = part["device"][:19]
 
             if "error" in part:
-                print(f"{device:<20} {'error':>10} {'':>10} {'':>10} {'':>6} {part['mountpoint']}")
+                out.append(HUMAN_ROW.format(device, "error", "", "", "", part["mountpoint"]))
                 continue
 
             if human:
@@ -217,12 +358,12 @@ Examples:
                 used = format_bytes(part["used"], True)
                 avail = format_bytes(part.get("free", part.get("available", 0)), True)
                 percent = f"{part['percent']:.0f}%"
-                print(f"{device:<20} {total:>10} {used:>10} {avail:>10} {percent:>6} {part['mountpoint']}")
+                out.append(HUMAN_ROW.format(device, total, used, avail, percent, part["mountpoint"]))
             else:
-                print(f"{device:<20} {part['fstype']:<10} {part['total']:>15} {part['used']:>15} {part['mountpoint']}")
+                out.append(BYTES_ROW.format(device, part["fstype"], part["total"], part["used"], part["mountpoint"]))
 
         # Visual summary for main partitions
-        print("\n" + "=" * 80)
+        out.append("\n" + "=" * 80)
         bar_width = 30
 
         for part in partitions:
@@ -234,11 +375,14 @@ Examples:
                 filled = int(bar_width * percent / 100)
                 bar = "█" * filled + "░" * (bar_width - filled)
                 total = format_bytes(part["total"], True)
-                name = part["mountpoint"][:15] if len(part["mountpoint"]) > 15 else part["mountpoint"]
-                print(f"{name:<15} [{bar}] {percent:>5.1f}% of {total}")
+                out.append(BAR_ROW.format(part["mountpoint"][:15], bar, percent, total))
 
         if not HAS_PSUTIL:
-            print("\nNote: Install psutil for more detailed information")
+            out.append("\nNote: Install psutil for more detailed information")
+
+        # One write for the whole report instead of a print() per row
+        out.append("")
+        sys.stdout.write("\n".join(out))
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@
 
 import argparse
 import json
+import os
 import sys
 
 # Try to import psutil for better accuracy
@@ -12,17 +13,29 @@ try:
 except ImportError:
     HAS_PSUTIL = False
 
+# The /proc/meminfo fields the report uses; the rest of the file is skipped
+MEMINFO_KEYS = frozenset({
+    b"MemTotal", b"MemFree", b"MemAvailable", b"Buffers", b"Cached",
+    b"SwapTotal", b"SwapFree"
+})
+
+UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+UNIT_SIZES = tuple(1 << (10 * i) for i in range(len(UNITS)))
+
 
 def format_bytes(bytes_val: int, human: bool = True) -> str:
     """Format bytes in human-readable format."""
     if not human:
         return str(bytes_val)
 
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if bytes_val < 1024:
-            return f"{bytes_val:.1f} {unit}"
-        bytes_val /= 1024
-    return f"{bytes_val:.1f} PB"
+    if bytes_val < 1024:
+        return f"{bytes_val:.1f} B"
+
+    # Each unit spans 10 bits, so the bit length picks it without a loop
+    index = (int(bytes_val).bit_length() - 1) // 10
+    if index >= len(UNITS):
+        index = len(UNITS) - 1
+    return f"{bytes_val / UNIT_SIZES[index]:.1f} {UNITS[index]}"
 
 
 def get_memory_info_psutil() -> dict:
@@ -49,17 +62,28 @@ def get_memory_info_psutil() -> dict:
     }
 
 
+def read_proc(path: str) -> bytes:
+    """Read a /proc file with raw reads, bypassing the buffered text layer."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+
 def get_memory_info_proc() -> dict:
     """Get memory info from /proc/meminfo (Linux fallback)."""
     mem_info = {}
 
     try:
-        with open("/proc/meminfo", "r") as f:
-            for line in f:
-                parts = line.split()
-                key = parts[0].rstrip(":")
-                value = int(parts[1]) * 1024  # Convert KB to bytes
-                mem_info[key] = value
+        for line in read_proc("/proc/meminfo").split(b"\n"):
+            key, _, rest = line.partition(b":")
+            if key not in MEMINFO_KEYS:
+                continue
+            mem_info[key.decode()] = int(rest.split()[0]) * 1024  # Convert KB to bytes
 
         total = mem_info.get("MemTotal", 0)
         free = mem_info.get("MemFree", 0)
@@ -2,9 +2,11 @@
 """List running processes."""
 
 import argparse
+import functools
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Try to import psutil for better information
@@ -14,23 +16,49 @@ try:
 except ImportError:
     HAS_PSUTIL = False
 
+# pwd only exists on Unix, where the /proc fallback runs
+try:
+    import pwd
+    HAS_PWD = True
+except ImportError:
+    HAS_PWD = False
+
+# Threads reading /proc in parallel only pay off with more than one CPU
+SCAN_WORKERS = min(32, os.cpu_count() or 1)
+
+UNITS = ("B", "KB", "MB", "GB", "TB")
+UNIT_SIZES = tuple(1 << (10 * i) for i in range(len(UNITS)))
+
 
 def format_bytes(bytes_val: int) -> str:
     """Format bytes in human-readable format."""
-    for unit in ["B", "KB", "MB", "GB"]:
-        if bytes_val < 1024:
-            return f"{bytes_val:.1f}{unit}"
-        bytes_val /= 1024
-    return f"{bytes_val:.1f}TB"
+    if bytes_val < 1024:
+        return f"{bytes_val:.1f}B"
+
+    # Each unit spans 10 bits, so the bit length picks it without a loop
+    index = (int(bytes_val).bit_length() - 1) // 10
+    if index >= len(UNITS):
+        index = len(UNITS) - 1
+    return f"{bytes_val / UNIT_SIZES[index]:.1f}{UNITS[index]}"
+
 
+def get_processes_psutil(sort_by: str = "pid", top_n: int = None, details: bool = True) -> list:
+    """Get process list using psutil.
 
-def get_processes_psutil(sort_by: str = "pid", top_n: int = None) -> list:
-    """Get process list using psutil."""
+    Command lines and start times are only shown in detailed output and
+    cost extra /proc reads per process, so without details they are not
+    requested (cmdline is left empty and started is None). Start times
+    are returned as Unix timestamps and only formatted for JSON output.
+    """
     processes = []
 
-    for proc in psutil.process_iter(['pid', 'name', 'username', 'cpu_percent',
-                                      'memory_percent', 'memory_info', 'status',
-                                      'create_time', 'cmdline']):
+    # The table columns and sort keys need these for every process
+    attrs = ['pid', 'name', 'username', 'cpu_percent', 'memory_percent',
+             'memory_info', 'status']
+    if details:
+        attrs += ['create_time', 'cmdline']
+
+    for proc in psutil.process_iter(attrs):
         try:
             info = proc.info
             processes.append({
@@ -41,8 +69,8 @@ def get_processes_psutil(sort_by: str = "pid", top_n: int = None) -> list:
                 "memory_percent": round(info["memory_percent"] or 0.0, 1),
                 "memory_bytes": info["memory_info"].rss if info["memory_info"] else 0,
                 "status": info["status"],
-                "started": datetime.fromtimestamp(info["create_time"]).isoformat() if info["create_time"] else None,
-                "cmdline": " ".join(info["cmdline"] or [])[:100]
+                "started": info.get("create_time"),
+                "cmdline": " ".join(info.get("cmdline") or [])[:100]
             })
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
             continue
@@ -65,58 +93,87 @@ def get_processes_psutil(sort_by: str = "pid", top_n: int = None) -> list:
     return processes
 
 
+@functools.lru_cache(maxsize=None)
+def user_name(uid: int) -> str:
+    """Look up the user name for a UID, falling back to the number.
+
+    Cached because getpwuid can be slow with NSS backends such as LDAP.
+    """
+    if HAS_PWD:
+        try:
+            return pwd.getpwuid(uid).pw_name
+        except KeyError:
+            pass
+    return str(uid)
+
+
+def read_proc(path: str) -> bytes:
+    """Read a /proc file with raw reads, bypassing the buffered text layer."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+
+def read_process(entry: os.DirEntry, page_size: int) -> dict:
+    """Read one /proc/PID entry, or return None if it has gone away."""
+    proc_dir = entry.path
+
+    try:
+        # Get command name and state from the one-line stat record;
+        # the name is parenthesised and may itself contain ")", and the
+        # state is the single character after it, so nothing is split
+        stat = read_proc(f"{proc_dir}/stat")
+        name_end = stat.rindex(b")")
+        name = stat[stat.index(b"(") + 1:name_end].decode(errors="replace")
+        state = stat[name_end + 2:name_end + 3].decode()
+
+        # Get memory info: resident pages are the second statm field
+        mem_rss = int(read_proc(f"{proc_dir}/statm").split()[1]) * page_size
+
+        # Get user: /proc/PID is owned by the process's user
+        uid = entry.stat(follow_symlinks=False).st_uid
+        user = user_name(uid)
+
+    except (IOError, PermissionError, ValueError, IndexError):
+        return None
+
+    return {
+        "pid": int(entry.name),
+        "name": name,
+        "user": user,
+        "cpu_percent": 0.0,  # Can't easily calculate without multiple samples
+        "memory_percent": 0.0,
+        "memory_bytes": mem_rss,
+        "status": state,
+        "started": None,
+        "cmdline": ""
+    }
+
+
 def get_processes_proc(sort_by: str = "pid", top_n: int = None) -> list:
     """Get process list from /proc (Linux fallback)."""
-    processes = []
-
     try:
-        for pid_str in os.listdir("/proc"):
-            if not pid_str.isdigit():
-                continue
-
-            pid = int(pid_str)
-            proc_dir = f"/proc/{pid}"
-
-            try:
-                # Get command name
-                with open(f"{proc_dir}/comm", "r") as f:
-                    name = f.read().strip()
-
-                # Get status info
-                with open(f"{proc_dir}/status", "r") as f:
-                    status_info = {}
-                    for line in f:
-                        parts = line.split(":", 1)
-                        if len(parts) == 2:
-                            status_info[parts[0].strip()] = parts[1].strip()
-
-                # Get memory info
-                mem_rss = 0
-                if "VmRSS" in status_info:
-                    mem_rss = int(status_info["VmRSS"].split()[0]) * 1024
-
-                # Get user
-                uid = int(status_info.get("Uid", "0").split()[0])
-                try:
-                    import pwd
-                    user = pwd.getpwuid(uid).pw_name
-                except Exception:
-                    user = str(uid)
-
-                processes.append({
-                    "pid": pid,
-                    "name": name,
-                    "user": user,
-                    "cpu_percent": 0.0,  # Can't easily calculate without multiple samples
-                    "memory_percent": 0.0,
-                    "memory_bytes": mem_rss,
-                    "status": status_info.get("State", "?").split()[0],
-                    "started": None,
-                    "cmdline": ""
-                })
-
-            except (IOError, PermissionError):
-                continue
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        entries = [
+            entry for entry in os.scandir("/proc")
+            if entry.name.isdigit() and entry.is_dir(follow_symlinks=False)
+        ]
+
+        def read(entry):
+            return read_process(entry, page_size)
+
+        if SCAN_WORKERS > 1:
+            with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+                results = list(executor.map(read, entries))
+        else:
+            results = [read(entry) for entry in entries]
+
+        processes = [process for process in results if process is not None]
 
     except Exception as e:
         return [{"error": str(e)}]
@@ -138,10 +195,10 @@ def get_processes_proc(sort_by: str = "pid", top_n: int = None) -> list:
     return processes
 
 
-def get_processes(sort_by: str = "pid", top_n: int = None) -> list:
+def get_processes(sort_by: str = "pid", top_n: int = None, details: bool = True) -> list:
     """Get process list."""
     if HAS_PSUTIL:
-        return get_processes_psutil(sort_by, top_n)
+        return get_processes_psutil(sort_by, top_n, details)
     else:
         return get_processes_proc(sort_by, top_n)
 
@@ -198,7 +255,8 @@ Examples:
 
     args = parser.parse_args()
 
-    processes = get_processes(sort_by=args.sort, top_n=None)
+    # Command lines and start times are only shown in JSON and --long output
+    processes = get_processes(sort_by=args.sort, top_n=None, details=args.json or args.long)
 
     # Check for errors
     if processes and "error" in processes[0]:
@@ -225,6 +283,10 @@ Examples:
         sys.exit(0)
 
     if args.json:
+        # Format start times only for the processes left after filtering
+        for proc in processes:
+            if proc["started"]:
+                proc["started"] = datetime.fromtimestamp(proc["started"]).isoformat()
         print(json.dumps(processes, indent=2))
         sys.exit(0)
 
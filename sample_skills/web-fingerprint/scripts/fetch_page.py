@@ -2,6 +2,7 @@
 """Fetch a web page and extract fingerprinting information."""
 
 import argparse
+import codecs
 import html
 import re
 import ssl
@@ -10,13 +11,121 @@ import urllib.error
 import urllib.request
 from urllib.parse import urlparse
 
+# Common frameworks/CMS signatures, checked in order
+DETECTIONS = [
+    (r"wp-content|wp-includes|wordpress", "WordPress"),
+    (r"Drupal|drupal\.settings", "Drupal"),
+    (r"Joomla", "Joomla"),
+    (r"/sites/default/files|drupal", "Drupal"),
+    (r"laravel|Laravel", "Laravel"),
+    (r"django|csrfmiddlewaretoken", "Django"),
+    (r"express|X-Powered-By: Express", "Express.js"),
+    (r"next\.js|_next/static|__NEXT_DATA__", "Next.js"),
+    (r"react|reactroot|__REACT", "React"),
+    (r"vue\.js|v-app|vue-router", "Vue.js"),
+    (r"angular|ng-version|ng-app", "Angular"),
+    (r"jquery|jQuery", "jQuery"),
+    (r"bootstrap", "Bootstrap"),
+    (r"phpmyadmin|phpMyAdmin", "phpMyAdmin"),
+    (r"tomcat|Apache Tomcat", "Apache Tomcat"),
+    (r"nginx", "nginx"),
+    (r"apache", "Apache"),
+    (r"IIS|Microsoft-IIS", "Microsoft IIS"),
+    (r"cloudflare", "Cloudflare"),
+]
+
+
+def group_detections(detections: list) -> list:
+    """Merge the signatures of each technology into one pattern.
+
+    Lowercased instead of re.IGNORECASE: the text is lowercased once per
+    page, and case-sensitive literal searches are several times faster.
+    Duplicate alternatives are dropped, so each technology costs a single
+    search. The signatures are plain alternations without groups, so
+    splitting on "|" is safe.
+    """
+    grouped = {}
+    for pattern, name in detections:
+        alternatives = grouped.setdefault(name, [])
+        for alternative in pattern.lower().split("|"):
+            if alternative not in alternatives:
+                alternatives.append(alternative)
+    return [(re.compile("|".join(alternatives).encode()), name) for name, alternatives in grouped.items()]
+
+
+TECH_PATTERNS = group_detections(DETECTIONS)
+
+# Markup is matched on the raw body; only captured text is decoded
+TITLE_PATTERN = re.compile(rb"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+GENERATOR_PATTERNS = [
+    re.compile(rb'<meta[^>]+name=["\']generator["\'][^>]+content=["\']([^"\']+)["\']', re.IGNORECASE),
+    re.compile(rb'<meta[^>]+content=["\']([^"\']+)["\'][^>]+name=["\']generator["\']', re.IGNORECASE),
+]
+
+# Script and style blocks (group 1) are dropped from the preview, other tags become a space
+MARKUP_PATTERN = re.compile(
+    rb"(<script[^>]*>.*?</script>|<style[^>]*>.*?</style>)|<[^>]+>",
+    re.DOTALL | re.IGNORECASE
+)
+PREVIEW_LENGTH = 500
+
+# Body bytes read per page; fingerprints and the preview come from the start of the page
+MAX_BODY_BYTES = 65536
+
+# Charsets that encode ASCII as itself and never use ASCII bytes inside a
+# multi-byte character, so markup can be matched on the undecoded body
+ASCII_CHARSETS = ("utf-8", "ascii", "iso8859-", "cp125", "koi8-", "mac-")
+
+
+def body_charset(content_type: str) -> str:
+    """Return the normalised charset from a Content-Type header (default utf-8)."""
+    if "charset=" in content_type:
+        charset = content_type.split("charset=")[-1].split(";")[0].strip()
+        try:
+            return codecs.lookup(charset).name
+        except LookupError:
+            pass
+    return "utf-8"
+
+
+def visible_text(body: bytes, limit: int, charset: str = "utf-8") -> str | None:
+    """Return the first `limit` characters of an HTML page's visible text.
+
+    Markup is removed and whitespace collapsed in a single pass that stops
+    once `limit` non-space characters have been seen, instead of rewriting
+    the whole body once per regex. Only the text between tags that is
+    actually scanned gets decoded.
+    """
+    pieces = []
+    visible = 0
+    pos = 0
+
+    for match in MARKUP_PATTERN.finditer(body):
+        text = body[pos:match.start()].decode(charset, errors="replace")
+        pieces.append(text)
+        pieces.append("" if match.group(1) else " ")
+        pos = match.end()
+        visible += sum(map(len, text.split()))
+        if visible >= limit:
+            break
+    else:
+        pieces.append(body[pos:].decode(charset, errors="replace"))
+
+    clean = " ".join("".join(pieces).split())
+    return clean[:limit] if clean else None
 
-def fetch_page(url: str, timeout: int = 10) -> dict:
+
+def fetch_page(url: str, timeout: int = 10, max_bytes: int = MAX_BODY_BYTES) -> dict:
     """Fetch a web page and extract useful information.
 
+    Only the first max_bytes of the body are downloaded, so the title,
+    generator and technology detection are best-effort for signatures that
+    appear further down very large pages.
+
     Args:
         url: The URL to fetch
         timeout: Request timeout in seconds
+        max_bytes: Maximum body bytes to read (0 reads the whole body)
 
     Returns:
         Dictionary with page information
@@ -57,31 +166,28 @@ def fetch_page(url: str, timeout: int = 10) -> dict:
             for header, value in response.getheaders():
                 result["headers"][header.lower()] = value
 
-            # Read body
-            body = response.read()
-
-            # Try to decode
-            charset = "utf-8"
-            content_type = result["headers"].get("content-type", "")
-            if "charset=" in content_type:
-                charset = content_type.split("charset=")[-1].split(";")[0].strip()
+            # Read body, up to the byte limit
+            body = response.read(max_bytes) if max_bytes > 0 else response.read()
 
-            try:
-                body_text = body.decode(charset, errors="replace")
-            except Exception:
-                body_text = body.decode("utf-8", errors="replace")
+            # Markup is matched on the raw bytes; other charsets (UTF-16,
+            # ISO-2022, ...) are transcoded to UTF-8 first
+            charset = body_charset(result["headers"].get("content-type", ""))
+            if not charset.startswith(ASCII_CHARSETS):
+                body = body.decode(charset, errors="replace").encode()
+                charset = "utf-8"
 
             # Extract title
-            title_match = re.search(r"<title[^>]*>(.*?)</title>", body_text, re.IGNORECASE | re.DOTALL)
+            title_match = TITLE_PATTERN.search(body)
             if title_match:
-                result["title"] = html.unescape(title_match.group(1).strip())[:200]
+                title = title_match.group(1).decode(charset, errors="replace")
+                result["title"] = html.unescape(title.strip())[:200]
 
             # Extract meta generator
-            gen_match = re.search(r'<meta[^>]+name=["\']generator["\'][^>]+content=["\']([^"\']+)["\']', body_text, re.IGNORECASE)
-            if not gen_match:
-                gen_match = re.search(r'<meta[^>]+content=["\']([^"\']+)["\'][^>]+name=["\']generator["\']', body_text, re.IGNORECASE)
-            if gen_match:
-                result["meta_generator"] = gen_match.group(1).strip()
+            for pattern in GENERATOR_PATTERNS:
+                gen_match = pattern.search(body)
+                if gen_match:
+                    result["meta_generator"] = gen_match.group(1).decode(charset, errors="replace").strip()
+                    break
 
             # Detect technologies from headers and body
             technologies = []
@@ -94,44 +200,16 @@ def fetch_page(url: str, timeout: int = 10) -> dict:
             if "x-powered-by" in result["headers"]:
                 technologies.append(f"Powered by: {result['headers']['x-powered-by']}")
 
-            # Common frameworks/CMS detection
-            detections = [
-                (r"wp-content|wp-includes|wordpress", "WordPress"),
-                (r"Drupal|drupal\.settings", "Drupal"),
-                (r"Joomla", "Joomla"),
-                (r"/sites/default/files|drupal", "Drupal"),
-                (r"laravel|Laravel", "Laravel"),
-                (r"django|csrfmiddlewaretoken", "Django"),
-                (r"express|X-Powered-By: Express", "Express.js"),
-                (r"next\.js|_next/static|__NEXT_DATA__", "Next.js"),
-                (r"react|reactroot|__REACT", "React"),
-                (r"vue\.js|v-app|vue-router", "Vue.js"),
-                (r"angular|ng-version|ng-app", "Angular"),
-                (r"jquery|jQuery", "jQuery"),
-                (r"bootstrap", "Bootstrap"),
-                (r"phpmyadmin|phpMyAdmin", "phpMyAdmin"),
-                (r"tomcat|Apache Tomcat", "Apache Tomcat"),
-                (r"nginx", "nginx"),
-                (r"apache", "Apache"),
-                (r"IIS|Microsoft-IIS", "Microsoft IIS"),
-                (r"cloudflare", "Cloudflare"),
-            ]
-
-            check_text = body_text + " " + str(result["headers"])
-            for pattern, name in detections:
-                if re.search(pattern, check_text, re.IGNORECASE):
-                    if name not in technologies:
-                        technologies.append(name)
+            # Common frameworks/CMS detection, matched against lowercased text
+            check_text = body.lower() + b" " + str(result["headers"]).lower().encode(errors="replace")
+            for pattern, name in TECH_PATTERNS:
+                if pattern.search(check_text):
+                    technologies.append(name)
 
             result["technologies"] = technologies
 
             # Body preview (first 500 chars of visible text)
-            # Remove script and style tags
-            clean = re.sub(r"<script[^>]*>.*?</script>", "", body_text, flags=re.DOTALL | re.IGNORECASE)
-            clean = re.sub(r"<style[^>]*>.*?</style>", "", clean, flags=re.DOTALL | re.IGNORECASE)
-            clean = re.sub(r"<[^>]+>", " ", clean)
-            clean = re.sub(r"\s+", " ", clean).strip()
-            result["body_preview"] = clean[:500] if clean else None
+            result["body_preview"] = visible_text(body, PREVIEW_LENGTH, charset)
 
     except urllib.error.HTTPError as e:
         result["status"] = e.code
@@ -182,6 +260,10 @@ def main():
     parser.add_argument("--https", "-s", action="store_true", help="Use HTTPS instead of HTTP")
     parser.add_argument("--timeout", "-t", type=int, default=10, help="Timeout in seconds")
     parser.add_argument("--json", "-j", action="store_true", help="Output as JSON")
+    parser.add_argument(
+        "--max-bytes", type=int, default=MAX_BODY_BYTES,
+        help=f"Maximum body bytes to read (default: {MAX_BODY_BYTES}, 0 for no limit)"
+    )
 
     args = parser.parse_args()
 
@@ -196,7 +278,7 @@ def main():
     elif args.https and not url.startswith("https://"):
         url = url.replace("http://", "https://") if url.startswith("http://") else f"https://{url}"
 
-    result = fetch_page(url, timeout=args.timeout)
+    result = fetch_page(url, timeout=args.timeout, max_bytes=args.max_bytes)
 
     if args.json:
         import json
@@ -2,18 +2,127 @@
 """Extract all links from a web page."""
 
 import argparse
+import asyncio
+import codecs
+import functools
 import re
 import sys
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlsplit
 
 try:
     import requests
     from bs4 import BeautifulSoup
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("Error: Required packages missing. Install with:")
     print("  pip install requests beautifulsoup4")
     sys.exit(1)
 
+# lxml is an optional, much faster C parser used instead of BeautifulSoup
+try:
+    import lxml.html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+ABSOLUTE_PREFIXES = ("http://", "https://")
+
+
+def build_session() -> requests.Session:
+    """Return a Session that pools keep-alive connections and retries transient errors."""
+    # raise_on_status=False hands back the last 5xx response once retries run out
+    retries = Retry(
+        total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504), raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=retries)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared so repeated and concurrent fetches reuse connections per host
+SESSION = build_session()
+
+
+@functools.lru_cache(maxsize=128)
+def compile_filter(filter_pattern: str) -> re.Pattern:
+    """Compile a link filter regex, reusing it across repeated extractions."""
+    return re.compile(filter_pattern)
+
+
+def response_encoding(response) -> str:
+    """Return the encoding to decode a response body with.
+
+    A charset from the Content-Type header is used when Python knows it.
+    Otherwise, including text/* responses without one (which requests
+    assumes are ISO-8859-1), the encoding is detected from the body
+    (apparent_encoding).
+    """
+    if "charset=" in response.headers.get("Content-Type", "").lower() and response.encoding:
+        try:
+            return codecs.lookup(response.encoding).name
+        except LookupError:
+            pass
+    return response.apparent_encoding or "utf-8"
+
+
+def find_links_lxml(html: str, include_images: bool, include_scripts: bool) -> list:
+    """Collect (type, url, text) for links, images and scripts with one lxml XPath query.
+
+    Results are grouped as anchors, then images, then scripts, like
+    find_links_soup().
+    """
+    if not html.strip():
+        return []
+
+    query = "//a[@href]"
+    if include_images:
+        query += " | //img[@src]"
+    if include_scripts:
+        query += " | //script[@src]"
+
+    anchors, images, scripts = [], [], []
+    # Fed to a parser rather than fromstring(), which rejects decoded text
+    # that still carries an <?xml encoding=...?> declaration
+    parser = lxml.html.HTMLParser()
+    parser.feed(html)
+    for node in parser.close().xpath(query):
+        if node.tag == "a":
+            # Same text as BeautifulSoup's get_text(strip=True)
+            text = "".join(part.strip() for part in node.xpath(".//text()"))
+            anchors.append(("link", node.get("href"), text[:100]))
+        elif node.tag == "img":
+            images.append(("image", node.get("src"), node.get("alt", "")[:100]))
+        else:
+            scripts.append(("script", node.get("src"), ""))
+
+    return anchors + images + scripts
+
+
+def find_links_soup(html: str, include_images: bool, include_scripts: bool) -> list:
+    """Collect (type, url, text) for links, images and scripts with BeautifulSoup."""
+    soup = BeautifulSoup(html, "html.parser")
+
+    # Extract anchor links
+    found = [
+        ("link", a["href"], a.get_text(strip=True)[:100])  # Limit text length
+        for a in soup.find_all("a", href=True)
+    ]
+
+    # Extract image sources if requested
+    if include_images:
+        for img in soup.find_all("img", src=True):
+            found.append(("image", img["src"], img.get("alt", "")[:100]))
+
+    # Extract script sources if requested
+    if include_scripts:
+        for script in soup.find_all("script", src=True):
+            found.append(("script", script["src"], ""))
+
+    return found
+
 
 def extract_links(
     url: str,
@@ -21,7 +130,9 @@ def extract_links(
     timeout: int = 30,
     filter_pattern: str = None,
     include_images: bool = False,
-    include_scripts: bool = False
+    include_scripts: bool = False,
+    internal_only: bool = False,
+    external_only: bool = False
 ) -> dict:
     """Extract all links from a web page.
 
@@ -32,78 +143,57 @@ def extract_links(
         filter_pattern: Regex pattern to filter links
         include_images: Include image sources
         include_scripts: Include script sources
+        internal_only: Only keep links to the same domain as url
+        external_only: Only keep links to other domains
 
     Returns:
         Dictionary with extraction results
     """
     try:
-        response = requests.get(
+        # Compiled before fetching so an invalid pattern fails without a request
+        pattern = compile_filter(filter_pattern) if filter_pattern else None
+
+        response = SESSION.get(
             url,
             headers={"User-Agent": "Mozilla/5.0 (compatible; LinkExtractor/1.0)"},
             timeout=timeout
         )
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        links = []
+        if HAS_LXML:
+            # Decoded like response.text, honouring a charset given only in the header
+            html = response.content.decode(response_encoding(response), "replace")
+            found = find_links_lxml(html, include_images, include_scripts)
+        else:
+            found = find_links_soup(response.text, include_images, include_scripts)
 
-        # Extract anchor links
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            text = a.get_text(strip=True)[:100]  # Limit text length
+        base_domain = urlsplit(url).netloc
 
-            if absolute:
+        # Resolve, filter and deduplicate (keeping first occurrences) in one pass
+        seen = set()
+        unique_links = []
+        for link_type, href, text in found:
+            # Already-absolute URLs are kept as written rather than re-joined
+            if absolute and not href.startswith(ABSOLUTE_PREFIXES):
                 href = urljoin(url, href)
 
-            links.append({
+            if pattern and not pattern.search(href):
+                continue
+            if href in seen:
+                continue
+            seen.add(href)
+
+            # internal_only wins when both domain filters are set
+            if internal_only or external_only:
+                if (urlsplit(href).netloc == base_domain) != internal_only:
+                    continue
+
+            unique_links.append({
                 "url": href,
                 "text": text,
-                "type": "link"
+                "type": link_type
             })
 
-        # Extract image sources if requested
-        if include_images:
-            for img in soup.find_all("img", src=True):
-                src = img["src"]
-                alt = img.get("alt", "")[:100]
-
-                if absolute:
-                    src = urljoin(url, src)
-
-                links.append({
-                    "url": src,
-                    "text": alt,
-                    "type": "image"
-                })
-
-        # Extract script sources if requested
-        if include_scripts:
-            for script in soup.find_all("script", src=True):
-                src = script["src"]
-
-                if absolute:
-                    src = urljoin(url, src)
-
-                links.append({
-                    "url": src,
-                    "text": "",
-                    "type": "script"
-                })
-
-        # Apply filter if provided
-        if filter_pattern:
-            pattern = re.compile(filter_pattern)
-            links = [l for l in links if pattern.search(l["url"])]
-
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_links = []
-        for link in links:
-            if link["url"] not in seen:
-                seen.add(link["url"])
-                unique_links.append(link)
-
         return {
             "success": True,
             "url": url,
@@ -130,6 +220,29 @@ def extract_links(
         }
 
 
+async def _extract_all(urls: list, options: dict) -> list:
+    """Run blocking extract_links calls for several URLs on worker threads."""
+    return await asyncio.gather(
+        *(asyncio.to_thread(extract_links, url, **options) for url in urls)
+    )
+
+
+def extract_links_many(urls: list, **options) -> list:
+    """Extract links from several pages concurrently.
+
+    Each page is fetched by extract_links on a worker thread, so the
+    requests overlap instead of running one after another.
+
+    Args:
+        urls: URLs to extract links from
+        **options: Keyword arguments passed to extract_links for every URL
+
+    Returns:
+        List of extraction result dictionaries, in the order of urls
+    """
+    return asyncio.run(_extract_all(urls, options))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Extract all links from a web page.",
@@ -141,9 +254,14 @@ Examples:
   %(prog)s https://example.com --filter "\\.pdf$"
   %(prog)s https://example.com --images --scripts
   %(prog)s https://example.com --internal-only
+  %(prog)s https://example.com https://example.org --urls-only
         """
     )
-    parser.add_argument("url", help="URL to extract links from")
+    parser.add_argument(
+        "url",
+        nargs="+",
+        help="URL(s) to extract links from; several are fetched concurrently"
+    )
     parser.add_argument(
         "-a", "--absolute",
         action="store_true",
@@ -193,46 +311,53 @@ Examples:
 
     args = parser.parse_args()
 
-    # Ensure URL has scheme
-    url = args.url
-    if not url.startswith(("http://", "https://")):
-        url = "https://" + url
+    # Ensure URLs have a scheme
+    urls = [
+        url if url.startswith(("http://", "https://")) else "https://" + url
+        for url in args.url
+    ]
 
     absolute = not args.relative
 
-    result = extract_links(
-        url,
+    options = dict(
         absolute=absolute,
         timeout=args.timeout,
         filter_pattern=args.filter,
         include_images=args.images,
-        include_scripts=args.scripts
+        include_scripts=args.scripts,
+        internal_only=args.internal_only,
+        external_only=args.external_only
     )
-
-    if not result["success"]:
-        print(f"Error: {result['error']}", file=sys.stderr)
-        sys.exit(1)
-
-    # Filter by domain if requested
-    links = result["links"]
-    base_domain = urlparse(url).netloc
-
-    if args.internal_only:
-        links = [l for l in links if urlparse(l["url"]).netloc == base_domain]
-    elif args.external_only:
-        links = [l for l in links if urlparse(l["url"]).netloc != base_domain]
-
-    if args.urls_only:
-        for link in links:
-            print(link["url"])
+    if len(urls) == 1:
+        results = [extract_links(urls[0], **options)]
     else:
-        print(f"Found {len(links)} links on {url}")
-        print("-" * 60)
-
-        for link in links:
-            link_type = f"[{link['type']}]" if link["type"] != "link" else ""
-            text = f" - {link['text']}" if link["text"] else ""
-            print(f"{link_type} {link['url']}{text}")
+        results = extract_links_many(urls, **options)
+
+    failed = False
+    for i, result in enumerate(results):
+        if not result["success"]:
+            print(f"Error: {result['error']}", file=sys.stderr)
+            failed = True
+            continue
+
+        links = result["links"]
+
+        if args.urls_only:
+            for link in links:
+                print(link["url"])
+        else:
+            if i:
+                print()
+            print(f"Found {len(links)} links on {result['url']}")
+            print("-" * 60)
+
+            for link in links:
+                link_type = f"[{link['type']}]" if link["type"] != "link" else ""
+                text = f" - {link['text']}" if link["text"] else ""
+                print(f"{link_type} {link['url']}{text}")
+
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -2,15 +2,33 @@
 """Fetch HTML content from a URL."""
 
 import argparse
+import asyncio
 import sys
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("Error: requests package is required. Install with: pip install requests")
     sys.exit(1)
 
 
+def build_session() -> requests.Session:
+    """Return a Session that pools keep-alive connections and retries transient errors."""
+    # raise_on_status=False hands back the last 5xx response once retries run out
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504), raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=retries)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared so repeated and concurrent fetches reuse connections per host
+SESSION = build_session()
+
+
 def fetch_page(
     url: str,
     timeout: int = 30,
@@ -38,7 +56,7 @@ def fetch_page(
         default_headers.update(headers)
 
     try:
-        response = requests.get(
+        response = SESSION.get(
             url,
             headers=default_headers,
             timeout=timeout,
@@ -82,6 +100,29 @@ def fetch_page(
         }
 
 
+async def _fetch_all(urls: list, options: dict) -> list:
+    """Run blocking fetch_page calls for several URLs on worker threads."""
+    return await asyncio.gather(
+        *(asyncio.to_thread(fetch_page, url, **options) for url in urls)
+    )
+
+
+def fetch_page_many(urls: list, **options) -> list:
+    """Fetch several pages concurrently.
+
+    Each page is fetched by fetch_page on a worker thread, so the requests
+    overlap instead of running one after another.
+
+    Args:
+        urls: URLs to fetch
+        **options: Keyword arguments passed to fetch_page for every URL
+
+    Returns:
+        List of fetch result dictionaries, in the order of urls
+    """
+    return asyncio.run(_fetch_all(urls, options))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Fetch HTML content from a URL.",
@@ -92,12 +133,13 @@ Examples:
   %(prog)s https://example.com --output page.html
   %(prog)s https://example.com --timeout 60
   %(prog)s https://example.com --user-agent "MyBot/1.0"
+  %(prog)s https://example.com https://example.org --headers-only
         """
     )
-    parser.add_argument("url", help="URL to fetch")
+    parser.add_argument("url", nargs="+", help="URL(s) to fetch; several are fetched concurrently")
     parser.add_argument(
         "-o", "--output",
-        help="Save content to file instead of stdout"
+        help="Save content to file instead of stdout (single URL only)"
     )
     parser.add_argument(
         "-t", "--timeout",
@@ -122,38 +164,48 @@ Examples:
 
     args = parser.parse_args()
 
-    # Ensure URL has scheme
-    url = args.url
-    if not url.startswith(("http://", "https://")):
-        url = "https://" + url
+    # Ensure URLs have a scheme
+    urls = [url if url.startswith(("http://", "https://")) else "https://" + url for url in args.url]
 
-    result = fetch_page(url, args.timeout, args.user_agent)
+    if args.output and len(urls) > 1:
+        parser.error("--output can only be used with a single URL")
 
-    if not result["success"]:
-        print(f"Error: {result['error']}", file=sys.stderr)
-        sys.exit(1)
+    if len(urls) == 1:
+        results = [fetch_page(urls[0], args.timeout, args.user_agent)]
+    else:
+        results = fetch_page_many(urls, timeout=args.timeout, user_agent=args.user_agent)
+
+    failed = False
+    for result in results:
+        if not result["success"]:
+            print(f"Error: {result['error']}", file=sys.stderr)
+            failed = True
+            continue
 
-    if not args.quiet:
-        print(f"URL: {result['url']}", file=sys.stderr)
-        if result["final_url"] != result["url"]:
-            print(f"Redirected to: {result['final_url']}", file=sys.stderr)
-        print(f"Status: {result['status_code']}", file=sys.stderr)
-        print(f"Encoding: {result['encoding']}", file=sys.stderr)
-        print(f"Content length: {len(result['content'])} chars", file=sys.stderr)
-        print("-" * 40, file=sys.stderr)
-
-    if args.headers_only:
-        for key, value in result["headers"].items():
-            print(f"{key}: {value}")
-        sys.exit(0)
-
-    if args.output:
-        with open(args.output, "w", encoding="utf-8") as f:
-            f.write(result["content"])
         if not args.quiet:
-            print(f"Content saved to: {args.output}", file=sys.stderr)
-    else:
-        print(result["content"])
+            print(f"URL: {result['url']}", file=sys.stderr)
+            if result["final_url"] != result["url"]:
+                print(f"Redirected to: {result['final_url']}", file=sys.stderr)
+            print(f"Status: {result['status_code']}", file=sys.stderr)
+            print(f"Encoding: {result['encoding']}", file=sys.stderr)
+            print(f"Content length: {len(result['content'])} chars", file=sys.stderr)
+            print("-" * 40, file=sys.stderr)
+
+        if args.headers_only:
+            for key, value in result["headers"].items():
+                print(f"{key}: {value}")
+            continue
+
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                f.write(result["content"])
+            if not args.quiet:
+                print(f"Content saved to: {args.output}", file=sys.stderr)
+        else:
+            print(result["content"])
+
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
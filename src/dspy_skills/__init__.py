@@ -26,30 +26,69 @@ For more control, use SkillsConfig:
     >>> agent = SkillsReActAgent(signature="request -> response", config=config)
 """
 
-from .agent import SkillsReActAgent, create_skill_tools
-from .config import (
-    PromptConfig,
-    ScriptConfig,
-    SecurityConfig,
-    SkillsConfig,
-    ValidationConfig,
-)
-from .errors import (
-    ConfigurationError,
-    ExecutionError,
-    ParseError,
-    ResourceNotFoundError,
-    SecurityError,
-    SkillError,
-    SkillNotFoundError,
-    ValidationError,
-)
-from .manager import SkillManager
-from .models import LoadedSkill, SkillState
-from .parser import find_skill_md, parse_frontmatter, read_instructions, read_skill
-from .prompt import build_skills_aware_instructions, generate_skills_prompt_block
-from .security import ExecutionResult, ScriptExecutor
-from .validator import is_valid_skill, validate, validate_metadata
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .agent import SkillsReActAgent, create_skill_tools
+    from .config import (
+        PromptConfig,
+        ScriptConfig,
+        SecurityConfig,
+        SkillsConfig,
+        ValidationConfig,
+    )
+    from .errors import (
+        ConfigurationError,
+        ExecutionError,
+        ParseError,
+        ResourceNotFoundError,
+        SecurityError,
+        SkillError,
+        SkillNotFoundError,
+        ValidationError,
+    )
+    from .manager import SkillManager
+    from .models import LoadedSkill, SkillState
+    from .parser import find_skill_md, parse_frontmatter, read_instructions, read_skill
+    from .prompt import build_skills_aware_instructions, generate_skills_prompt_block
+    from .security import ExecutionResult, ScriptExecutor
+    from .validator import is_valid_skill, validate, validate_metadata
+
+# Public names and the submodule defining each. They are imported on first
+# access (PEP 562), so importing the package does not pull in dspy until the
+# agent or tools are actually used.
+_LAZY_IMPORTS = {
+    "SkillsReActAgent": ".agent",
+    "create_skill_tools": ".agent",
+    "PromptConfig": ".config",
+    "ScriptConfig": ".config",
+    "SecurityConfig": ".config",
+    "SkillsConfig": ".config",
+    "ValidationConfig": ".config",
+    "ConfigurationError": ".errors",
+    "ExecutionError": ".errors",
+    "ParseError": ".errors",
+    "ResourceNotFoundError": ".errors",
+    "SecurityError": ".errors",
+    "SkillError": ".errors",
+    "SkillNotFoundError": ".errors",
+    "ValidationError": ".errors",
+    "SkillManager": ".manager",
+    "LoadedSkill": ".models",
+    "SkillState": ".models",
+    "find_skill_md": ".parser",
+    "parse_frontmatter": ".parser",
+    "read_instructions": ".parser",
+    "read_skill": ".parser",
+    "build_skills_aware_instructions": ".prompt",
+    "generate_skills_prompt_block": ".prompt",
+    "ExecutionResult": ".security",
+    "ScriptExecutor": ".security",
+    "is_valid_skill": ".validator",
+    "validate": ".validator",
+    "validate_metadata": ".validator",
+}
 
 __version__ = "0.1.0"
 
@@ -90,3 +129,19 @@ __all__ = [
     "SecurityError",
     "ConfigurationError",
 ]
+
+
+def __getattr__(name: str):
+    """Import a public name from its submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily imported public names alongside the loaded ones."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,8 +1,9 @@
 """SkillsReActAgent - DSPy ReAct agent with integrated skill support."""
 
-import re
+import functools
+import inspect
 from pathlib import Path
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, Iterator, Optional, Union
 
 import dspy
 
@@ -17,6 +18,40 @@ from .tools import (
     create_run_script_tool,
 )
 
+# Synchronous token streaming (StreamListener, streamify(async_streaming=...))
+# only exists in newer DSPy releases; older ones run the agent in one piece
+_HAS_SYNC_STREAMING = (
+    hasattr(dspy, "streamify")
+    and hasattr(getattr(dspy, "streaming", None), "StreamListener")
+    and "async_streaming" in inspect.signature(dspy.streamify).parameters
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _enhanced_signature_class(
+    signature: type[dspy.Signature], instructions: str
+) -> type[dspy.Signature]:
+    """Create a subclass of signature carrying skill-aware instructions.
+
+    Cached so agents built from the same signature and skill set share one
+    class instead of materializing a new signature class each time.
+
+    Args:
+        signature: Original class-based DSPy signature
+        instructions: Enhanced instructions for the subclass docstring
+
+    Returns:
+        The enhanced signature class
+    """
+
+    class EnhancedSignature(signature):
+        pass
+
+    EnhancedSignature.__doc__ = instructions
+    EnhancedSignature.__name__ = f"SkillsEnhanced{signature.__name__}"
+
+    return EnhancedSignature
+
 
 def create_skill_tools(
     manager: SkillManager,
@@ -194,21 +229,8 @@ class SkillsReActAgent:
             original_instructions, self.manager
         )
 
-        # Create a new signature class with enhanced instructions
-        class EnhancedSignature(signature):
-            pass
-
-        EnhancedSignature.__doc__ = enhanced_instructions
-        EnhancedSignature.__name__ = f"SkillsEnhanced{signature.__name__}"
-
-        return EnhancedSignature
-
-    def _any_skill_needs_bash(self) -> bool:
-        """Check if any skill declares Bash in allowed-tools."""
-        return any(
-            skill.allowed_tools and "Bash(" in skill.allowed_tools
-            for skill in self.manager.list_skills()
-        )
+        # Reuse the signature class built for identical instructions
+        return _enhanced_signature_class(signature, enhanced_instructions)
 
     def _create_bash_tool(self) -> Optional[dspy.Tool]:
         """Create a bash tool scoped to the active skill's allowed-tools.
@@ -222,12 +244,9 @@ class SkillsReActAgent:
         Returns:
             A dspy.Tool for bash execution, or None if no skill needs it
         """
-        if not self._any_skill_needs_bash():
+        if not self.manager.any_skill_needs_bash:
             return None
 
-        # Pattern to extract command prefixes from Bash(command:*)
-        bash_pattern = re.compile(r"Bash\(([^:]+):\*\)")
-
         # Capture references for closure
         manager = self.manager
         executor = self.executor
@@ -242,8 +261,8 @@ class SkillsReActAgent:
             if not active_skill.allowed_tools:
                 return f"Error: Skill '{active_skill.name}' does not declare any allowed-tools."
 
-            # Parse allowed commands from active skill only
-            allowed_commands = set(bash_pattern.findall(active_skill.allowed_tools))
+            # Allowed commands come from the active skill only
+            allowed_commands = active_skill.allowed_commands
             if not allowed_commands:
                 return f"Error: Skill '{active_skill.name}' does not allow any bash commands."
 
@@ -284,6 +303,40 @@ class SkillsReActAgent:
         """
         return self.react(**kwargs)
 
+    def stream(self, **kwargs: Any) -> Iterator[Union[str, dspy.Prediction]]:
+        """Run the agent, yielding output text as the LM produces it.
+
+        Output fields are streamed through dspy.streamify, so callers can
+        print the final answer token by token instead of waiting for the
+        whole ReAct loop to return. DSPy versions without synchronous
+        streaming yield only the final prediction.
+
+        Args:
+            **kwargs: Arguments matching the signature's input fields
+
+        Yields:
+            Text chunks of the output fields, then the final dspy.Prediction
+        """
+        if not _HAS_SYNC_STREAMING:
+            yield self(**kwargs)
+            return
+
+        listeners = [
+            dspy.streaming.StreamListener(signature_field_name=name)
+            for name in self.react.signature.output_fields
+        ]
+        streaming_react = dspy.streamify(
+            self.react,
+            stream_listeners=listeners,
+            async_streaming=False,
+        )
+
+        for chunk in streaming_react(**kwargs):
+            if isinstance(chunk, dspy.streaming.StreamResponse):
+                yield chunk.chunk
+            elif isinstance(chunk, dspy.Prediction):
+                yield chunk
+
     @property
     def discovered_skills(self) -> list[str]:
         """Get the list of discovered skill names."""
@@ -1,5 +1,7 @@
 """Configuration schema and loading for dspy-skills."""
 
+import functools
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -7,6 +9,35 @@ import yaml
 
 from .errors import ConfigurationError
 
+# libyaml-backed loader and dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+    from yaml import SafeLoader as _Loader
+
+
+@functools.lru_cache(maxsize=8)
+def _default_dirs(home: str, cwd: str) -> tuple[Path, ...]:
+    """Resolve the default skill directories for a home and working directory.
+
+    resolve() stats every path component, so repeated default() calls reuse
+    earlier results. Home and cwd key the cache so changing either (e.g.
+    HOME in tests, or chdir) resolves afresh.
+
+    Args:
+        home: Expanded home directory
+        cwd: Current working directory
+
+    Returns:
+        Tuple of resolved default skill directories
+    """
+    return (
+        Path(home, ".skills").resolve(),
+        Path(cwd, "skills").resolve(),
+    )
+
 
 @dataclass
 class ScriptConfig:
@@ -91,7 +122,7 @@ class SkillsConfig:
 
         try:
             with open(path) as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_Loader)
         except yaml.YAMLError as e:
             raise ConfigurationError(f"Invalid YAML in configuration file: {e}")
 
@@ -150,12 +181,8 @@ class SkillsConfig:
         Returns:
             SkillsConfig with default settings
         """
-        return cls(
-            skill_directories=[
-                Path("~/.skills").expanduser().resolve(),
-                Path("./skills").resolve(),
-            ]
-        )
+        home = os.path.expanduser("~")
+        return cls(skill_directories=list(_default_dirs(home, os.getcwd())))
 
     def to_dict(self) -> dict:
         """Convert configuration to a dictionary.
@@ -194,4 +221,6 @@ class SkillsConfig:
             path: Path to save the configuration
         """
         with open(path, "w") as f:
-            yaml.dump(self.to_dict(), f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                self.to_dict(), f, Dumper=_Dumper, default_flow_style=False, sort_keys=False
+            )
@@ -43,6 +43,7 @@ class SkillManager:
         self._skill_dirs = [Path(d).expanduser().resolve() for d in skill_dirs]
         self._validate_on_load = validate_on_load
         self._skills: dict[str, LoadedSkill] = {}
+        self._skills_with_bash: set[str] = set()
         self._active_skill: Optional[str] = None
 
     def discover(self) -> list[str]:
@@ -54,6 +55,7 @@ class SkillManager:
             List of discovered skill names
         """
         self._skills.clear()
+        self._skills_with_bash.clear()
         discovered = []
 
         for skill_dir in self._skill_dirs:
@@ -95,6 +97,8 @@ class SkillManager:
                         )
                         continue
                     self._skills[skill.name] = skill
+                    if skill.allowed_tools and "Bash(" in skill.allowed_tools:
+                        self._skills_with_bash.add(skill.name)
                     discovered.append(skill.name)
                 except Exception as e:
                     logger.warning(f"Failed to load skill from {subdir}: {e}")
@@ -111,6 +115,11 @@ class SkillManager:
         """
         return list(self._skills.values())
 
+    @property
+    def any_skill_needs_bash(self) -> bool:
+        """Whether any discovered skill declares Bash(...) in allowed-tools."""
+        return bool(self._skills_with_bash)
+
     def get_skill(self, name: str) -> Optional[LoadedSkill]:
         """Get a skill by name.
 
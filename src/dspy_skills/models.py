@@ -1,10 +1,21 @@
 """Data models for dspy-skills."""
 
+import functools
+import re
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Optional
 
+# Command prefixes granted by allowed-tools entries such as Bash(nmap:*)
+_BASH_PATTERN = re.compile(r"Bash\(([^:]+):\*\)")
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_allowed_commands(allowed_tools: str) -> frozenset[str]:
+    """Extract the bash command names from an allowed-tools string."""
+    return frozenset(_BASH_PATTERN.findall(allowed_tools))
+
 
 class SkillState(Enum):
     """Represents the loading state of a skill."""
@@ -57,6 +68,13 @@ class LoadedSkill:
         assets = self.path / "assets"
         return assets if assets.is_dir() else None
 
+    @property
+    def allowed_commands(self) -> frozenset[str]:
+        """Return the bash commands granted by allowed-tools, e.g. Bash(nmap:*)."""
+        if not self.allowed_tools:
+            return frozenset()
+        return _parse_allowed_commands(self.allowed_tools)
+
     def has_scripts(self) -> bool:
         """Check if the skill has a scripts directory."""
         return self.scripts_dir is not None
@@ -0,0 +1,51 @@
+"""Tests for SkillsReActAgent that run against a dummy LM."""
+
+from pathlib import Path
+
+import dspy
+import pytest
+from dspy.utils.dummies import DummyLM
+
+from dspy_skills import SkillsConfig, SkillsReActAgent
+from dspy_skills import agent as agent_module
+
+
+@pytest.fixture
+def dummy_lm():
+    """A DummyLM that finishes the ReAct loop at once and answers 'hello there'."""
+    lm = DummyLM([
+        {"next_thought": "done", "next_tool_name": "finish", "next_tool_args": {}},
+        {"reasoning": "nothing to do", "response": "hello there"},
+    ])
+    with dspy.context(lm=lm):
+        yield lm
+
+
+@pytest.fixture
+def agent(tmp_path: Path, dummy_lm) -> SkillsReActAgent:
+    """An agent with no skills."""
+    return SkillsReActAgent(
+        signature="request: str -> response: str",
+        config=SkillsConfig(skill_directories=[tmp_path]),
+    )
+
+
+class TestStream:
+    """Test SkillsReActAgent.stream()."""
+
+    def test_ends_with_prediction(self, agent: SkillsReActAgent):
+        """Text chunks, if any, are followed by the final prediction."""
+        chunks = list(agent.stream(request="hi"))
+
+        assert all(isinstance(chunk, str) for chunk in chunks[:-1])
+        assert isinstance(chunks[-1], dspy.Prediction)
+        assert chunks[-1].response == "hello there"
+
+    def test_without_sync_streaming(self, agent: SkillsReActAgent, monkeypatch):
+        """DSPy versions without synchronous streaming yield only the prediction."""
+        monkeypatch.setattr(agent_module, "_HAS_SYNC_STREAMING", False)
+        monkeypatch.delattr(dspy, "streamify")
+        chunks = list(agent.stream(request="hi"))
+
+        assert len(chunks) == 1
+        assert chunks[0].response == "hello there"
@@ -0,0 +1,34 @@
+"""Tests for SkillsConfig construction."""
+
+from pathlib import Path
+
+from dspy_skills import SkillsConfig
+
+
+class TestDefaultConfig:
+    """Test SkillsConfig.default() directory resolution."""
+
+    def test_follows_home_changes(self, tmp_path: Path, monkeypatch):
+        """A changed HOME is picked up by later default() calls."""
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+
+        monkeypatch.setenv("HOME", str(first))
+        assert SkillsConfig.default().skill_directories[0] == first.resolve() / ".skills"
+
+        monkeypatch.setenv("HOME", str(second))
+        assert SkillsConfig.default().skill_directories[0] == second.resolve() / ".skills"
+
+    def test_follows_working_directory(self, tmp_path: Path, monkeypatch):
+        """./skills resolves against the current working directory."""
+        monkeypatch.chdir(tmp_path)
+        assert SkillsConfig.default().skill_directories[1] == tmp_path.resolve() / "skills"
+
+    def test_returns_independent_lists(self):
+        """Mutating one default config does not affect the next."""
+        config = SkillsConfig.default()
+        config.skill_directories.append(Path("/extra"))
+
+        assert Path("/extra") not in SkillsConfig.default().skill_directories
@@ -0,0 +1,175 @@
+"""Regression tests for the file-utils sample skill scripts."""
+
+import difflib
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "sample_skills" / "file-utils" / "scripts"
+
+
+def load_script(name: str):
+    """Import a skill script as a module without running its CLI."""
+    spec = importlib.util.spec_from_file_location(name, SCRIPTS_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+file_stats = load_script("file_stats")
+count_lines = load_script("count_lines")
+compare_files = load_script("compare_files")
+
+
+class TestFileStats:
+    """Test that file_stats reports contents whatever the file's st_size says."""
+
+    def test_empty_file(self, tmp_path: Path):
+        """An empty file has no lines and hashes like empty input."""
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+        result = file_stats.get_file_stats(path, calculate_hash=True)
+
+        assert result["success"]
+        assert result["lines"] == 0
+        assert result["sha256"] == (
+            "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+        )
+
+    def test_text_file(self, tmp_path: Path):
+        """A final line without a trailing newline is still counted."""
+        path = tmp_path / "text.txt"
+        path.write_bytes(b"one\ntwo\nthree")
+        result = file_stats.get_file_stats(path)
+
+        assert result["lines"] == 3
+        assert result["encoding"] == "utf-8"
+        assert not result["is_binary"]
+
+    @pytest.mark.skipif(not Path("/proc/self/status").exists(), reason="requires procfs")
+    def test_proc_file_reporting_zero_size(self):
+        """/proc files report st_size 0 but still have content."""
+        path = Path("/proc/self/status")
+        expected = len(path.read_text().splitlines())
+        result = file_stats.get_file_stats(path)
+
+        assert result["size"] == 0
+        assert result["lines"] == expected
+
+    def test_unreadable_contents_keep_metadata(self, tmp_path: Path, monkeypatch):
+        """A read error leaves out content fields instead of failing."""
+        path = tmp_path / "locked.txt"
+        path.write_text("secret\n")
+
+        def deny(*args, **kwargs):
+            raise PermissionError("denied")
+
+        monkeypatch.setattr(file_stats, "open", deny, raising=False)
+        result = file_stats.get_file_stats(path)
+
+        assert result["success"]
+        assert result["size"] == 7
+        assert "lines" not in result
+
+    def test_unreadable_contents_with_checksum(self, tmp_path: Path, monkeypatch):
+        """A requested checksum that can't be computed is reported as an error."""
+        path = tmp_path / "locked.txt"
+        path.write_text("secret\n")
+
+        def deny(*args, **kwargs):
+            raise PermissionError("denied")
+
+        monkeypatch.setattr(file_stats, "open", deny, raising=False)
+        result = file_stats.get_file_stats(path, calculate_hash=True)
+
+        assert result == {"success": False, "error": "Permission denied"}
+
+
+class TestCountLines:
+    """Test count_lines pattern matching."""
+
+    def test_anchored_match_on_crlf(self, tmp_path: Path):
+        """Patterns anchored at the line end match CRLF lines."""
+        path = tmp_path / "crlf.txt"
+        path.write_bytes(b"first TODO\r\nsecond\r\nTODO later\r\n")
+        result = count_lines.count_lines(path, match_pattern="TODO$")
+
+        assert result["success"]
+        assert result["total"] == 3
+        assert result["counted"] == 1
+
+    @pytest.mark.parametrize("newline", [b"\n", b"\r\n", b"\r"], ids=["lf", "crlf", "cr"])
+    @pytest.mark.parametrize("pattern", [None, "TODO", "TODO$"])
+    def test_line_breaks_agree(self, tmp_path: Path, newline: bytes, pattern: str):
+        """Every counting path splits lines like universal newlines."""
+        path = tmp_path / "mixed.txt"
+        path.write_bytes(newline.join([b"a", b"", b"# note", b"TODO", b"end"]))
+        result = count_lines.count_lines(path, match_pattern=pattern)
+
+        assert result["total"] == 5
+        assert result["blank"] == 1
+        assert result["counted"] == (5 if pattern is None else 1)
+
+
+DIFF_CASES = {
+    "both_empty": ([], []),
+    "first_empty": ([], ["a\n", "b\n"]),
+    "second_empty": (["a\n", "b\n"], []),
+    "identical": (["a\n", "b\n", "c\n"], ["a\n", "b\n", "c\n"]),
+    "no_common_lines": (["a\n", "b\n", "c\n"], ["x\n", "y\n"]),
+    "no_trailing_newline": (["a\n", "b\n", "c"], ["a\n", "b\n", "c\n"]),
+    "one_line_changed": (
+        [f"line {i}\n" for i in range(20)],
+        [f"line {i}\n" if i != 10 else "changed\n" for i in range(20)],
+    ),
+    "separate_hunks": (
+        [f"line {i}\n" for i in range(30)],
+        ["new\n"] + [f"line {i}\n" for i in range(30) if i != 15] + ["end\n"],
+    ),
+}
+
+
+class TestCompareFiles:
+    """Test that the Myers diff emits the same output as difflib."""
+
+    @pytest.mark.parametrize("case", DIFF_CASES)
+    @pytest.mark.parametrize("context", [0, 3])
+    def test_unified_matches_difflib(self, case: str, context: int):
+        """unified_diff output matches difflib.unified_diff."""
+        lines1, lines2 = DIFF_CASES[case]
+        expected = list(difflib.unified_diff(lines1, lines2, "old", "new", n=context))
+
+        assert list(compare_files.unified_diff(lines1, lines2, "old", "new", n=context)) == expected
+
+    @pytest.mark.parametrize("case", DIFF_CASES)
+    @pytest.mark.parametrize("context", [0, 3])
+    def test_context_matches_difflib(self, case: str, context: int):
+        """context_diff output matches difflib.context_diff."""
+        lines1, lines2 = DIFF_CASES[case]
+        expected = list(difflib.context_diff(lines1, lines2, "old", "new", n=context))
+
+        assert list(compare_files.context_diff(lines1, lines2, "old", "new", n=context)) == expected
+
+    def test_byte_lines_are_decoded(self):
+        """Byte lines from read_lines produce the same diff as str lines."""
+        lines1, lines2 = DIFF_CASES["one_line_changed"]
+        encoded1 = [line.encode() for line in lines1]
+        encoded2 = [line.encode() for line in lines2]
+
+        assert list(compare_files.unified_diff(encoded1, encoded2, "old", "new")) == list(
+            difflib.unified_diff(lines1, lines2, "old", "new")
+        )
+
+    def test_compare_text_files(self, tmp_path: Path):
+        """compare_text on files matches the --compat difflib output."""
+        file1 = tmp_path / "old.txt"
+        file2 = tmp_path / "new.txt"
+        file1.write_bytes(b"a\r\nb\r\nc")
+        file2.write_bytes(b"a\nB\nc\n")
+
+        myers = compare_files.compare_text(file1, file2, unified=True)
+        compat = compare_files.compare_text(file1, file2, unified=True, compat=True)
+
+        assert myers["diff"] == compat["diff"]
+        assert (myers["added"], myers["removed"]) == (2, 2)
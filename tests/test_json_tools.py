@@ -0,0 +1,147 @@
+"""Regression tests for the json-tools sample skill scripts."""
+
+import importlib.util
+import json
+import os
+import stat
+from argparse import Namespace
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "sample_skills" / "json-tools" / "scripts"
+
+
+def load_script(name: str):
+    """Import a skill script as a module without running its CLI."""
+    spec = importlib.util.spec_from_file_location(name, SCRIPTS_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+format_json = load_script("format_json")
+query_json = load_script("query_json")
+validate_json = load_script("validate_json")
+
+
+@pytest.fixture
+def cache_home(tmp_path: Path, monkeypatch) -> Path:
+    """Point the parse cache at a temporary directory and cache every file."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(query_json, "CACHE_MIN_SIZE", 0)
+    return tmp_path / "cache" / "json-tools"
+
+
+def write_json(path: Path, data) -> Path:
+    path.write_text(json.dumps(data))
+    return path
+
+
+class TestParseCache:
+    """Test the on-disk parse cache used by query_json and diff_json."""
+
+    def test_hit_skips_parsing(self, tmp_path: Path, cache_home: Path, monkeypatch):
+        """A second load of an unchanged file comes from the cache."""
+        path = write_json(tmp_path / "data.json", {"a": [1, 2, 3]})
+        assert query_json.load_json_file(str(path)) == ({"a": [1, 2, 3]}, True)
+
+        def fail(content):
+            raise AssertionError("parsed again")
+
+        monkeypatch.setattr(query_json, "parse_json", fail)
+        assert query_json.load_json_file(str(path)) == ({"a": [1, 2, 3]}, True)
+
+    def test_changed_file_is_reparsed(self, tmp_path: Path, cache_home: Path):
+        """Rewriting the file invalidates its cached parse."""
+        path = write_json(tmp_path / "data.json", {"a": 1})
+        query_json.load_json_file(str(path))
+
+        write_json(path, {"a": 22})
+        os.utime(path, ns=(0, 0))
+        assert query_json.load_json_file(str(path))[0] == {"a": 22}
+
+    def test_entries_are_private(self, tmp_path: Path, cache_home: Path):
+        """The cache directory and its entries are only accessible to the owner."""
+        path = write_json(tmp_path / "data.json", {"a": 1})
+        query_json.load_json_file(str(path))
+
+        assert stat.S_IMODE(cache_home.stat().st_mode) == 0o700
+        entries = list(cache_home.iterdir())
+        assert len(entries) == 1
+        assert stat.S_IMODE(entries[0].stat().st_mode) == 0o600
+
+    def test_shared_directory_is_not_used(self, tmp_path: Path, cache_home: Path):
+        """A cache directory others can read is neither read from nor written to."""
+        cache_home.mkdir(parents=True)
+        cache_home.chmod(0o755)
+        path = write_json(tmp_path / "data.json", {"a": 1})
+
+        assert query_json.load_json_file(str(path))[0] == {"a": 1}
+        assert list(cache_home.iterdir()) == []
+
+    def test_prune_caps_entries(self, tmp_path: Path, cache_home: Path, monkeypatch):
+        """Only the newest CACHE_MAX_ENTRIES entries are kept."""
+        monkeypatch.setattr(query_json, "CACHE_MAX_ENTRIES", 2)
+        for i in range(4):
+            query_json.load_json_file(str(write_json(tmp_path / f"{i}.json", [i])))
+
+        assert len(list(cache_home.glob("*.marshal"))) == 2
+
+    def test_prune_caps_total_size(self, tmp_path: Path, cache_home: Path, monkeypatch):
+        """Entries beyond CACHE_MAX_BYTES in total are removed."""
+        monkeypatch.setattr(query_json, "CACHE_MAX_BYTES", 1)
+        query_json.load_json_file(str(write_json(tmp_path / "data.json", [1])))
+
+        assert list(cache_home.glob("*.marshal")) == []
+
+    def test_prune_drops_old_entries(self, tmp_path: Path, cache_home: Path):
+        """Entries older than CACHE_MAX_AGE are removed."""
+        query_json.load_json_file(str(write_json(tmp_path / "old.json", [1])))
+        (entry,) = cache_home.glob("*.marshal")
+        os.utime(entry, (0, 0))
+
+        query_json.prune_cache(str(cache_home))
+        assert not entry.exists()
+
+
+class TestDumpJson:
+    """Test that orjson output is only used where it matches json.dumps."""
+
+    @pytest.mark.parametrize("text", ["plain", "caf\u00e9", "del\x7f", "tab\t", "\u2028"])
+    def test_compact_matches_stdlib(self, text: str):
+        """Compact output escapes exactly like json.dumps."""
+        data = {"key": [text, 1.5, None]}
+        expected = json.dumps(data, separators=(",", ":"))
+
+        assert format_json.dump_json(data, round_trips=True) == expected
+        assert query_json.dump_json(data, round_trips=True) == expected
+
+    def test_small_floats_match_stdlib(self):
+        """Floats below 1e-4 keep the stdlib's exponent notation."""
+        content = b'{"a": 1e-05, "b": 0.000025}'
+        data = format_json.parse_json(content)
+        round_trips = format_json.orjson_round_trips(content)
+
+        assert format_json.dump_json(data, round_trips) == json.dumps(data, separators=(",", ":"))
+
+
+class TestOpenInput:
+    """Test the memory-mapped input of format_json and validate_json."""
+
+    @pytest.mark.parametrize("module", [format_json, validate_json], ids=lambda m: m.__name__)
+    def test_mapping_released_on_exit(self, module, tmp_path: Path, monkeypatch):
+        """A mapped file is parsed in place and released when the context exits."""
+        if not module.HAS_ORJSON:
+            pytest.skip("files are only mapped when orjson is installed")
+        monkeypatch.setattr(module, "MMAP_THRESHOLD", 0)
+        path = write_json(tmp_path / "data.json", {"a": [1, 2]})
+        args = Namespace(string=None, file=str(path))
+
+        with module.open_input(args) as (content, source):
+            assert isinstance(content, memoryview)
+            assert module.parse_json(content) == {"a": [1, 2]}
+            assert source == str(path)
+
+        with pytest.raises(ValueError):
+            content.tobytes()